@@ -3,17 +3,18 @@
 import random
 from typing import Optional
 
-from langchain_openai import ChatOpenAI
-
 from core.config import (
-    OPENROUTER_API_KEY,
-    OPENROUTER_BASE_URL,
     DEFAULT_MODEL,
     CORE_THESIS,
     SIGNATURE_PHRASES,
+    LLM_LONG_FORM_TIMEOUT,
+    TARGET_WORDS,
 )
+from core.llm import LLMClient
+from core.output_guard import max_tokens_for, stream_guarded
 from core.prompts import ARTICLE_PROMPT
 from core.knowledge_base import KnowledgeBase
+from agents.long_form import LongFormWriter
 
 
 class ArticleAgent:
@@ -27,15 +28,23 @@ class ArticleAgent:
             knowledge_base: Optional knowledge base for RAG
         """
         self.model = model
+        self.target_words = TARGET_WORDS["Article"]
         self.knowledge_base = knowledge_base or KnowledgeBase()
         
-        # Initialize LLM with OpenRouter
-        self.llm = ChatOpenAI(
+        # Initialize rate-limited LLM client (OpenRouter)
+        self.llm = LLMClient(
             model=model,
-            openai_api_key=OPENROUTER_API_KEY,
-            openai_api_base=OPENROUTER_BASE_URL,
             temperature=0.7,
-            max_tokens=3000
+            max_tokens=max_tokens_for(self.target_words),
+            timeout=LLM_LONG_FORM_TIMEOUT
+        )
+        self.long_form = LongFormWriter(
+            llm=self.llm,
+            knowledge_base=self.knowledge_base,
+            content_type="Article",
+            target_words=self.target_words,
+            min_sections=4,
+            max_sections=6
         )
         
     def generate(
@@ -43,7 +52,8 @@ class ArticleAgent:
         topic: str,
         lens: str,
         objective: str,
-        use_rag: bool = True
+        use_rag: bool = True,
+        parallel_sections: bool = False
     ) -> str:
         """Generate an article.
         
@@ -52,10 +62,21 @@ class ArticleAgent:
             lens: Primary content lens
             objective: Content objective
             use_rag: Whether to use RAG for context
+            parallel_sections: Outline first, then write sections concurrently
+                (much lower wall-clock; falls back to single pass if the
+                outline can't be parsed)
             
         Returns:
             Generated article
         """
+        if parallel_sections:
+            try:
+                return self.long_form.write(topic, lens, objective, use_rag=use_rag)
+            except ValueError as e:
+                print(f"Warning: {e}, falling back to single-pass generation")
+            except Exception as e:
+                raise Exception(f"Error generating article: {e}")
+                
         # Get context from knowledge base if enabled
         context = ""
         if use_rag:
@@ -78,8 +99,6 @@ class ArticleAgent:
         
         # Generate content
         try:
-            response = self.llm.invoke(prompt)
-            content = response.content
-            return content
+            return stream_guarded(self.llm, prompt, self.target_words)
         except Exception as e:
-            raise Exception(f"Error generating article: {e}")
+            raise Exception(f"Error generating article: {e}") from e
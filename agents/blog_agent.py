@@ -1,19 +1,20 @@
 """Blog post generation agent."""
 
-import random
 from typing import Optional
 
-from langchain_openai import ChatOpenAI
-
 from core.config import (
-    OPENROUTER_API_KEY,
-    OPENROUTER_BASE_URL,
     DEFAULT_MODEL,
     CORE_THESIS,
     SIGNATURE_PHRASES,
+    LLM_LONG_FORM_TIMEOUT,
+    TARGET_WORDS,
 )
+from core.llm import LLMClient
+from core.output_guard import max_tokens_for, stream_guarded
 from core.prompts import BLOG_PROMPT
+from core.seeding import get_rng
 from core.knowledge_base import KnowledgeBase
+from agents.long_form import LongFormWriter
 
 
 class BlogAgent:
@@ -27,15 +28,23 @@ class BlogAgent:
             knowledge_base: Optional knowledge base for RAG
         """
         self.model = model
+        self.target_words = TARGET_WORDS["Blog"]
         self.knowledge_base = knowledge_base or KnowledgeBase()
         
-        # Initialize LLM with OpenRouter
-        self.llm = ChatOpenAI(
+        # Initialize rate-limited LLM client (OpenRouter)
+        self.llm = LLMClient(
             model=model,
-            openai_api_key=OPENROUTER_API_KEY,
-            openai_api_base=OPENROUTER_BASE_URL,
             temperature=0.7,
-            max_tokens=2500
+            max_tokens=max_tokens_for(self.target_words),
+            timeout=LLM_LONG_FORM_TIMEOUT
+        )
+        self.long_form = LongFormWriter(
+            llm=self.llm,
+            knowledge_base=self.knowledge_base,
+            content_type="Blog",
+            target_words=self.target_words,
+            min_sections=3,
+            max_sections=4
         )
         
     def generate(
@@ -43,7 +52,8 @@ class BlogAgent:
         topic: str,
         lens: str,
         objective: str,
-        use_rag: bool = True
+        use_rag: bool = True,
+        parallel_sections: bool = False
     ) -> str:
         """Generate a blog post.
         
@@ -52,10 +62,21 @@ class BlogAgent:
             lens: Primary content lens
             objective: Content objective
             use_rag: Whether to use RAG for context
+            parallel_sections: Outline first, then write sections concurrently
+                (much lower wall-clock; falls back to single pass if the
+                outline can't be parsed)
             
         Returns:
             Generated blog post
         """
+        if parallel_sections:
+            try:
+                return self.long_form.write(topic, lens, objective, use_rag=use_rag)
+            except ValueError as e:
+                print(f"Warning: {e}, falling back to single-pass generation")
+            except Exception as e:
+                raise Exception(f"Error generating blog post: {e}")
+                
         # Get context from knowledge base if enabled
         context = ""
         if use_rag:
@@ -68,7 +89,7 @@ class BlogAgent:
             context = "No context available."
             
         # Select random signature phrase
-        signature_phrase = random.choice(SIGNATURE_PHRASES)
+        signature_phrase = get_rng().choice(SIGNATURE_PHRASES)
         
         # Format prompt
         prompt = BLOG_PROMPT.format(
@@ -82,8 +103,6 @@ class BlogAgent:
         
         # Generate content
         try:
-            response = self.llm.invoke(prompt)
-            content = response.content
-            return content
+            return stream_guarded(self.llm, prompt, self.target_words)
         except Exception as e:
-            raise Exception(f"Error generating blog post: {e}")
+            raise Exception(f"Error generating blog post: {e}") from e
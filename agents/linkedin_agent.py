@@ -1,18 +1,19 @@
 """LinkedIn content generation agent."""
 
-import random
-from typing import Dict, Optional
-
-from langchain_openai import ChatOpenAI
+import re
+from typing import Dict, List, Optional, Tuple
 
 from core.config import (
-    OPENROUTER_API_KEY,
-    OPENROUTER_BASE_URL,
     DEFAULT_MODEL,
     CORE_THESIS,
+    MIN_SCORE,
     SIGNATURE_PHRASES,
+    TARGET_WORDS,
 )
-from core.prompts import LINKEDIN_PROMPT
+from core.llm import LLMClient
+from core.output_guard import OutputGuard, max_tokens_for, stream_guarded, word_range
+from core.prompts import LINKEDIN_PROMPT, MULTI_POST_PROMPT, REVISION_PROMPT
+from core.seeding import get_rng
 from core.knowledge_base import KnowledgeBase
 
 
@@ -27,15 +28,21 @@ class LinkedInAgent:
             knowledge_base: Optional knowledge base for RAG
         """
         self.model = model
+        self.target_words = TARGET_WORDS["LinkedIn"]
         self.knowledge_base = knowledge_base or KnowledgeBase()
         
-        # Initialize LLM with OpenRouter
-        self.llm = ChatOpenAI(
+        # Initialize rate-limited LLM client (OpenRouter)
+        self.llm = LLMClient(
             model=model,
-            openai_api_key=OPENROUTER_API_KEY,
-            openai_api_base=OPENROUTER_BASE_URL,
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=max_tokens_for(self.target_words)
+        )
+        # Separate client so revisions show up as their own usage stage
+        self.revision_llm = LLMClient(
+            model=model,
+            temperature=0.5,
+            max_tokens=max_tokens_for(self.target_words),
+            stage="revision"
         )
         
     def generate(
@@ -68,7 +75,7 @@ class LinkedInAgent:
             context = "No context available."
             
         # Select random signature phrase
-        signature_phrase = random.choice(SIGNATURE_PHRASES)
+        signature_phrase = get_rng().choice(SIGNATURE_PHRASES)
         
         # Format prompt
         prompt = LINKEDIN_PROMPT.format(
@@ -82,12 +89,206 @@ class LinkedInAgent:
         
         # Generate content
         try:
-            response = self.llm.invoke(prompt)
-            content = response.content
-            return content
+            return stream_guarded(self.llm, prompt, self.target_words)
+        except Exception as e:
+            raise Exception(f"Error generating LinkedIn post: {e}") from e
+            
+    def generate_many(self, calendar_entries: List[Dict], use_rag: bool = True) -> Dict[int, str]:
+        """Generate several calendar posts in a single call.
+        
+        The thesis, voice rules and knowledge base context are sent once
+        for the whole group instead of once per post. Posts that are missing
+        from the response or clearly out of spec are left out, so callers
+        can fall back to generate() for them.
+        
+        Args:
+            calendar_entries: Calendar entry dicts (with post_number)
+            use_rag: Whether to use RAG for context
+            
+        Returns:
+            Dict mapping post_number to generated post for every post that
+            parsed cleanly
+        """
+        context, sources = self._shared_context(calendar_entries, use_rag)
+        
+        briefs = []
+        for entry in calendar_entries:
+            brief = (
+                f"POST {entry['post_number']}\n"
+                f"Topic: {entry['topic']}\n"
+                f"Primary Lens: {entry['lens']}\n"
+                f"Objective: {entry['objective']}\n"
+                f"Signature phrase: {get_rng().choice(SIGNATURE_PHRASES)}"
+            )
+            if sources.get(entry["post_number"]):
+                brief += f"\nDraw on context: {', '.join(sources[entry['post_number']])}"
+            briefs.append(brief)
+            
+        prompt = MULTI_POST_PROMPT.format(
+            core_thesis=CORE_THESIS,
+            context=context,
+            count=len(calendar_entries),
+            briefs="\n\n".join(briefs)
+        )
+        
+        # Room for every post plus its delimiters
+        llm = LLMClient(
+            model=self.model,
+            temperature=0.7,
+            max_tokens=max_tokens_for(self.target_words) * len(calendar_entries) + 50
+        )
+        try:
+            text = llm.invoke(prompt).content
         except Exception as e:
-            raise Exception(f"Error generating LinkedIn post: {e}")
+            raise Exception(f"Error generating LinkedIn posts: {e}") from e
+            
+        posts = self.split_posts(text)
+        low, _ = word_range(self.target_words)
+        drafts = {}
+        for entry in calendar_entries:
+            post = posts.get(entry["post_number"])
+            if not post:
+                continue
+            # Same limits as streamed generation, plus a floor for truncated posts
+            problem = OutputGuard(self.target_words).feed(post)
+            if problem is None and len(post.split()) >= low // 2:
+                drafts[entry["post_number"]] = post
+        return drafts
+        
+    @staticmethod
+    def split_posts(text: str) -> Dict[int, str]:
+        """Split a multi-post response on its POST delimiters.
+        
+        Tolerates markdown decoration around the delimiters and missing
+        END lines (a post then runs to the next delimiter).
+        
+        Args:
+            text: Raw model response
+            
+        Returns:
+            Dict mapping post number to post text
+        """
+        markers = list(re.finditer(
+            r'^[^\w\n]*=+\s*(END\s+)?POST\s*#?\s*(\d+)\s*=+[^\w\n]*$',
+            text,
+            re.M | re.I
+        ))
+        posts = {}
+        for i, marker in enumerate(markers):
+            if marker.group(1):
+                continue
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+            body = text[marker.end():end].strip()
+            number = int(marker.group(2))
+            if body and number not in posts:
+                posts[number] = body
+        return posts
+        
+    def _shared_context(
+        self,
+        calendar_entries: List[Dict],
+        use_rag: bool
+    ) -> Tuple[str, Dict[int, List[str]]]:
+        """Retrieve context for a group of posts, sending each chunk once.
+        
+        Returns:
+            Tuple of (numbered context block, {post_number: [chunk labels]})
+        """
+        if not use_rag:
+            return "No context available.", {}
             
+        chunks: List[str] = []
+        sources: Dict[int, List[str]] = {}
+        for entry in calendar_entries:
+            query = f"{entry['topic']} {entry['lens']} {entry['objective']}"
+            try:
+                found = self.knowledge_base.search(query, k=3)
+            except Exception as e:
+                print(f"Warning: Could not retrieve context: {e}")
+                found = []
+            labels = []
+            for chunk in found:
+                if chunk not in chunks:
+                    chunks.append(chunk)
+                labels.append(f"C{chunks.index(chunk) + 1}")
+            sources[entry["post_number"]] = labels
+            
+        if not chunks:
+            return "No relevant context found in knowledge base.", sources
+        context = "\n\n".join(f"[C{i + 1}] {chunk}" for i, chunk in enumerate(chunks))
+        return context, sources
+        
+    def revise(
+        self,
+        topic: str,
+        lens: str,
+        objective: str,
+        draft: str,
+        score: float,
+        feedback: str
+    ) -> str:
+        """Rewrite a failed draft to address the validator's feedback.
+        
+        Args:
+            topic: Post topic
+            lens: Primary content lens
+            objective: Content objective
+            draft: Draft that failed validation
+            score: Validator score of the draft
+            feedback: Validator feedback for the draft
+            
+        Returns:
+            Revised LinkedIn post
+        """
+        # Keep whichever signature phrase the draft already uses
+        signature_phrase = next(
+            (phrase for phrase in SIGNATURE_PHRASES if phrase.lower() in draft.lower()),
+            get_rng().choice(SIGNATURE_PHRASES)
+        )
+        
+        prompt = REVISION_PROMPT.format(
+            core_thesis=CORE_THESIS,
+            topic=topic,
+            lens=lens,
+            objective=objective,
+            draft=draft,
+            score=score,
+            min_score=MIN_SCORE,
+            feedback="\n".join(f"- {point}" for point in self.feedback_points(draft, feedback)),
+            signature_phrase=signature_phrase
+        )
+        
+        try:
+            return stream_guarded(self.revision_llm, prompt, self.target_words)
+        except Exception as e:
+            raise Exception(f"Error revising LinkedIn post: {e}") from e
+            
+    def feedback_points(self, draft: str, feedback: str) -> List[str]:
+        """Extract actionable points from validator feedback.
+        
+        Args:
+            draft: Draft the feedback is about
+            feedback: Raw validator feedback
+            
+        Returns:
+            Feedback bullets and penalties, plus an explicit length note
+            when the draft is outside the target range
+        """
+        points = [
+            match.group(1).strip()
+            for match in re.finditer(r'^\s*[-*]\s*(.+)$', feedback, re.M)
+        ]
+        if not points:
+            points = [line.strip() for line in feedback.splitlines() if line.strip()]
+            
+        low, high = word_range(self.target_words)
+        words = len(draft.split())
+        if words < low:
+            points.insert(0, f"Length: {words} words, too short; expand to {low}-{high}")
+        elif words > high:
+            points.insert(0, f"Length: {words} words, too long; cut to {low}-{high}")
+        return points
+        
     def generate_from_calendar(self, calendar_entry: Dict) -> str:
         """Generate post from calendar entry.
         
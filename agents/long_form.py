@@ -0,0 +1,307 @@
+"""Outline-then-parallel-sections generation for long-form agents."""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from core.config import CORE_THESIS, SIGNATURE_PHRASES
+from core.knowledge_base import KnowledgeBase
+from core.llm import LLMClient
+from core.output_guard import word_range
+from core.prompts import OUTLINE_PROMPT, SECTION_PROMPT, TRANSITION_PROMPT
+from core.seeding import get_rng
+from core.usage import submit_with_context
+
+
+class LongFormWriter:
+    """Writes long-form content as an outline plus concurrently written sections.
+
+    Wall-clock time is roughly one short outline call, one section-length
+    call and one short transition call, instead of one completion the
+    length of the whole piece. A failed or truncated section is retried on
+    its own without regenerating the rest.
+    """
+
+    def __init__(
+        self,
+        llm: LLMClient,
+        knowledge_base: KnowledgeBase,
+        content_type: str,
+        target_words: str,
+        min_sections: int,
+        max_sections: int,
+        context_k: int = 2,
+        max_section_retries: int = 2
+    ):
+        """Initialize long-form writer.
+
+        Args:
+            llm: LLM client of the owning agent
+            knowledge_base: Knowledge base for per-section RAG
+            content_type: Content type name used in prompts (Blog, Article)
+            target_words: Target word range for the whole piece, e.g. "1000-2000"
+            min_sections: Minimum number of outline sections
+            max_sections: Maximum number of outline sections
+            context_k: Knowledge base chunks per section
+            max_section_retries: Extra attempts for a failed section
+        """
+        self.llm = llm
+        self.knowledge_base = knowledge_base
+        self.content_type = content_type
+        self.target_words = target_words
+        self.min_sections = min_sections
+        self.max_sections = max_sections
+        self.context_k = context_k
+        self.max_section_retries = max_section_retries
+
+        low, high = word_range(target_words)
+        self.total_words = (low + high) // 2
+
+    def write(self, topic: str, lens: str, objective: str, use_rag: bool = True) -> str:
+        """Generate a complete piece.
+
+        Args:
+            topic: Content topic
+            lens: Primary content lens
+            objective: Content objective
+            use_rag: Whether to use RAG for context
+
+        Returns:
+            Stitched content with title and section subheadings
+
+        Raises:
+            ValueError: If the outline can't be parsed
+        """
+        overview = self._get_context(f"{topic} {lens} {objective}", use_rag, k=3)
+        title, sections = self.outline(topic, lens, objective, overview)
+
+        contexts = self._section_contexts(topic, sections, use_rag)
+        outline_text = "\n".join(
+            f"{i + 1}. {heading}: {point}" for i, (heading, point) in enumerate(sections)
+        )
+        section_words = self.total_words // len(sections)
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = [
+                submit_with_context(
+                    executor,
+                    self.write_section,
+                    topic, lens, objective, outline_text,
+                    i, len(sections), heading, point, contexts[i], section_words
+                )
+                for i, (heading, point) in enumerate(sections)
+            ]
+            bodies = [future.result() for future in futures]
+
+        bodies = self.add_transitions(sections, bodies)
+
+        parts = [f"# {title}"]
+        for (heading, _), body in zip(sections, bodies):
+            parts.append(f"## {heading}\n\n{body}")
+        return "\n\n".join(parts)
+
+    def outline(
+        self,
+        topic: str,
+        lens: str,
+        objective: str,
+        context: str
+    ) -> Tuple[str, List[Tuple[str, str]]]:
+        """Generate a short outline.
+
+        Args:
+            topic: Content topic
+            lens: Primary content lens
+            objective: Content objective
+            context: Knowledge base context for the whole piece
+
+        Returns:
+            Tuple of (title, [(subheading, point), ...])
+
+        Raises:
+            ValueError: If the response has no usable sections
+        """
+        prompt = OUTLINE_PROMPT.format(
+            content_type=self.content_type,
+            core_thesis=CORE_THESIS,
+            topic=topic,
+            lens=lens,
+            objective=objective,
+            context=context,
+            target_words=self.target_words,
+            min_sections=self.min_sections,
+            max_sections=self.max_sections
+        )
+        text = self.llm.invoke(prompt).content
+
+        title_match = re.search(r'TITLE:\s*(.+)', text)
+        title = title_match.group(1).strip() if title_match else topic
+
+        sections = []
+        for match in re.finditer(r'SECTION:\s*(.+)', text):
+            heading, _, point = match.group(1).partition("|")
+            heading = heading.strip().strip("#*").strip()
+            if heading:
+                sections.append((heading, point.strip() or heading))
+
+        if len(sections) < 2:
+            raise ValueError(f"Could not parse {self.content_type.lower()} outline")
+        return title, sections[:self.max_sections]
+
+    def write_section(
+        self,
+        topic: str,
+        lens: str,
+        objective: str,
+        outline_text: str,
+        index: int,
+        total: int,
+        heading: str,
+        point: str,
+        context: str,
+        section_words: int
+    ) -> str:
+        """Write one section, retrying just this section on failure.
+
+        A response under 40% of the section's word budget is treated as a
+        failed (truncated or refused) section.
+
+        Returns:
+            Section body without its subheading
+
+        Raises:
+            Exception: If every attempt fails
+        """
+        if index == 0:
+            position_note = (
+                "This is the opening section: start with a hook that reframes the topic."
+            )
+        elif index == total - 1:
+            position_note = (
+                "This is the closing section: end with synthesis and practical "
+                "implications, no questions or CTAs."
+            )
+        else:
+            position_note = "This is a middle section: go deep on its point."
+
+        prompt = SECTION_PROMPT.format(
+            content_type=self.content_type,
+            core_thesis=CORE_THESIS,
+            topic=topic,
+            lens=lens,
+            objective=objective,
+            outline=outline_text,
+            index=index + 1,
+            total=total,
+            heading=heading,
+            point=point,
+            position_note=position_note,
+            context=context,
+            section_words=section_words,
+            signature_phrase=get_rng().choice(SIGNATURE_PHRASES)
+        )
+
+        error = None
+        for attempt in range(self.max_section_retries + 1):
+            if error is not None:
+                print(f"Warning: section {index + 1} '{heading}' failed ({error}), retrying...")
+            try:
+                body = self._strip_heading(self.llm.invoke(prompt).content, heading)
+                if len(body.split()) >= section_words * 0.4:
+                    return body
+                error = Exception(f"section too short ({len(body.split())} words)")
+            except Exception as e:
+                error = e
+
+        raise Exception(f"Error writing section {index + 1} '{heading}': {error}")
+
+    def add_transitions(self, sections: List[Tuple[str, str]], bodies: List[str]) -> List[str]:
+        """Run a short pass that writes a bridging sentence between sections.
+
+        Falls back to the untouched sections if the pass fails.
+
+        Args:
+            sections: Outline sections as (subheading, point)
+            bodies: Section bodies in order
+
+        Returns:
+            Section bodies with transitions prepended to sections 2..n
+        """
+        boundaries = []
+        for i in range(1, len(bodies)):
+            previous_ending = bodies[i - 1].strip().split("\n")[-1]
+            boundaries.append(
+                f"Boundary {i}:\n"
+                f"End of previous section: {previous_ending}\n"
+                f"Next section: {sections[i][0]} ({sections[i][1]})"
+            )
+
+        prompt = TRANSITION_PROMPT.format(
+            content_type=self.content_type,
+            boundaries="\n\n".join(boundaries)
+        )
+        try:
+            text = self.llm.invoke(prompt).content
+        except Exception as e:
+            print(f"Warning: transition pass failed, stitching without transitions: {e}")
+            return bodies
+
+        transitions = {
+            int(match.group(1)): match.group(2).strip()
+            for match in re.finditer(r'TRANSITION\s*(\d+):\s*(.+)', text)
+        }
+        stitched = list(bodies)
+        for i in range(1, len(bodies)):
+            if transitions.get(i):
+                stitched[i] = f"{transitions[i]}\n\n{bodies[i]}"
+        return stitched
+
+    def _section_contexts(
+        self,
+        topic: str,
+        sections: List[Tuple[str, str]],
+        use_rag: bool
+    ) -> List[str]:
+        """Retrieve a separate slice of context for each section.
+
+        Chunks already handed to an earlier section are skipped so sections
+        draw on different material instead of repeating the same sources.
+        """
+        if not use_rag:
+            return ["No context available."] * len(sections)
+
+        used = set()
+        contexts = []
+        for heading, point in sections:
+            try:
+                chunks = self.knowledge_base.search(
+                    f"{topic} {heading} {point}", k=self.context_k * 2
+                )
+            except Exception as e:
+                print(f"Warning: Could not retrieve context: {e}")
+                chunks = []
+            fresh = [chunk for chunk in chunks if chunk not in used][:self.context_k]
+            used.update(fresh)
+            contexts.append("\n\n".join(fresh) or "No relevant context found in knowledge base.")
+        return contexts
+
+    def _get_context(self, query: str, use_rag: bool, k: int) -> str:
+        """Retrieve context for the outline step."""
+        if not use_rag:
+            return "No context available."
+        try:
+            chunks = self.knowledge_base.search(query, k=k)
+        except Exception as e:
+            print(f"Warning: Could not retrieve context: {e}")
+            return "No context available."
+        return "\n\n".join(chunks) or "No relevant context found in knowledge base."
+
+    @staticmethod
+    def _strip_heading(body: str, heading: str) -> str:
+        """Drop a leading subheading the model may have repeated."""
+        lines = body.strip().split("\n")
+        first = lines[0].strip("#* ").lower()
+        if heading.lower() in first and len(first.split()) <= len(heading.split()) + 3:
+            lines = lines[1:]
+        return "\n".join(lines).strip()
+
@@ -1,39 +1,98 @@
 """Content validation agent."""
 
 import re
-from typing import Dict, Tuple
-
-from langchain_openai import ChatOpenAI
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from core.config import (
-    OPENROUTER_API_KEY,
-    OPENROUTER_BASE_URL,
     DEFAULT_MODEL,
     MIN_SCORE,
+    PRECHECK_FAILED,
+    PRECHECK_HARD_FAILURES,
+    PRECHECK_PENALTIES,
+    SCORE_PENALTIES,
+    STYLE_PRESCORE,
+    WORD_COUNT_TOLERANCE,
+    VALIDATION_BATCH_SIZE,
 )
-from core.prompts import VALIDATION_PROMPT
+from core.llm import LLMClient
+from core.output_guard import word_range
+from core.prompts import BATCH_VALIDATION_PROMPT, VALIDATION_PROMPT
+from core.style_scorer import StyleScorer
+from core.usage import UsageRecord, record_usage
+from core.validation_cache import ValidationCache, get_validation_cache, validation_key
+from core.voice_rules import VoiceReport, get_voice_scanner
+
+
+def precheck_failed(feedback: str) -> bool:
+    """Check whether a validation result is a pre-check rejection.
+    
+    Rejected drafts score 0.0 without being judged, so they must never be
+    kept as the best draft of an entry.
+    """
+    return feedback.startswith(PRECHECK_FAILED)
+
+
+class _Prepared:
+    """Local pre-validation state for one draft."""
+    
+    def __init__(
+        self,
+        word_count: int,
+        score_penalty: float,
+        score_penalty_text: str
+    ):
+        self.word_count = word_count
+        # Deducted from the LLM score (SCORE_PENALTIES only)
+        self.score_penalty = score_penalty
+        self.score_penalty_text = score_penalty_text
+        self.key: Optional[str] = None
+        self.result: Optional[Tuple[float, str, int]] = None
 
 
 class ValidatorAgent:
     """Agent for validating content quality."""
     
-    def __init__(self, model: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        cache: Optional[ValidationCache] = None,
+        use_cache: bool = True,
+        style_scorer: Optional[StyleScorer] = None
+    ):
         """Initialize validator agent.
         
         Args:
             model: Model to use for validation
+            cache: Validation cache (defaults to the process-wide cache)
+            use_cache: Whether to reuse results for identical content
+            style_scorer: Calibrated embedding pre-scorer; drafts it calls
+                a clear pass or failure skip the LLM (None to always use the LLM)
         """
         self.model = model
+        self.style_scorer = style_scorer
+        self.cache = None
+        if use_cache:
+            self.cache = cache if cache is not None else get_validation_cache()
         
-        # Initialize LLM with OpenRouter
-        self.llm = ChatOpenAI(
+        # Initialize rate-limited LLM client (OpenRouter)
+        self.llm = LLMClient(
             model=model,
-            openai_api_key=OPENROUTER_API_KEY,
-            openai_api_base=OPENROUTER_BASE_URL,
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=1000,
+            stage="validation"
+        )
+        self.batch_llm = LLMClient(
+            model=model,
+            temperature=0.3,
+            max_tokens=300 * VALIDATION_BATCH_SIZE,
+            stage="validation"
         )
         
+        # Validations answered by the pre-check, the cache or the style pre-scorer
+        self.llm_calls_avoided = 0
+        self._lock = threading.Lock()
+        
     def validate(
         self,
         content: str,
@@ -48,21 +107,171 @@ class ValidatorAgent:
             target_words: Target word count range
             
         Returns:
-            Tuple of (score, feedback, word_count)
+            Tuple of (score, feedback, word_count). Content rejected by the
+            pre-check scores 0.0 with feedback starting PRECHECK_FAILED, and
+            content the style pre-scorer is confident about gets its
+            predicted score, both without an LLM call.
         """
-        # Quick checks for banned elements
-        # Use a more robust emoji detection pattern covering common Unicode blocks:
-        # - Miscellaneous Symbols and Pictographs (U+1F300-U+1F9FF)
-        # - Emoticons (U+1F600-U+1F64F)
-        # - Transport and Map Symbols (U+1F680-U+1F6FF)
-        # - Miscellaneous Symbols (U+2600-U+27BF)
-        emoji_pattern = r'[\U0001F300-\U0001F9FF]|[\U0001F600-\U0001F64F]|[\U0001F680-\U0001F6FF]|[\U00002600-\U000027BF]'
-        has_emoji = bool(re.search(emoji_pattern, content))
-        ends_with_question = content.strip().endswith('?')
-        
-        # Count words
-        word_count = len(content.split())
+        prepared = self._prepare(content, content_type, target_words)
+        if prepared.result is not None:
+            return prepared.result
+        return self._judge(content, content_type, target_words, prepared)
+        
+    def validate_many(
+        self,
+        contents: List[str],
+        content_type: str,
+        target_words: str,
+        batch_size: int = VALIDATION_BATCH_SIZE
+    ) -> List[Tuple[float, str, int]]:
+        """Validate several drafts, packing up to batch_size into one LLM call.
+        
+        Pre-check rejections, cached results and clear style pre-scores
+        are answered locally.
+        Any draft whose result can't be parsed from the batched response
+        (or whose batch call fails) is validated on its own.
+        
+        Args:
+            contents: Drafts to validate
+            content_type: Type (LinkedIn, Blog, Article)
+            target_words: Target word count range
+            batch_size: Maximum drafts per call
+            
+        Returns:
+            List of (score, feedback, word_count), in the order of contents
+        """
+        results: List[Optional[Tuple[float, str, int]]] = [None] * len(contents)
+        
+        # Identical drafts are judged once
+        pending: Dict[str, Tuple[_Prepared, List[int]]] = {}
+        for i, content in enumerate(contents):
+            if content in pending:
+                pending[content][1].append(i)
+                continue
+            prepared = self._prepare(content, content_type, target_words)
+            if prepared.result is not None:
+                results[i] = prepared.result
+            else:
+                pending[content] = (prepared, [i])
+                
+        items = list(pending.items())
+        for start in range(0, len(items), batch_size):
+            chunk = items[start:start + batch_size]
+            blocks = {}
+            if len(chunk) > 1:
+                drafts = "\n\n".join(
+                    f"=== DRAFT {n} ===\n{content}\n=== END DRAFT {n} ==="
+                    for n, (content, _) in enumerate(chunk, 1)
+                )
+                prompt = BATCH_VALIDATION_PROMPT.format(
+                    content_type=content_type,
+                    target_words=target_words,
+                    drafts=drafts
+                )
+                try:
+                    blocks = self.split_results(self.batch_llm.invoke(prompt).content)
+                except Exception as e:
+                    print(f"Warning: batched validation failed ({e}), validating drafts one by one")
+                    
+            for n, (content, (prepared, indices)) in enumerate(chunk, 1):
+                block = blocks.get(n)
+                if block and re.search(r'SCORE:\s*\d', block):
+                    result = self._finish(block, prepared)
+                else:
+                    result = self._judge(content, content_type, target_words, prepared)
+                for i in indices:
+                    results[i] = result
+                    
+        return results
+        
+    @staticmethod
+    def split_results(text: str) -> Dict[int, str]:
+        """Split a batched validation response into per-draft blocks.
+        
+        Args:
+            text: Raw model response
+            
+        Returns:
+            Dict mapping draft number to its SCORE/FEEDBACK block
+        """
+        markers = list(re.finditer(
+            r'^[^\w\n]*=+\s*RESULT\s*#?\s*(\d+)\s*=+[^\w\n]*$',
+            text,
+            re.M | re.I
+        ))
+        blocks = {}
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+            blocks.setdefault(int(marker.group(1)), text[marker.end():end].strip())
+        return blocks
+        
+    def _prepare(self, content: str, content_type: str, target_words: str) -> _Prepared:
+        """Run the pre-check, cache lookup and style pre-score for one draft."""
+        # Deterministic checks first: after a hard failure, or if the
+        # deducted penalties alone put MIN_SCORE out of reach, the LLM call
+        # can't change the outcome
+        report = get_voice_scanner().scan(content)
+        word_count = report.word_count
+        checks = self._checks(target_words, report)
+        scored = [(issue, amount) for kind, issue, amount in checks if kind in SCORE_PENALTIES]
+        prepared = _Prepared(
+            word_count,
+            sum(amount for _, amount in scored),
+            "".join(f"\n- PENALTY: {issue} (-{amount:.1f})" for issue, amount in scored)
+        )
         
+        hard = [issue for kind, issue, _ in checks if kind in PRECHECK_HARD_FAILURES]
+        bound = 10.0 - prepared.score_penalty
+        if hard or bound < MIN_SCORE:
+            # The bound isn't a measured score, so the draft scores 0.0
+            self._record_avoided()
+            reason = hard[0] if hard else f"cannot reach {MIN_SCORE}: at most {bound:.1f}"
+            penalty_text = "".join(
+                f"\n- PENALTY: {issue} (-{amount:.1f})" for _, issue, amount in checks
+            )
+            prepared.result = (
+                0.0,
+                f"{PRECHECK_FAILED} ({reason})\nFEEDBACK:{penalty_text}",
+                word_count
+            )
+            return prepared
+            
+        if self.cache is not None:
+            prepared.key = validation_key(content, content_type, target_words, self.model)
+            cached = self.cache.get(prepared.key)
+            if cached is not None:
+                self._record_avoided()
+                prepared.result = cached
+                return prepared
+                
+        if self.style_scorer is not None:
+            # Not cached: a later scorer calibration may call it differently
+            try:
+                judgement = self.style_scorer.judge(content, content_type)
+            except Exception as e:
+                print(f"Warning: style pre-score failed: {e}")
+                judgement = None
+            if judgement is not None:
+                predicted, verdict = judgement
+                self._record_avoided()
+                # Calibrated on final scores, so the prediction already
+                # reflects the penalties; they're listed for revisions only
+                prepared.result = (
+                    round(min(10.0, max(0.0, predicted)), 1),
+                    f"{STYLE_PRESCORE} (clear {verdict}, predicted {predicted:.1f}, no LLM call)"
+                    f"\nFEEDBACK:{prepared.score_penalty_text}",
+                    word_count
+                )
+        return prepared
+        
+    def _judge(
+        self,
+        content: str,
+        content_type: str,
+        target_words: str,
+        prepared: _Prepared
+    ) -> Tuple[float, str, int]:
+        """Validate one draft with its own LLM call."""
         # Format prompt
         prompt = VALIDATION_PROMPT.format(
             content=content,
@@ -73,25 +282,98 @@ class ValidatorAgent:
         # Get validation from LLM
         try:
             response = self.llm.invoke(prompt)
-            validation_text = response.content
+            return self._finish(response.content, prepared)
+        except Exception as e:
+            return 0.0, f"Error during validation: {e}", prepared.word_count
             
-            # Parse score
-            score = self._parse_score(validation_text)
+    def _finish(self, validation_text: str, prepared: _Prepared) -> Tuple[float, str, int]:
+        """Score an LLM validation response, apply penalties and cache it."""
+        # Parse score
+        score = self._parse_score(validation_text)
+        
+        # Add penalties for quick checks
+        score = max(0, score - prepared.score_penalty)
+        validation_text += prepared.score_penalty_text
+        
+        result = (score, validation_text, prepared.word_count)
+        if prepared.key is not None:
+            self.cache.put(prepared.key, result)
+        return result
+        
+    def _record_avoided(self):
+        """Count a validation answered without an LLM call."""
+        with self._lock:
+            self.llm_calls_avoided += 1
+        record_usage(UsageRecord(stage="validation", model=self.model, avoided=True))
+        
+    def precheck(
+        self,
+        content: str,
+        target_words: str,
+        report: Optional[VoiceReport] = None
+    ) -> List[Tuple[str, float]]:
+        """Run the deterministic voice and format checks.
+        
+        Args:
+            content: Content to check
+            target_words: Target word count range
+            report: Voice scan of the content (scanned here if None)
             
-            # Add penalties for quick checks
-            if has_emoji:
-                score = max(0, score - 2.0)
-                validation_text += "\n- PENALTY: Contains emojis (-2.0)"
-                
-            if ends_with_question:
-                score = max(0, score - 1.0)
-                validation_text += "\n- PENALTY: Ends with question (-1.0)"
-                
-            return score, validation_text, word_count
+        Returns:
+            List of (issue, penalty) pairs; empty if nothing was found
+        """
+        if report is None:
+            report = get_voice_scanner().scan(content)
+        return [(issue, amount) for _, issue, amount in self._checks(target_words, report)]
+        
+    def _checks(self, target_words: str, report: VoiceReport) -> List[Tuple[str, str, float]]:
+        """Pre-check findings as (PRECHECK_PENALTIES key, issue, penalty)."""
+        penalties = []
+        
+        word_count = report.word_count
+        low, high = word_range(target_words)
+        far_low = low * (1 - WORD_COUNT_TOLERANCE)
+        far_high = high * (1 + WORD_COUNT_TOLERANCE)
+        if word_count < far_low or word_count > far_high:
+            penalties.append((
+                "word_count_far",
+                f"{word_count} words, far outside {target_words}",
+                PRECHECK_PENALTIES["word_count_far"]
+            ))
+        elif not low <= word_count <= high:
+            penalties.append((
+                "word_count_near",
+                f"{word_count} words, outside {target_words}",
+                PRECHECK_PENALTIES["word_count_near"]
+            ))
             
-        except Exception as e:
-            return 0.0, f"Error during validation: {e}", word_count
+        if report.emojis:
+            penalties.append(("emoji", "Contains emojis", PRECHECK_PENALTIES["emoji"]))
+            
+        if report.ends_with_question:
+            penalties.append((
+                "question_ending", "Ends with question", PRECHECK_PENALTIES["question_ending"]
+            ))
+            
+        banned = report.banned_terms
+        if banned:
+            penalties.append((
+                "banned_term",
+                f"Banned terms: {', '.join(banned)}",
+                min(3.0, PRECHECK_PENALTIES["banned_term"] * len(banned))
+            ))
             
+        if report.hashtags:
+            penalties.append(("hashtag", "Contains hashtags", PRECHECK_PENALTIES["hashtag"]))
+            
+        if not report.has_signature_phrase:
+            penalties.append((
+                "no_signature_phrase", "No signature phrase",
+                PRECHECK_PENALTIES["no_signature_phrase"]
+            ))
+            
+        return penalties
+        
     def _parse_score(self, validation_text: str) -> float:
         """Parse score from validation response.
         
@@ -133,6 +415,9 @@ class ValidatorAgent:
     ) -> Dict:
         """Validate content with automatic retry logic.
         
+        With the cache enabled, repeats of a successful validation are
+        lookups; only failed validation calls are actually retried.
+        
         Args:
             content: Content to validate
             content_type: Type (LinkedIn, Blog, Article)
@@ -1,16 +1,24 @@
 """Streamlit web UI for content agent system."""
 
+import os
+
 import streamlit as st
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from agents.linkedin_agent import LinkedInAgent
 from agents.blog_agent import BlogAgent
 from agents.article_agent import ArticleAgent
 from agents.validator_agent import ValidatorAgent
-from core.knowledge_base import KnowledgeBase
-from core.config import LENSES, OBJECTIVES, MODELS, MIN_SCORE
-from batch_processor import BatchProcessor, CONTENT_CALENDAR
+from core.knowledge_base import KnowledgeBase, knowledge_base_fingerprint
+from core.config import (
+    LENSES, OBJECTIVES, MODELS, MIN_SCORE, TARGET_WORDS, BATCH_JOURNAL_PATH, DRAFT_STORE_PATH
+)
+from core.draft_store import DraftStore
+from batch_processor import BatchProcessor, CONTENT_CALENDAR, summarize_attempts, summarize_tiers
+from core.cascade import ModelCascade
+from core.events import BATCH_FINISHED, BATCH_STARTED, ENTRY_FINISHED, format_eta
+from core.usage import UsageTracker, llm_calls, track_usage
 
 
 # Page configuration
@@ -28,6 +36,10 @@ def init_session_state():
         st.session_state.content_history = []
     if "knowledge_base" not in st.session_state:
         st.session_state.knowledge_base = None
+    if "usage" not in st.session_state:
+        st.session_state.usage = UsageTracker()
+    if "draft_store" not in st.session_state:
+        st.session_state.draft_store = None
 
 
 def get_knowledge_base() -> KnowledgeBase:
@@ -43,6 +55,24 @@ def get_knowledge_base() -> KnowledgeBase:
     return st.session_state.knowledge_base
 
 
+def get_pregenerated_draft(entry: Dict) -> Optional[Dict]:
+    """Get the validated draft the pre-generation daemon stored for an entry.
+    
+    Returns:
+        Stored result, or None if there is no store, no draft, or the draft
+        was generated against an older knowledge base
+    """
+    if st.session_state.draft_store is None:
+        if not os.path.exists(DRAFT_STORE_PATH):
+            return None
+        st.session_state.draft_store = DraftStore(DRAFT_STORE_PATH)
+    try:
+        return st.session_state.draft_store.get(entry, fingerprint=knowledge_base_fingerprint())
+    except Exception as e:
+        st.warning(f"Pre-generated drafts not available: {e}")
+        return None
+
+
 def add_to_history(content: str, metadata: Dict):
     """Add content to history."""
     entry = {
@@ -125,7 +155,7 @@ def linkedin_post_generator():
                     
                     # Validate
                     score, feedback, word_count = validator.validate(
-                        content, "LinkedIn", "150-250"
+                        content, "LinkedIn", TARGET_WORDS["LinkedIn"]
                     )
                     
                     # Display
@@ -181,7 +211,30 @@ def linkedin_post_generator():
             
         model = st.selectbox("Model", list(MODELS.keys()), index=0, key="cal_model")
         
-        if st.button("Generate from Calendar", type="primary"):
+        # Serve the daemon's validated draft if there is a current one
+        draft = get_pregenerated_draft(entry)
+        if draft is not None:
+            generated = draft["timestamp"][:16].replace("T", " ")
+            st.success(f"Pre-generated draft ready (validated {generated})")
+            st.text_area("Content", draft["content"], height=300, key="pregen_content")
+            
+            display_validation(draft["score"], draft["feedback"], draft["word_count"])
+            
+            if st.button("Save to History"):
+                metadata = {
+                    "type": "LinkedIn",
+                    "post_number": entry["post_number"],
+                    "topic": entry["topic"],
+                    "lens": entry["lens"],
+                    "objective": entry["objective"],
+                    "score": draft["score"],
+                    "word_count": draft["word_count"],
+                    "pregenerated": True
+                }
+                add_to_history(draft["content"], metadata)
+                
+        live_label = "Generate from Calendar" if draft is None else "Regenerate Live"
+        if st.button(live_label, type="primary" if draft is None else "secondary"):
             with st.spinner("Generating LinkedIn post..."):
                 try:
                     kb = get_knowledge_base()
@@ -190,7 +243,7 @@ def linkedin_post_generator():
                     
                     content = agent.generate_from_calendar(entry)
                     score, feedback, word_count = validator.validate(
-                        content, "LinkedIn", "150-250"
+                        content, "LinkedIn", TARGET_WORDS["LinkedIn"]
                     )
                     
                     st.subheader("Generated Post")
@@ -231,6 +284,12 @@ def blog_post_generator():
         objective = st.selectbox("Objective", OBJECTIVES, key="blog_obj")
         model = st.selectbox("Model", list(MODELS.keys()), index=0, key="blog_model")
         use_rag = st.checkbox("Use RAG", value=True, key="blog_rag")
+        parallel_sections = st.checkbox(
+            "Parallel Sections",
+            value=False,
+            key="blog_parallel",
+            help="Outline first, then write sections concurrently (faster)"
+        )
         
     if st.button("Generate Blog Post", type="primary"):
         if not topic:
@@ -243,9 +302,13 @@ def blog_post_generator():
                 agent = BlogAgent(model=MODELS[model], knowledge_base=kb)
                 validator = ValidatorAgent(model=MODELS[model])
                 
-                content = agent.generate(topic, lens, objective, use_rag=use_rag)
+                content = agent.generate(
+                    topic, lens, objective,
+                    use_rag=use_rag,
+                    parallel_sections=parallel_sections
+                )
                 score, feedback, word_count = validator.validate(
-                    content, "Blog", "800-1500"
+                    content, "Blog", TARGET_WORDS["Blog"]
                 )
                 
                 st.subheader("Generated Blog Post")
@@ -285,6 +348,12 @@ def article_generator():
         objective = st.selectbox("Objective", OBJECTIVES, key="article_obj")
         model = st.selectbox("Model", list(MODELS.keys()), index=0, key="article_model")
         use_rag = st.checkbox("Use RAG", value=True, key="article_rag")
+        parallel_sections = st.checkbox(
+            "Parallel Sections",
+            value=False,
+            key="article_parallel",
+            help="Outline first, then write sections concurrently (faster)"
+        )
         
     if st.button("Generate Article", type="primary"):
         if not topic:
@@ -297,9 +366,13 @@ def article_generator():
                 agent = ArticleAgent(model=MODELS[model], knowledge_base=kb)
                 validator = ValidatorAgent(model=MODELS[model])
                 
-                content = agent.generate(topic, lens, objective, use_rag=use_rag)
+                content = agent.generate(
+                    topic, lens, objective,
+                    use_rag=use_rag,
+                    parallel_sections=parallel_sections
+                )
                 score, feedback, word_count = validator.validate(
-                    content, "Article", "1000-2000"
+                    content, "Article", TARGET_WORDS["Article"]
                 )
                 
                 st.subheader("Generated Article")
@@ -335,10 +408,50 @@ def batch_processor_ui():
     with col1:
         start_post = st.number_input("Start Post", min_value=4, max_value=12, value=4)
         model = st.selectbox("Model", list(MODELS.keys()), index=0, key="batch_model")
+        use_cascade = st.checkbox(
+            "Model Cascade",
+            value=False,
+            help="Start on the free model and escalate to cheap/quality only when validation fails"
+        )
+        revise_on_failure = st.checkbox(
+            "Revise on Failure",
+            value=True,
+            help="Rewrite a failed draft using the validator's feedback instead of starting over"
+        )
+        batch_validation = st.checkbox(
+            "Batched Validation",
+            value=False,
+            help="Judge parallel candidates and multi-post drafts together in one validation call"
+        )
+        pipeline = st.checkbox(
+            "Pipelined Validation",
+            value=False,
+            help="Generate the next attempt while the current draft is being validated"
+        )
+        resume = st.checkbox(
+            "Resume from Journal",
+            value=False,
+            help="Keep every post already in the batch journal, including failed ones "
+            "(posts that passed are always reused)"
+        )
         
     with col2:
         end_post = st.number_input("End Post", min_value=4, max_value=12, value=12)
         max_retries = st.number_input("Max Retries", min_value=1, max_value=5, value=3)
+        parallel_candidates = st.number_input(
+            "Parallel Candidates",
+            min_value=1,
+            max_value=5,
+            value=1,
+            help="Generate several candidates at once and keep the best (1 = sequential retries)"
+        )
+        posts_per_call = st.number_input(
+            "Posts per Call",
+            min_value=1,
+            max_value=3,
+            value=1,
+            help="Draft up to this many posts of the same week in a single LLM call"
+        )
         
     if st.button("Start Batch Processing", type="primary"):
         if start_post > end_post:
@@ -348,34 +461,57 @@ def batch_processor_ui():
         # Progress tracking
         progress_bar = st.progress(0)
         status_text = st.empty()
+        throughput_text = st.empty()
         
         try:
             kb = get_knowledge_base()
             processor = BatchProcessor(
                 model=MODELS[model],
                 knowledge_base=kb,
-                max_retries=max_retries
+                max_retries=max_retries,
+                parallel_candidates=parallel_candidates,
+                cascade=ModelCascade() if use_cascade else None,
+                revise_on_failure=revise_on_failure,
+                posts_per_call=posts_per_call,
+                batch_validation=batch_validation,
+                pipeline=pipeline
             )
             
-            # Filter calendar
-            entries = [
-                e for e in CONTENT_CALENDAR
-                if start_post <= e["post_number"] <= end_post
-            ]
-            
+            if posts_per_call > 1:
+                status_text.text("Drafting posts...")
+            # Finished posts are journaled as they complete, so a rerun or
+            # crash doesn't throw away paid-for generations. Events arrive
+            # on this thread, so the widgets can be updated directly.
             results = []
-            total = len(entries)
-            
-            for i, entry in enumerate(entries):
-                status_text.text(f"Processing Post {entry['post_number']}/{end_post}...")
-                
-                result = processor.process_single(entry)
-                results.append(result)
-                
-                progress_bar.progress((i + 1) / total)
+            for event in processor.iter_events(
+                calendar=CONTENT_CALENDAR,
+                start_post=start_post,
+                end_post=end_post,
+                journal=BATCH_JOURNAL_PATH,
+                resume=resume
+            ):
+                if event.kind == ENTRY_FINISHED:
+                    data = event.data
+                    progress_bar.progress(data["done"] / data["total"])
+                    rate = data["posts_per_minute"]
+                    throughput_text.caption(
+                        f"{data['done']}/{data['total']} posts"
+                        + (f" | {rate:.1f} posts/min" if rate else "")
+                        + f" | ETA {format_eta(data['eta'])}"
+                        + f" | {event.tokens:,} tokens (${event.cost:.4f})"
+                    )
+                elif event.kind == BATCH_FINISHED:
+                    results = event.data["results"]
+                elif event.kind != BATCH_STARTED and event.message:
+                    prefix = f"Post {event.post_number}: " if event.post_number else ""
+                    status_text.text(prefix + event.message.strip())
+            usage = processor.last_usage
                 
             # Display results
             st.success(f"Batch processing complete! Generated {len(results)} posts.")
+            resumed = sum(1 for r in results if r.get("resumed"))
+            if resumed:
+                st.caption(f"{resumed} post(s) reused from {BATCH_JOURNAL_PATH}")
             
             # Summary table
             st.subheader("Results Summary")
@@ -387,14 +523,39 @@ def batch_processor_ui():
                     "Topic": r["topic"][:50] + "...",
                     "Score": f"{r['score']:.1f}",
                     "Status": "✓" if r["passed"] else "✗",
-                    "Attempts": r["attempts"]
+                    "Attempts": r["attempts"],
+                    "Tier": r.get("tier") or "-",
+                    "Tokens": r["usage"]["total_tokens"],
+                    "Cost": f"${r['usage']['cost']:.4f}"
                 })
             
             st.table(summary_data)
             
+            tier_mix = summarize_tiers(results)
+            if tier_mix:
+                st.caption(
+                    "Tier mix (accepted posts): "
+                    + ", ".join(f"{tier}: {count}" for tier, count in tier_mix.items())
+                )
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("LLM Calls", llm_calls(usage))
+            col2.metric("Tokens", f"{usage['total_tokens']:,}")
+            col3.metric("Cost", f"${usage['cost']:.4f}")
+            col4.metric("Retry Tokens", f"{usage['retry_attempts']['total_tokens']:,}")
+            
+            effort = summarize_attempts(results)
+            if effort["accepted"]:
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Mean Attempts to Pass", f"{effort['mean_attempts_to_pass']:.2f}")
+                col2.metric(
+                    "LLM Calls per Accepted Post", f"{effort['llm_calls_per_accepted']:.1f}"
+                )
+                col3.metric("Revisions", effort["revisions"])
+            
             # Export
             output_file = f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            processor.export_results(results, output_file)
+            processor.export_results(results, output_file, usage=usage)
             
             st.success(f"Results exported to {output_file}")
             
@@ -494,16 +655,26 @@ def main():
         """)
         
     # Main content
-    if page == "LinkedIn Generator":
-        linkedin_post_generator()
-    elif page == "Blog Generator":
-        blog_post_generator()
-    elif page == "Article Generator":
-        article_generator()
-    elif page == "Batch Processor":
-        batch_processor_ui()
-    elif page == "Content History":
-        content_history_ui()
+    with track_usage(st.session_state.usage):
+        if page == "LinkedIn Generator":
+            linkedin_post_generator()
+        elif page == "Blog Generator":
+            blog_post_generator()
+        elif page == "Article Generator":
+            article_generator()
+        elif page == "Batch Processor":
+            batch_processor_ui()
+        elif page == "Content History":
+            content_history_ui()
+            
+    # Session usage (rendered last so it includes this run's calls)
+    with st.sidebar:
+        usage = st.session_state.usage.summary()
+        st.markdown("### Session Usage")
+        st.caption(
+            f"{llm_calls(usage)} LLM calls · {usage['total_tokens']:,} tokens · "
+            f"${usage['cost']:.4f}"
+        )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,68 @@
 """Batch content processor with calendar integration."""
 
+import argparse
+import contextvars
+import heapq
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import Counter
+from queue import Queue
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import (
+    Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+)
 
+from agents.article_agent import ArticleAgent
+from agents.blog_agent import BlogAgent
 from agents.linkedin_agent import LinkedInAgent
-from agents.validator_agent import ValidatorAgent
+from agents.validator_agent import ValidatorAgent, precheck_failed
+from core.cascade import ModelCascade, tier_for_model
 from core.knowledge_base import KnowledgeBase
-from core.config import MIN_SCORE
+from core.config import (
+    BATCH_JOURNAL_PATH, CONTENT_TYPE_CONCURRENCY, DEFAULT_MODEL, FAILED_CONTENT, MIN_SCORE,
+    MODELS, QUEUE_MAX_ATTEMPTS, TARGET_WORDS, WORK_QUEUE_PATH
+)
+from core.content_calendar import CalendarFilter, CalendarIndex, read_calendar
+from core.events import (
+    ATTEMPT, BATCH_FINISHED, BATCH_STARTED, ENTRY_FINISHED, ENTRY_STARTED, ERROR, ESCALATED,
+    FAILED, NOTE, PASSED, SCORE, BatchEvent, ConsoleReporter, emit, event_scope, format_eta,
+    listen
+)
+from core.journal import BatchJournal, entry_key, settings_key
+from core.scheduler import BatchBudget, CostModel, schedule_key
+from core.sinks import ResultSink, open_sink
+from core.seeding import seeded
+from core.style_scorer import StyleScorer
+from core.usage import (
+    UsageTracker, llm_calls, merge_usage, submit_with_context, track_usage, usage_attempt
+)
+from core.work_queue import WorkQueue
+
+
+# Generator agent for each content type a calendar entry can declare
+GENERATORS = {
+    "LinkedIn": LinkedInAgent,
+    "Blog": BlogAgent,
+    "Article": ArticleAgent,
+}
+ContentAgent = Union[LinkedInAgent, BlogAgent, ArticleAgent]
+
+
+def _content_type(calendar_entry: Dict) -> str:
+    return calendar_entry.get("content_type", "LinkedIn")
+
+
+def _entry_label(calendar_entry: Dict) -> str:
+    """Console label for an entry: post number, topic and non-LinkedIn content type."""
+    content_type = _content_type(calendar_entry)
+    label = f"Post #{calendar_entry['post_number']}: {calendar_entry['topic']}"
+    return label if content_type == "LinkedIn" else f"{label} [{content_type}]"
 
 
 # Content Calendar: Week 2-4 (Posts 4-12)
@@ -90,6 +145,158 @@ CONTENT_CALENDAR = [
 ]
 
 
+@dataclass
+class _AttemptState:
+    """Where one entry stands in the sequential attempt loop."""
+    
+    best_content: Optional[str] = None
+    best_score: float = 0.0
+    best_feedback: str = ""
+    best_tier: Optional[str] = None
+    attempts: int = 0
+    revisions: int = 0
+    tier: Optional[str] = None
+    tier_attempts: int = 0
+    
+    @property
+    def passed(self) -> bool:
+        return self.best_score >= MIN_SCORE
+
+
+@dataclass
+class _ScheduledEntry:
+    """An entry worked through one attempt at a time (budgeted runs)."""
+    
+    index: int
+    entry: Dict
+    state: _AttemptState
+    usage: UsageTracker = field(default_factory=UsageTracker)
+    elapsed: float = 0.0
+
+
+class BatchStats:
+    """Running totals over batch results, so summaries don't need the results kept."""
+    
+    def __init__(self):
+        """Initialize empty totals."""
+        self.total = 0
+        self.reused = 0
+        self.skipped: List[int] = []
+        self.stopped = 0
+        self.stop_reason: Optional[str] = None
+        self.passed = 0
+        self.attempts_to_pass = 0
+        self.revisions = 0
+        self.calls = 0
+        self.tier_counts: Dict[str, int] = {}
+        
+    def add(self, result: Dict, reused: bool = False):
+        """Add one result.
+        
+        Args:
+            result: Result dict
+            reused: Whether the result came from an earlier run's journal
+        """
+        if result.get("skipped"):
+            # Never attempted; not part of the pass rate
+            self.skipped.append(result["post_number"])
+            return
+        self.total += 1
+        self.reused += int(reused)
+        self.stopped += int(bool(result.get("stopped")))
+        self.revisions += result.get("revisions", 0)
+        self.calls += llm_calls(result.get("usage", {}))
+        if result["passed"]:
+            self.passed += 1
+            self.attempts_to_pass += result["attempts_to_pass"]
+            tier = result.get("tier") or "unknown"
+            self.tier_counts[tier] = self.tier_counts.get(tier, 0) + 1
+            
+    def tiers(self) -> Dict[str, int]:
+        """Accepted posts per model tier, cheapest tier first."""
+        order = {tier: i for i, tier in enumerate(MODELS)}
+        return dict(
+            sorted(self.tier_counts.items(), key=lambda item: order.get(item[0], len(order)))
+        )
+        
+    def attempts(self) -> Dict:
+        """Accepted post count, mean attempts to pass, revisions and LLM calls per accepted post."""
+        return {
+            "accepted": self.passed,
+            "mean_attempts_to_pass": (
+                self.attempts_to_pass / self.passed if self.passed else None
+            ),
+            "revisions": self.revisions,
+            "llm_calls_per_accepted": self.calls / self.passed if self.passed else None,
+        }
+        
+    @classmethod
+    def of(cls, results: Iterable[Dict]) -> "BatchStats":
+        """Totals over a list of results."""
+        stats = cls()
+        for result in results:
+            stats.add(result)
+        return stats
+
+
+def summarize_tiers(results: List[Dict]) -> Dict[str, int]:
+    """Count accepted posts per model tier.
+    
+    Args:
+        results: List of result dicts
+        
+    Returns:
+        Dict mapping tier name to number of passed posts, cheapest tier first
+    """
+    return BatchStats.of(results).tiers()
+
+
+def format_usage(usage: Dict) -> str:
+    """Format a usage summary as a one-line report.
+    
+    Args:
+        usage: Dict returned by UsageTracker.summary()
+        
+    Returns:
+        Human-readable summary of calls, tokens, cost, retry overhead
+        and output discarded by early stops
+    """
+    line = (
+        f"Usage: {usage['calls']} calls, {usage['total_tokens']:,} tokens "
+        f"({usage['prompt_tokens']:,} in / {usage['completion_tokens']:,} out), "
+        f"${usage['cost']:.4f}"
+    )
+    stages = ", ".join(
+        f"{stage}={totals['calls']}" for stage, totals in usage["by_stage"].items()
+    )
+    if stages:
+        line += f" | calls by stage: {stages}"
+    retry_tokens = usage["retry_attempts"]["total_tokens"]
+    if retry_tokens:
+        line += f" | {retry_tokens:,} tokens spent on retry attempts"
+    if usage["calls_avoided"]:
+        line += f" | {usage['calls_avoided']} validation calls avoided by pre-check"
+    if usage["early_stops"]:
+        line += (
+            f" | {usage['early_stops']} early stops wasted "
+            f"{usage['wasted_tokens']:,} tokens / {usage['wasted_latency']:.1f}s"
+        )
+    return line
+
+
+def summarize_attempts(results: List[Dict]) -> Dict:
+    """Summarize how much work accepted posts took.
+    
+    Args:
+        results: List of result dicts
+        
+    Returns:
+        Dict with accepted post count, mean attempts to pass, revisions
+        made and LLM calls per accepted post (None when nothing passed)
+    """
+    return BatchStats.of(results).attempts()
+
+
 class BatchProcessor:
     """Batch processor for generating multiple content pieces."""
     
@@ -97,87 +304,864 @@ class BatchProcessor:
         self,
         model: str = None,
         knowledge_base: Optional[KnowledgeBase] = None,
-        max_retries: int = 3
+        max_retries: int = 3,
+        parallel_candidates: int = 1,
+        cascade: Optional[ModelCascade] = None,
+        revise_on_failure: bool = True,
+        posts_per_call: int = 1,
+        batch_validation: bool = False,
+        style_scorer: Optional[StyleScorer] = None,
+        pipeline: bool = False,
+        concurrency: int = 1,
+        type_concurrency: Optional[Dict[str, int]] = None,
+        seed: Optional[int] = None,
+        workers: int = 0,
+        queue_path: str = WORK_QUEUE_PATH,
+        verbose: bool = True
     ):
         """Initialize batch processor.
         
         Args:
-            model: Model to use for generation
+            model: Model to use for generation (ignored when cascading)
             knowledge_base: Knowledge base for RAG
             max_retries: Maximum generation attempts per post
+            parallel_candidates: Number of candidates to generate concurrently
+                per post (best-of-N mode). 1 keeps the sequential retry loop.
+            cascade: Optional model cascade; posts start on its cheapest tier
+                and escalate only when validation or errors call for it
+            revise_on_failure: After a failed attempt, rewrite the best draft
+                so far using the validator's feedback instead of generating
+                from scratch (sequential mode)
+            posts_per_call: Generate up to this many posts of the same
+                calendar week in one LLM call; posts that don't parse or
+                don't pass go through the normal per-post loop
+            batch_validation: Judge best-of-N candidates and multi-post
+                drafts together in batched validation calls
+            style_scorer: Calibrated embedding pre-scorer shared by all
+                validators; clear passes and failures skip the LLM judge
+            pipeline: Generate the next attempt's draft while the current
+                one is being validated (sequential mode); the speculative
+                draft is discarded if validation passes
+            concurrency: Calendar entries processed at the same time by
+                process_batch (1 = one after another)
+            type_concurrency: Most entries of each content type in flight
+                at once (default CONTENT_TYPE_CONCURRENCY), so long-form
+                entries leave slots for short posts; types not listed are
+                limited only by ``concurrency``
+            seed: Seed for the agents' random choices; each entry gets its
+                own generator derived from it, so results don't depend on
+                the order concurrent entries run in
+            workers: Worker processes process_batch hands entries to
+                through a SQLite work queue, each with its own agents and
+                KnowledgeBase and ``concurrency`` entries in flight
+                (0 = process entries in this process)
+            queue_path: Work queue file used when workers > 0
+            verbose: Print progress events to the console
         """
+        self.model = model or DEFAULT_MODEL
         self.knowledge_base = knowledge_base or KnowledgeBase()
-        self.linkedin_agent = LinkedInAgent(model=model, knowledge_base=self.knowledge_base)
-        self.validator = ValidatorAgent(model=model)
+        self.linkedin_agent = LinkedInAgent(model=self.model, knowledge_base=self.knowledge_base)
+        self.style_scorer = style_scorer
+        self.validator = ValidatorAgent(model=self.model, style_scorer=style_scorer)
         self.max_retries = max_retries
+        self.parallel_candidates = max(1, parallel_candidates)
+        self.cascade = cascade
+        self.revise_on_failure = revise_on_failure
+        self.posts_per_call = max(1, posts_per_call)
+        self.batch_validation = batch_validation
+        self.pipeline = pipeline
+        self.concurrency = max(1, concurrency)
+        self.type_concurrency = dict(
+            CONTENT_TYPE_CONCURRENCY if type_concurrency is None else type_concurrency
+        )
+        self.seed = seed
+        self.workers = max(0, workers)
+        self.queue_path = queue_path
+        self._console = ConsoleReporter() if verbose else None
         
-    def process_single(self, calendar_entry: Dict) -> Dict:
-        """Process a single calendar entry.
+        # Per-tier and per-content-type agents, created on first use
+        self._generators: Dict[Tuple[Optional[str], str], ContentAgent] = {
+            (None, "LinkedIn"): self.linkedin_agent
+        }
+        self._tier_validators: Dict[str, ValidatorAgent] = {}
+        self._tier_lock = threading.Lock()
+        
+        # Usage of the most recent process_batch run
+        self.last_usage: Optional[Dict] = None
+        
+    def _agents_for(
+        self,
+        tier: Optional[str],
+        content_type: str = "LinkedIn"
+    ) -> Tuple[ContentAgent, ValidatorAgent]:
+        """Get the generator and validator for a cascade tier and content type.
+        
+        Args:
+            tier: Tier name, or None for the processor's fixed model
+            content_type: Content type to generate (a GENERATORS key)
+            
+        Returns:
+            Tuple of (generator agent, validator)
+        """
+        with self._tier_lock:
+            key = (tier, content_type)
+            if key not in self._generators:
+                self._generators[key] = GENERATORS[content_type](
+                    model=self._model_for(tier), knowledge_base=self.knowledge_base
+                )
+            if tier is None:
+                return self._generators[key], self.validator
+            if tier not in self._tier_validators:
+                self._tier_validators[tier] = ValidatorAgent(
+                    model=self.cascade.model_for(tier), style_scorer=self.style_scorer
+                )
+            return self._generators[key], self._tier_validators[tier]
+            
+    def _type_limit(self, content_type: str) -> int:
+        """Most entries of a content type processed at once."""
+        limit = self.type_concurrency.get(content_type, self.concurrency)
+        return max(1, min(limit, self.concurrency))
+        
+    def _validate(self, content: str, content_type: str = "LinkedIn") -> Tuple[float, str, int]:
+        """Validate content against its type's targets, escalating the judge when cascading.
+        
+        Args:
+            content: Content to validate
+            content_type: Content type (LinkedIn, Blog, Article)
+            
+        Returns:
+            Tuple of (score, feedback, word_count)
+        """
+        if self.cascade is None:
+            return self.validator.validate(
+                content=content,
+                content_type=content_type,
+                target_words=TARGET_WORDS[content_type]
+            )
+            
+        tier = self.cascade.first_tier
+        while True:
+            _, validator = self._agents_for(tier)
+            score, feedback, word_count = validator.validate(
+                content=content,
+                content_type=content_type,
+                target_words=TARGET_WORDS[content_type]
+            )
+            next_tier = self.cascade.escalate(tier)
+            if next_tier is None or not self.cascade.needs_confirmation(score, feedback):
+                return score, feedback, word_count
+            emit(
+                ESCALATED,
+                f"  Borderline validation ({score:.1f}) on {tier}, re-checking on {next_tier}...",
+                stage="validation", score=score, tier=tier, next_tier=next_tier
+            )
+            tier = next_tier
+        
+    def _generate_and_validate(
+        self,
+        calendar_entry: Dict,
+        stop: Optional[threading.Event] = None,
+        tier: Optional[str] = None,
+        attempt: int = 1,
+        revise_from: Optional[Tuple[str, float, str]] = None
+    ) -> Optional[Tuple[str, float, str, int]]:
+        """Run one generate -> validate round trip for a calendar entry.
         
         Args:
             calendar_entry: Calendar entry dict
+            stop: Optional event; once set, remaining work is skipped
+                (used to cancel best-of-N candidates after one passes)
+            tier: Cascade tier to generate with, or None for the fixed model
+            attempt: 1-based attempt number, recorded in usage accounting
+            revise_from: Optional (draft, score, feedback) of a failed draft
+                to revise instead of generating from scratch
             
         Returns:
-            Dict with generation results
+            Tuple of (content, score, feedback, word_count), or None if skipped
+        """
+        if stop is not None and stop.is_set():
+            return None
+            
+        with usage_attempt(attempt):
+            content = self._generate(calendar_entry, tier, revise_from)
+            
+            if stop is not None and stop.is_set():
+                return None
+                
+            score, feedback, word_count = self._validate(content, _content_type(calendar_entry))
+        return content, score, feedback, word_count
+        
+    def _generate(
+        self,
+        calendar_entry: Dict,
+        tier: Optional[str] = None,
+        revise_from: Optional[Tuple[str, float, str]] = None
+    ) -> str:
+        """Generate (or revise) a draft for a calendar entry.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            tier: Cascade tier to generate with, or None for the fixed model
+            revise_from: Optional (draft, score, feedback) to revise
+            
+        Returns:
+            Generated content
+        """
+        agent, _ = self._agents_for(tier, _content_type(calendar_entry))
+        if revise_from is not None:
+            draft, draft_score, draft_feedback = revise_from
+            return agent.revise(
+                topic=calendar_entry["topic"],
+                lens=calendar_entry["lens"],
+                objective=calendar_entry["objective"],
+                draft=draft,
+                score=draft_score,
+                feedback=draft_feedback
+            )
+        return agent.generate(
+            topic=calendar_entry["topic"],
+            lens=calendar_entry["lens"],
+            objective=calendar_entry["objective"]
+        )
+        
+    def _prevalidate(self, contents: List[str], content_type: str = "LinkedIn"):
+        """Judge drafts in batched calls (batch_validation mode).
+        
+        Results land in the validation cache, so the per-draft _validate
+        calls that follow are lookups; only cascade confirmations of
+        borderline scores still go out individually.
+        
+        Args:
+            contents: Drafts about to be validated
+            content_type: Content type of the drafts
         """
-        print(f"\nGenerating Post #{calendar_entry['post_number']}: {calendar_entry['topic']}")
+        if not self.batch_validation or len(contents) < 2:
+            return
+        tier = self.cascade.first_tier if self.cascade else None
+        _, validator = self._agents_for(tier)
+        validator.validate_many(contents, content_type, TARGET_WORDS[content_type])
+        
+    def _process_best_of_n(
+        self,
+        calendar_entry: Dict,
+        tier: Optional[str] = None,
+        first_attempt: int = 1
+    ) -> Tuple[Optional[str], float, str, int]:
+        """Generate candidates concurrently and keep the best one.
+        
+        All candidates are generated and validated in parallel, so the
+        worst case costs about two LLM round trips of wall-clock time.
+        Outstanding candidates are cancelled as soon as one passes MIN_SCORE.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            tier: Cascade tier to generate with, or None for the fixed model
+            first_attempt: Attempt number of the first candidate
+            
+        Returns:
+            Tuple of (best_content, best_score, best_feedback, attempts)
+        """
+        if self.batch_validation:
+            return self._process_best_of_n_batched(calendar_entry, tier, first_attempt)
+            
+        n = self.parallel_candidates
+        label = f" on {tier}" if tier else ""
+        emit(
+            ATTEMPT, f"  Generating {n} candidates in parallel{label}...",
+            attempt=first_attempt, candidates=n, tier=tier
+        )
         
         best_content = None
         best_score = 0.0
         best_feedback = ""
         attempts = 0
         
-        for attempt in range(self.max_retries):
-            attempts += 1
-            print(f"  Attempt {attempt + 1}/{self.max_retries}...")
-            
-            try:
-                # Generate content
-                content = self.linkedin_agent.generate(
-                    topic=calendar_entry["topic"],
-                    lens=calendar_entry["lens"],
-                    objective=calendar_entry["objective"]
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=n)
+        try:
+            futures = [
+                submit_with_context(
+                    executor,
+                    self._generate_and_validate,
+                    calendar_entry, stop, tier, first_attempt + i
                 )
-                
-                # Validate content
-                score, feedback, word_count = self.validator.validate(
-                    content=content,
-                    content_type="LinkedIn",
-                    target_words="150-250"
+                for i in range(n)
+            ]
+            
+            for future in as_completed(futures):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    attempts += 1
+                    emit(ERROR, f"  Error: {e}", error=str(e))
+                    continue
+                    
+                if outcome is None:
+                    continue
+                    
+                attempts += 1
+                content, score, feedback, word_count = outcome
+                emit(
+                    SCORE, f"  Candidate score: {score:.1f} | Words: {word_count}",
+                    score=score, word_count=word_count, tier=tier, candidate=True
                 )
                 
-                print(f"  Score: {score:.1f} | Words: {word_count}")
-                
-                # Keep track of best attempt
-                if score > best_score:
+                if score > best_score and not precheck_failed(feedback):
                     best_content = content
                     best_score = score
                     best_feedback = feedback
                     
-                # Check if passing
                 if score >= MIN_SCORE:
-                    print(f"  ✓ Passed validation (score: {score:.1f})")
+                    emit(PASSED, f"  ✓ Passed validation (score: {score:.1f})", score=score)
+                    stop.set()
                     break
-                else:
-                    print(f"  ✗ Failed validation (score: {score:.1f} < {MIN_SCORE})")
-                    
+            else:
+                emit(
+                    FAILED,
+                    f"  ✗ No candidate passed validation (best: {best_score:.1f} < {MIN_SCORE})",
+                    score=best_score
+                )
+        finally:
+            # Don't wait for in-flight candidates once we have a winner;
+            # the stop event keeps them from issuing their validation call.
+            executor.shutdown(wait=False, cancel_futures=True)
+            
+        return best_content, best_score, best_feedback, attempts
+        
+    def generate_drafts(self, calendar_entries: List[Dict]) -> Dict[int, str]:
+        """Pre-generate first drafts several posts per call (posts_per_call > 1).
+        
+        Only LinkedIn entries can be drafted together; other content types
+        are left out. Entries are grouped by calendar week, then into chunks
+        of posts_per_call. A group whose call fails simply yields no drafts.
+        
+        Args:
+            calendar_entries: Calendar entries to draft
+            
+        Returns:
+            Dict mapping post_number to draft for posts that parsed cleanly
+        """
+        if self.posts_per_call <= 1:
+            return {}
+            
+        groups: List[List[Dict]] = []
+        for entry in calendar_entries:
+            if _content_type(entry) != "LinkedIn":
+                continue
+            last = groups[-1] if groups else None
+            if last and last[0]["week"] == entry["week"] and len(last) < self.posts_per_call:
+                last.append(entry)
+            else:
+                groups.append([entry])
+                
+        tier = self.cascade.first_tier if self.cascade else None
+        linkedin_agent, _ = self._agents_for(tier)
+        drafts: Dict[int, str] = {}
+        for group in groups:
+            if len(group) < 2:
+                continue
+            numbers = [entry["post_number"] for entry in group]
+            try:
+                group_drafts = linkedin_agent.generate_many(group)
             except Exception as e:
-                print(f"  Error: {e}")
+                emit(
+                    ERROR, f"  Warning: multi-post call for posts {numbers} failed: {e}",
+                    error=str(e), posts=numbers
+                )
                 continue
+            emit(
+                NOTE, f"  Drafted {len(group_drafts)}/{len(group)} posts {numbers} in one call",
+                posts=numbers, drafted=sorted(group_drafts)
+            )
+            drafts.update(group_drafts)
+            
+        self._prevalidate(list(drafts.values()))
+        return drafts
+        
+    def _process_best_of_n_batched(
+        self,
+        calendar_entry: Dict,
+        tier: Optional[str] = None,
+        first_attempt: int = 1
+    ) -> Tuple[Optional[str], float, str, int]:
+        """Best-of-N with all candidates judged in one batched validation call.
+        
+        Trades the early exit of _process_best_of_n (which stops once a
+        candidate passes) for one validation request instead of N.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            tier: Cascade tier to generate with, or None for the fixed model
+            first_attempt: Attempt number of the first candidate
+            
+        Returns:
+            Tuple of (best_content, best_score, best_feedback, attempts)
+        """
+        n = self.parallel_candidates
+        label = f" on {tier}" if tier else ""
+        emit(
+            ATTEMPT, f"  Generating {n} candidates in parallel{label} (batched validation)...",
+            attempt=first_attempt, candidates=n, tier=tier
+        )
+        
+        def generate(attempt: int) -> str:
+            with usage_attempt(attempt):
+                return self._generate(calendar_entry, tier)
+                
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            futures = [
+                submit_with_context(executor, generate, first_attempt + i)
+                for i in range(n)
+            ]
+            
+        contents = []
+        for future in futures:
+            try:
+                contents.append(future.result())
+            except Exception as e:
+                emit(ERROR, f"  Error: {e}", error=str(e))
+                
+        content_type = _content_type(calendar_entry)
+        self._prevalidate(contents, content_type)
+        
+        best_content = None
+        best_score = 0.0
+        best_feedback = ""
+        for content in contents:
+            score, feedback, word_count = self._validate(content, content_type)
+            emit(
+                SCORE, f"  Candidate score: {score:.1f} | Words: {word_count}",
+                score=score, word_count=word_count, tier=tier, candidate=True
+            )
+            if score > best_score and not precheck_failed(feedback):
+                best_content = content
+                best_score = score
+                best_feedback = feedback
+                
+        if best_score >= MIN_SCORE:
+            emit(PASSED, f"  ✓ Passed validation (score: {best_score:.1f})", score=best_score)
+        else:
+            emit(
+                FAILED,
+                f"  ✗ No candidate passed validation (best: {best_score:.1f} < {MIN_SCORE})",
+                score=best_score
+            )
+        return best_content, best_score, best_feedback, n
+        
+    def process_single(self, calendar_entry: Dict, draft: Optional[str] = None) -> Dict:
+        """Process a single calendar entry.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            draft: Optional pre-generated first draft (see generate_drafts);
+                it is validated as the first attempt
+            
+        Returns:
+            Dict with generation results, including a "usage" summary of
+            the LLM calls made for this entry and its wall-clock "elapsed"
+            seconds. Unexpected errors produce a failed result instead of
+            propagating.
+        """
+        post_number = calendar_entry["post_number"]
+        started = time.monotonic()
+        with track_usage() as usage, self._reporting(), event_scope(post_number, usage), \
+                self._seeded(post_number):
+            emit(
+                ENTRY_STARTED, f"\nGenerating {_entry_label(calendar_entry)}",
+                topic=calendar_entry["topic"], content_type=_content_type(calendar_entry)
+            )
+            try:
+                result = self._run_attempts(calendar_entry, draft)
+            except Exception as e:
+                # One broken entry shouldn't take the rest of the batch down
+                emit(ERROR, f"  Error processing post #{post_number}: {e}", error=str(e))
+                result = self._build_result(calendar_entry, None, 0.0, f"Error: {e}", 0)
+        result["usage"] = usage.summary()
+        result["elapsed"] = round(time.monotonic() - started, 3)
+        return result
+        
+    def _reporting(self) -> ContextManager:
+        """Print events to the console while processing, if verbose."""
+        if self._console is None:
+            return nullcontext()
+        return listen(self._console)
+        
+    def _seeded(self, key) -> ContextManager:
+        """Seed the agents' random choices for one task, if a seed is set."""
+        if self.seed is None:
+            return nullcontext()
+        return seeded(f"{self.seed}:{key}")
+        
+    def _run_attempts(self, calendar_entry: Dict, draft: Optional[str] = None) -> Dict:
+        """Generate and validate until a draft passes or attempts run out.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            draft: Optional pre-generated first draft
+            
+        Returns:
+            Dict with generation results
+        """
+        state = _AttemptState(tier=self.cascade.first_tier if self.cascade else None)
+        
+        if draft is not None:
+            self._attempt(calendar_entry, state, draft)
+            if state.passed:
+                return self._state_result(calendar_entry, state)
+        
+        if self.parallel_candidates > 1:
+            # One best-of-N round per tier; a failed round already holds
+            # several tries, so cascading rounds escalate straight away.
+            rounds = self.cascade.tiers if self.cascade else [None]
+            for tier in rounds:
+                content, score, feedback, round_attempts = self._process_best_of_n(
+                    calendar_entry, tier, first_attempt=state.attempts + 1
+                )
+                state.attempts += round_attempts
+                if score > state.best_score:
+                    state.best_content = content
+                    state.best_score = score
+                    state.best_feedback = feedback
+                    state.best_tier = tier
+                if state.passed:
+                    break
+                    
+            return self._state_result(calendar_entry, state)
+        
+        if self.pipeline:
+            return self._run_pipelined(
+                calendar_entry, state.best_content, state.best_score, state.best_feedback,
+                state.best_tier, state.attempts
+            )
+        
+        while state.attempts < self.max_retries and not state.passed:
+            self._attempt(calendar_entry, state)
+            
+        return self._state_result(calendar_entry, state)
+        
+    def _attempt(
+        self,
+        calendar_entry: Dict,
+        state: "_AttemptState",
+        draft: Optional[str] = None
+    ):
+        """Make one sequential attempt and fold its outcome into the state.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            state: The entry's attempt state, updated in place
+            draft: Optional pre-generated draft to validate instead of
+                generating one
+        """
+        state.attempts += 1
+        if draft is None:
+            # A multi-post draft doesn't count against its tier's attempts
+            state.tier_attempts += 1
+        attempt = state.attempts
+        tier = state.tier
+        
+        revise_from = None
+        if draft is not None:
+            emit(
+                ATTEMPT, f"  Attempt {attempt} (multi-post draft)...",
+                attempt=attempt, tier=tier, draft=True
+            )
+        else:
+            label = f" [{tier}]" if tier else ""
+            revise_from = self._revision_source(
+                state.best_content, state.best_score, state.best_feedback,
+                _content_type(calendar_entry)
+            )
+            if revise_from is not None:
+                state.revisions += 1
+                label += " (revising)"
+            emit(
+                ATTEMPT, f"  Attempt {attempt}/{self.max_retries}{label}...",
+                attempt=attempt, max_attempts=self.max_retries, tier=tier,
+                revising=revise_from is not None
+            )
+            
+        score = None
+        error = None
+        try:
+            # Generate (or revise) and validate content
+            if draft is not None:
+                content = draft
+                with usage_attempt(attempt):
+                    score, feedback, word_count = self._validate(
+                        draft, _content_type(calendar_entry)
+                    )
+            else:
+                content, score, feedback, word_count = self._generate_and_validate(
+                    calendar_entry, tier=tier, attempt=attempt, revise_from=revise_from
+                )
                 
-        # Prepare result
+            emit(
+                SCORE, f"  Score: {score:.1f} | Words: {word_count}",
+                attempt=attempt, score=score, word_count=word_count, tier=tier
+            )
+            
+            # Keep track of best attempt
+            if score > state.best_score and not precheck_failed(feedback):
+                state.best_content = content
+                state.best_score = score
+                state.best_feedback = feedback
+                state.best_tier = tier
+                
+            # Check if passing
+            if score >= MIN_SCORE:
+                emit(
+                    PASSED, f"  ✓ Passed validation (score: {score:.1f})",
+                    attempt=attempt, score=score
+                )
+                return
+            emit(
+                FAILED, f"  ✗ Failed validation (score: {score:.1f} < {MIN_SCORE})",
+                attempt=attempt, score=score
+            )
+            
+        except Exception as e:
+            error = e
+            emit(ERROR, f"  Error: {e}", attempt=attempt, error=str(e))
+            
+        if self.cascade is not None and draft is None:
+            next_tier = self.cascade.next_tier(tier, state.tier_attempts, score=score, error=error)
+            if next_tier != tier:
+                emit(
+                    ESCALATED, f"  ↑ Escalating {tier} -> {next_tier}",
+                    stage="generation", tier=tier, next_tier=next_tier
+                )
+                state.tier = next_tier
+                state.tier_attempts = 0
+                
+    def _state_result(self, calendar_entry: Dict, state: "_AttemptState") -> Dict:
+        """Build the result dict from an entry's attempt state."""
+        return self._build_result(
+            calendar_entry, state.best_content, state.best_score, state.best_feedback,
+            state.attempts, state.best_tier, state.revisions
+        )
+        
+    def _revision_source(
+        self,
+        best_content: Optional[str],
+        best_score: float,
+        best_feedback: str,
+        content_type: str = "LinkedIn"
+    ) -> Optional[Tuple[str, float, str]]:
+        """Pick the draft the next attempt should revise, if any.
+        
+        Revise the best failed draft rather than rolling the dice again,
+        unless its feedback is unusable (validation itself failed) or the
+        content type's agent can't revise.
+        
+        Returns:
+            (draft, score, feedback) to revise, or None to generate from scratch
+        """
+        if (
+            self.revise_on_failure
+            and best_content is not None
+            and not best_feedback.startswith("Error during validation")
+            and hasattr(GENERATORS[content_type], "revise")
+        ):
+            return best_content, best_score, best_feedback
+        return None
+        
+    def _run_pipelined(
+        self,
+        calendar_entry: Dict,
+        best_content: Optional[str],
+        best_score: float,
+        best_feedback: str,
+        best_tier: Optional[str],
+        attempts: int
+    ) -> Dict:
+        """Sequential attempts with validation overlapped with the next generation.
+        
+        As soon as a draft is ready, its validation and a speculative draft
+        for the next attempt start together. The speculative draft can only
+        build on drafts already judged, so with revise_on_failure it revises
+        the best draft before the one being validated (or starts from
+        scratch on the second attempt). It is discarded if validation
+        passes, or if the cascade escalates to another tier.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            best_content: Best draft so far (from a multi-post draft), if any
+            best_score: Score of best_content
+            best_feedback: Validator feedback for best_content
+            best_tier: Tier that produced best_content
+            attempts: Attempts already made
+            
+        Returns:
+            Dict with generation results
+        """
+        tier = self.cascade.first_tier if self.cascade else None
+        content_type = _content_type(calendar_entry)
+        # Attempts already made were multi-post drafts, which (as in
+        # _attempt) don't count against the tier
+        tier_attempts = 0
+        revisions = 0
+        discarded = 0
+        
+        def generate(
+            attempt: int,
+            tier: Optional[str],
+            revise_from: Optional[Tuple[str, float, str]]
+        ) -> str:
+            with usage_attempt(attempt):
+                return self._generate(calendar_entry, tier, revise_from)
+                
+        # (future, tier, revising) of the draft for the next attempt
+        pending: Optional[Tuple[Future, Optional[str], bool]] = None
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            for attempt in range(attempts, self.max_retries):
+                attempts += 1
+                tier_attempts += 1
+                label = f" [{tier}]" if tier else ""
+                
+                speculative = pending is not None and pending[1] == tier
+                if speculative:
+                    draft_future, _, revising = pending
+                    label += " (speculative)"
+                else:
+                    if pending is not None:
+                        pending[0].cancel()
+                        discarded += 1
+                    revise_from = self._revision_source(
+                        best_content, best_score, best_feedback, content_type
+                    )
+                    draft_future = submit_with_context(
+                        executor, generate, attempt + 1, tier, revise_from
+                    )
+                    revising = revise_from is not None
+                pending = None
+                if revising:
+                    revisions += 1
+                    label += " (revising)"
+                emit(
+                    ATTEMPT, f"  Attempt {attempt + 1}/{self.max_retries}{label}...",
+                    attempt=attempt + 1, max_attempts=self.max_retries, tier=tier,
+                    revising=revising, speculative=speculative
+                )
+                
+                score = None
+                error = None
+                try:
+                    content = draft_future.result()
+                    
+                    # Start the next attempt's draft while this one is judged
+                    if attempt + 1 < self.max_retries:
+                        revise_from = self._revision_source(
+                            best_content, best_score, best_feedback, content_type
+                        )
+                        pending = (
+                            submit_with_context(executor, generate, attempt + 2, tier, revise_from),
+                            tier,
+                            revise_from is not None
+                        )
+                        
+                    with usage_attempt(attempt + 1):
+                        score, feedback, word_count = self._validate(content, content_type)
+                    emit(
+                        SCORE, f"  Score: {score:.1f} | Words: {word_count}",
+                        attempt=attempt + 1, score=score, word_count=word_count, tier=tier
+                    )
+                    
+                    if score > best_score and not precheck_failed(feedback):
+                        best_content = content
+                        best_score = score
+                        best_feedback = feedback
+                        best_tier = tier
+                        
+                    if score >= MIN_SCORE:
+                        emit(
+                            PASSED, f"  ✓ Passed validation (score: {score:.1f})",
+                            attempt=attempt + 1, score=score
+                        )
+                        break
+                    else:
+                        emit(
+                            FAILED, f"  ✗ Failed validation (score: {score:.1f} < {MIN_SCORE})",
+                            attempt=attempt + 1, score=score
+                        )
+                        
+                except Exception as e:
+                    error = e
+                    emit(ERROR, f"  Error: {e}", attempt=attempt + 1, error=str(e))
+                    
+                if self.cascade is not None:
+                    next_tier = self.cascade.next_tier(
+                        tier, tier_attempts, score=score, error=error
+                    )
+                    if next_tier != tier:
+                        emit(
+                            ESCALATED, f"  ↑ Escalating {tier} -> {next_tier}",
+                            stage="generation", tier=tier, next_tier=next_tier
+                        )
+                        tier = next_tier
+                        tier_attempts = 0
+        finally:
+            if pending is not None:
+                # An in-flight generation can't be recalled; its result is dropped
+                pending[0].cancel()
+                discarded += 1
+            executor.shutdown(wait=False, cancel_futures=True)
+            
+        if discarded:
+            emit(NOTE, f"  Discarded {discarded} speculative draft(s)", discarded=discarded)
+        result = self._build_result(
+            calendar_entry, best_content, best_score, best_feedback, attempts, best_tier,
+            revisions
+        )
+        result["speculative_discarded"] = discarded
+        return result
+        
+    def _build_result(
+        self,
+        calendar_entry: Dict,
+        best_content: Optional[str],
+        best_score: float,
+        best_feedback: str,
+        attempts: int,
+        tier: Optional[str] = None,
+        revisions: int = 0
+    ) -> Dict:
+        """Build the result dict for a processed calendar entry.
+        
+        Args:
+            calendar_entry: Calendar entry dict
+            best_content: Best generated content, if any
+            best_score: Score of the best content
+            best_feedback: Validator feedback for the best content
+            attempts: Number of generation attempts made
+            tier: Cascade tier that produced the best content, if cascading
+            revisions: Number of attempts that revised an earlier draft
+            
+        Returns:
+            Dict with generation results
+        """
+        if tier is None and self.cascade is None:
+            tier = tier_for_model(self.model)
+            
+        passed = best_score >= MIN_SCORE
+        
         result = {
             "post_number": calendar_entry["post_number"],
             "week": calendar_entry["week"],
             "topic": calendar_entry["topic"],
             "lens": calendar_entry["lens"],
             "objective": calendar_entry["objective"],
-            "content": best_content or "Failed to generate content",
+            "content_type": _content_type(calendar_entry),
+            "content": best_content or FAILED_CONTENT,
             "score": best_score,
             "feedback": best_feedback,
             "attempts": attempts,
-            "passed": best_score >= MIN_SCORE,
+            "attempts_to_pass": attempts if passed else None,
+            "revisions": revisions,
+            "passed": passed,
             "word_count": len(best_content.split()) if best_content else 0,
+            "tier": tier,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -185,81 +1169,970 @@ class BatchProcessor:
         
     def process_batch(
         self,
-        calendar: Optional[List[Dict]] = None,
-        start_post: int = 4,
-        end_post: int = 12
+        calendar: Optional[Union[str, Iterable[Dict]]] = None,
+        start_post: Optional[int] = None,
+        end_post: Optional[int] = None,
+        progress: Optional[Callable[[int, Optional[int], Dict], None]] = None,
+        journal: Optional[str] = None,
+        resume: bool = False,
+        sink: Optional[ResultSink] = None,
+        keep_results: bool = True,
+        where: Optional[CalendarFilter] = None,
+        on_event: Optional[Callable[[BatchEvent], None]] = None,
+        budget: Optional[BatchBudget] = None
     ) -> List[Dict]:
         """Process batch of posts from calendar.
         
+        The calendar is consumed lazily: entries are read, filtered and
+        handed to workers as slots free up, so a calendar file far larger
+        than memory can be processed (with a sink and keep_results=False).
+        Up to ``concurrency`` entries are processed at once (per worker
+        process, with workers); returned results are in calendar order
+        either way. A post range on a JSONL or CSV file is read through a
+        CalendarIndex instead, so the batch knows its size upfront and
+        processes the range in post-number order.
+        
+        With a journal, every finished entry is appended to it (and
+        fsynced) as soon as it completes. Entries the journal already holds
+        a passing result for are never regenerated; with resume, failed
+        entries in the journal are kept as well, so an interrupted run
+        picks up where it stopped.
+        
+        Progress is reported as BatchEvents (see core.events): entry
+        started, attempt, score, passed, failed, entry finished (with
+        throughput and ETA) and so on. With verbose set they are printed;
+        on_event receives them too, or use iter_events to consume them as
+        an iterator.
+        
         Args:
-            calendar: Custom calendar or None for default
-            start_post: Starting post number (inclusive)
-            end_post: Ending post number (inclusive)
+            calendar: Calendar file path (.jsonl, .csv, .yaml), iterable of
+                entries, or None for CONTENT_CALENDAR
+            start_post: Starting post number (inclusive), None for no bound
+            end_post: Ending post number (inclusive), None for no bound
+            progress: Optional callback(done, total, result), called on the
+                calling thread as each entry finishes (in completion order);
+                total is None when the calendar's length isn't known upfront
+            journal: Optional JSONL journal path
+            resume: Also skip entries the journal holds a failed result for
+            sink: Optional sink each result is written to as soon as its
+                entry finishes (in completion order)
+            keep_results: Hold results in memory and return them; turn off
+                with a sink to keep memory flat on large calendars
+            where: Optional further selection (weeks, lenses, objectives,
+                dates, brands)
+            on_event: Optional callback(event), called on whichever thread
+                emits the event, so it must be thread-safe. With workers,
+                only batch-level and entry finished events reach it.
+            budget: Optional token/cost/deadline limits. Attempts are then
+                scheduled one at a time across entries (see
+                _process_scheduled); entries the budget didn't reach are
+                returned with a "skipped" reason. Not combined with
+                workers, best-of-N, pipelining or multi-post drafts.
             
         Returns:
-            List of results for each post
+            List of results for each post (empty if keep_results is False)
+            
+        Raises:
+            ValueError: If a budget is given to a processor set up with
+                workers, parallel_candidates, pipeline or posts_per_call
         """
+        if budget is not None:
+            unsupported = [
+                option for option, used in (
+                    ("workers", self.workers),
+                    ("parallel_candidates", self.parallel_candidates > 1),
+                    ("pipeline", self.pipeline),
+                    ("posts_per_call", self.posts_per_call > 1),
+                ) if used
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"Budgeted batches run one attempt at a time and can't be combined "
+                    f"with {', '.join(unsupported)}"
+                )
+                
+        total = None
         if calendar is None:
             calendar = CONTENT_CALENDAR
+        elif isinstance(calendar, str):
+            ranged = start_post is not None or end_post is not None
+            if ranged and CalendarIndex.supports(calendar):
+                # Only offsets are kept, and the range size is known before
+                # the first entry is loaded
+                index = CalendarIndex(calendar)
+                if where is None:
+                    total = index.count(start_post, end_post)
+                calendar = index.entries(start_post, end_post)
+            else:
+                calendar = read_calendar(calendar)
             
         # Filter calendar
-        entries = [
-            entry for entry in calendar
-            if start_post <= entry["post_number"] <= end_post
+        selection = CalendarFilter(start_post=start_post, end_post=end_post)
+        entries: Iterable[Dict] = selection.apply(calendar)
+        if where is not None:
+            entries = where.apply(entries)
+        if isinstance(calendar, list):
+            entries = list(entries)
+            total = len(entries)
+        
+        bounds = f"Posts {start_post or 'first'}-{end_post or 'last'}"
+        rule = "=" * 60
+        batch_journal = BatchJournal(journal, self._settings_key()) if journal else None
+        stats = BatchStats()
+        listening = listen(on_event) if on_event is not None else nullcontext()
+        try:
+            with listening, self._reporting(), track_usage() as usage, event_scope(tracker=usage):
+                emit(
+                    BATCH_STARTED,
+                    f"\n{rule}\nBatch Processing: {bounds}"
+                    + (f" ({total} posts)" if total is not None else "")
+                    + f"\n{rule}",
+                    total=total, start_post=start_post, end_post=end_post
+                )
+                results = self._process_entries(
+                    entries, total, progress, batch_journal, resume, sink, stats, keep_results,
+                    budget
+                )
+                self.last_usage = usage.summary()
+                
+                # Summary
+                lines = [
+                    f"\n{rule}",
+                    f"Batch Complete: {stats.passed}/{stats.total} posts passed validation"
+                ]
+                if stats.reused:
+                    lines.append(f"Reused {stats.reused} finished post(s) from {journal}")
+                if stats.stop_reason:
+                    lines.append(
+                        f"Stopped at the {stats.stop_reason}: {stats.stopped} post(s) cut short, "
+                        f"{len(stats.skipped)} skipped"
+                    )
+                    if stats.skipped:
+                        shown = ", ".join(f"#{n}" for n in stats.skipped[:20])
+                        more = len(stats.skipped) - 20
+                        if more > 0:
+                            shown += f" and {more} more"
+                        lines.append(f"Skipped: {shown}")
+                if sink is not None:
+                    lines.append(f"Results streamed to {sink.path}")
+                tier_mix = stats.tiers()
+                if tier_mix:
+                    mix = ", ".join(f"{tier}={count}" for tier, count in tier_mix.items())
+                    lines.append(f"Tier mix (accepted posts): {mix}")
+                effort = stats.attempts()
+                if effort["accepted"]:
+                    lines.append(
+                        f"Attempts to pass: {effort['mean_attempts_to_pass']:.2f} mean | "
+                        f"LLM calls per accepted post: {effort['llm_calls_per_accepted']:.1f} | "
+                        f"Revisions: {effort['revisions']}"
+                    )
+                lines.append(format_usage(self.last_usage))
+                lines.append(f"{rule}\n")
+                emit(
+                    BATCH_FINISHED, "\n".join(lines),
+                    total=stats.total, passed=stats.passed, reused=stats.reused,
+                    skipped=stats.skipped, stop_reason=stats.stop_reason,
+                    usage=self.last_usage, results=results
+                )
+        finally:
+            if batch_journal is not None:
+                batch_journal.close()
+        
+        return results
+        
+    def iter_events(self, **kwargs) -> Iterator[BatchEvent]:
+        """Run process_batch in the background and yield its events.
+        
+        Events are yielded on the calling thread as they happen, which
+        suits UIs that may only be updated from their own thread. The last
+        event is BATCH_FINISHED; its data holds the results. Stopping
+        early doesn't stop the batch. The batch runs in a copy of the
+        calling context, so usage tracked there includes it.
+        
+        Args:
+            **kwargs: process_batch arguments (except on_event)
+            
+        Yields:
+            BatchEvents in the order they were emitted
+            
+        Raises:
+            Whatever process_batch raised, after the events before it
+        """
+        events: Queue = Queue()
+        finished = object()
+        errors: List[BaseException] = []
+        
+        def run():
+            try:
+                self.process_batch(on_event=events.put, **kwargs)
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                events.put(finished)
+                
+        # Run in a copy of the caller's context so usage trackers and event
+        # listeners it has in scope still see the batch's calls
+        context = contextvars.copy_context()
+        thread = threading.Thread(
+            target=context.run, args=(run,), name="batch-events", daemon=True
+        )
+        thread.start()
+        while True:
+            event = events.get()
+            if event is finished:
+                break
+            yield event
+        thread.join()
+        if errors:
+            raise errors[0]
+        
+    def _process_entries(
+        self,
+        entries: Iterable[Dict],
+        total: Optional[int] = None,
+        progress: Optional[Callable[[int, Optional[int], Dict], None]] = None,
+        journal: Optional[BatchJournal] = None,
+        resume: bool = False,
+        sink: Optional[ResultSink] = None,
+        stats: Optional[BatchStats] = None,
+        keep_results: bool = True,
+        budget: Optional[BatchBudget] = None
+    ) -> List[Dict]:
+        """Process entries with at most ``concurrency`` in flight.
+        
+        Args:
+            entries: Calendar entries in calendar order (consumed lazily)
+            total: Number of entries, if known
+            progress: Optional callback(done, total, result)
+            journal: Optional journal; finished entries found in it are
+                reused and new results are appended to it
+            resume: Reuse failed journaled results too
+            sink: Optional sink each result is written to
+            stats: Optional running totals each result is added to
+            keep_results: Whether to collect and return the results
+            budget: Optional limits; attempts are then scheduled by
+                _process_scheduled
+            
+        Returns:
+            Results in the order of entries (empty if keep_results is False)
+        """
+        results: Dict[int, Dict] = {}
+        done_count = 0
+        processed = 0
+        started = time.monotonic()
+        
+        def finish(i: int, entry: Dict, result: Dict, reused: bool = False):
+            nonlocal done_count, processed
+            # Skipped entries weren't attempted, so a later run should do them
+            skipped = bool(result.get("skipped"))
+            if reused:
+                result = dict(result, resumed=True)
+            elif journal is not None and not skipped:
+                journal.append(entry_key(entry), result)
+            if sink is not None and not skipped:
+                sink.write(result)
+            if stats is not None:
+                stats.add(result, reused=reused)
+            if keep_results:
+                results[i] = result
+            done_count += 1
+            processed += not (reused or skipped)
+            
+            # Throughput counts only entries processed in this run
+            elapsed = time.monotonic() - started
+            rate = processed / elapsed if processed and elapsed > 0 else None
+            eta = None
+            if rate and total is not None:
+                eta = (total - done_count) / rate
+            if skipped:
+                outcome = "skipped"
+            else:
+                outcome = "reused" if reused else "passed" if result["passed"] else "failed"
+            message = (
+                f"  [{done_count}/{total if total is not None else '?'}] "
+                f"Post #{result['post_number']} {outcome} ({result['score']:.1f})"
+            )
+            if rate:
+                message += f" | {rate * 60:.1f} posts/min"
+            if total is not None:
+                message += f" | ETA {format_eta(eta)}"
+            emit(
+                ENTRY_FINISHED, message,
+                post_number=result["post_number"], done=done_count, total=total,
+                passed=result["passed"], score=result["score"], reused=reused, skipped=skipped,
+                entry_elapsed=result.get("elapsed"),
+                entry_tokens=result.get("usage", {}).get("total_tokens", 0),
+                posts_per_minute=rate * 60 if rate else None, eta=eta, result=result
+            )
+            if progress:
+                progress(done_count, total, result)
+                
+        def todo() -> Iterator[Tuple[int, Dict, Optional[str]]]:
+            """Entries still to process, with multi-post drafts where enabled."""
+            group: List[Tuple[int, Dict]] = []
+            for i, entry in enumerate(entries):
+                prior = journal.get(entry_key(entry)) if journal is not None else None
+                if prior is not None and (prior["passed"] or resume):
+                    finish(i, entry, prior, reused=True)
+                    continue
+                if (
+                    self.posts_per_call <= 1 or self.workers or budget is not None
+                    or _content_type(entry) != "LinkedIn"
+                ):
+                    yield i, entry, None
+                    continue
+                # Draft one week's group at a time rather than the whole calendar
+                if group and (
+                    group[0][1]["week"] != entry["week"] or len(group) >= self.posts_per_call
+                ):
+                    yield from self._drafted(group)
+                    group = []
+                group.append((i, entry))
+            if group:
+                yield from self._drafted(group)
+                
+        pending = todo()
+        if budget is not None:
+            self._process_scheduled(pending, finish, budget, stats)
+            return [results[i] for i in sorted(results)]
+        if self.workers:
+            self._process_queued(pending, finish, resume)
+            return [results[i] for i in sorted(results)]
+        if self.concurrency == 1:
+            for i, entry, draft in pending:
+                finish(i, entry, self.process_single(entry, draft))
+            return [results[i] for i in sorted(results)]
+            
+        # Submit entries as slots free up rather than all at once, so only
+        # `concurrency` entries are ever running. An entry whose content type
+        # is at its limit is held back while later entries of other types
+        # start; at most `concurrency` entries are held at a time.
+        in_flight: Dict[Future, Tuple[int, Dict]] = {}
+        running: Counter = Counter()
+        held: List[Tuple[int, Dict, Optional[str]]] = []
+        exhausted = False
+        
+        def has_slot(entry: Dict) -> bool:
+            content_type = _content_type(entry)
+            return running[content_type] < self._type_limit(content_type)
+            
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch")
+        try:
+            while True:
+                while len(in_flight) < self.concurrency:
+                    item = next((item for item in held if has_slot(item[1])), None)
+                    if item is not None:
+                        held.remove(item)
+                    elif exhausted or len(held) >= self.concurrency:
+                        break
+                    else:
+                        item = next(pending, None)
+                        if item is None:
+                            exhausted = True
+                            break
+                        if not has_slot(item[1]):
+                            held.append(item)
+                            continue
+                    i, entry, draft = item
+                    future = submit_with_context(executor, self.process_single, entry, draft)
+                    in_flight[future] = (i, entry)
+                    running[_content_type(entry)] += 1
+                if not in_flight:
+                    break
+                    
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, entry = in_flight.pop(future)
+                    running[_content_type(entry)] -= 1
+                    finish(i, entry, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            
+        return [results[i] for i in sorted(results)]
+        
+    def _process_scheduled(
+        self,
+        pending: Iterator[Tuple[int, Dict, Optional[str]]],
+        finish: Callable[[int, Dict, Dict], None],
+        budget: BatchBudget,
+        stats: Optional[BatchStats] = None
+    ):
+        """Schedule single attempts across entries within a budget.
+        
+        Every entry gets its first attempt before any entry gets a retry,
+        so one hard post can't use up the budget while easy ones wait;
+        within an attempt count, earlier weeks and higher priorities go
+        first (see core.scheduler). Up to ``concurrency`` attempts run at
+        once, within each content type's limit. Before starting an attempt,
+        its predicted tokens, cost and duration (CostModel) plus what is
+        already spent and in flight are checked against the budget. Once one
+        doesn't fit even with nothing in flight, nothing more is started:
+        entries already attempted finish with their best draft (marked
+        "stopped") and the rest are reported as "skipped".
+        
+        Args:
+            pending: (index, entry, draft) to process, all read upfront;
+                drafts are ignored
+            finish: Callback(index, entry, result) for each finished entry
+            budget: Token, cost and deadline limits
+            stats: Optional running totals; records the stop reason
+        """
+        first_tier = self.cascade.first_tier if self.cascade else None
+        jobs = [
+            _ScheduledEntry(i, entry, _AttemptState(tier=first_tier))
+            for i, entry, _ in pending
         ]
+        heap = [(schedule_key(job.entry, 0, job.index), n) for n, job in enumerate(jobs)]
+        heapq.heapify(heap)
+        cost_model = CostModel()
+        spent_tokens = 0
+        spent_cost = 0.0
+        # Predicted (tokens, cost) of attempts in flight
+        reserved_tokens = 0
+        reserved_cost = 0.0
+        stop_reason = None
         
-        print(f"\n{'='*60}")
-        print(f"Batch Processing: Posts {start_post}-{end_post} ({len(entries)} posts)")
-        print(f"{'='*60}")
+        in_flight: Dict[Future, Tuple[int, int, float]] = {}
+        running: Counter = Counter()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch")
+        try:
+            while True:
+                # Attempts of content types at their limit wait for the next round
+                blocked = []
+                while stop_reason is None and heap and len(in_flight) < self.concurrency:
+                    n = heap[0][1]
+                    job = jobs[n]
+                    content_type = _content_type(job.entry)
+                    if running[content_type] >= self._type_limit(content_type):
+                        blocked.append(heapq.heappop(heap))
+                        continue
+                    tokens, cost, seconds = cost_model.predict(
+                        content_type, self._model_for(job.state.tier)
+                    )
+                    reason = budget.exceeded_by(
+                        spent_tokens + reserved_tokens + tokens,
+                        spent_cost + reserved_cost + cost,
+                        seconds
+                    )
+                    if reason is not None:
+                        # In-flight attempts may come in under their
+                        # prediction, so only stop once nothing is running
+                        if not in_flight:
+                            stop_reason = reason
+                        break
+                    heapq.heappop(heap)
+                    future = submit_with_context(executor, self._scheduled_attempt, job)
+                    in_flight[future] = (n, tokens, cost)
+                    running[content_type] += 1
+                    reserved_tokens += tokens
+                    reserved_cost += cost
+                for item in blocked:
+                    heapq.heappush(heap, item)
+                if not in_flight:
+                    break
+                    
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    n, tokens, cost = in_flight.pop(future)
+                    reserved_tokens -= tokens
+                    reserved_cost -= cost
+                    job = jobs[n]
+                    running[_content_type(job.entry)] -= 1
+                    prompt_tokens, completion_tokens, attempt_cost, seconds = future.result()
+                    spent_tokens += prompt_tokens + completion_tokens
+                    spent_cost += attempt_cost
+                    cost_model.observe(
+                        _content_type(job.entry), prompt_tokens, completion_tokens, seconds
+                    )
+                    if job.state.passed or job.state.attempts >= self.max_retries:
+                        finish(job.index, job.entry, self._scheduled_result(job))
+                    else:
+                        key = schedule_key(job.entry, job.state.attempts, job.index)
+                        heapq.heappush(heap, (key, n))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            
+        if stop_reason is None:
+            return
+        if stats is not None:
+            stats.stop_reason = stop_reason
+        emit(
+            NOTE, f"\nStopping: the next attempt would exceed the {stop_reason} "
+            f"({len(heap)} post(s) unfinished)",
+            stop_reason=stop_reason, unfinished=len(heap),
+            spent_tokens=spent_tokens, spent_cost=round(spent_cost, 6)
+        )
+        for _, n in sorted(heap):
+            job = jobs[n]
+            if job.state.attempts:
+                result = self._scheduled_result(job)
+                result["stopped"] = stop_reason
+            else:
+                result = self._build_result(
+                    job.entry, None, 0.0, f"Skipped: {stop_reason} reached", 0
+                )
+                result["skipped"] = stop_reason
+            finish(job.index, job.entry, result)
+            
+    def _scheduled_attempt(self, job: _ScheduledEntry) -> Tuple[int, int, float, float]:
+        """Run the next attempt of a scheduled entry.
         
-        results = []
-        for entry in entries:
-            result = self.process_single(entry)
-            results.append(result)
+        Args:
+            job: Scheduled entry; its state and usage are updated
             
-        # Summary
-        passed = sum(1 for r in results if r["passed"])
-        print(f"\n{'='*60}")
-        print(f"Batch Complete: {passed}/{len(results)} posts passed validation")
-        print(f"{'='*60}\n")
+        Returns:
+            Tuple of (prompt_tokens, completion_tokens, cost, seconds) the
+            attempt used
+        """
+        post_number = job.entry["post_number"]
+        before = dict(job.usage.totals)
+        started = time.monotonic()
+        with self._reporting(), track_usage(job.usage), event_scope(post_number, job.usage), \
+                self._seeded(f"{post_number}:{job.state.attempts + 1}"):
+            if job.state.attempts == 0:
+                emit(
+                    ENTRY_STARTED, f"\nGenerating {_entry_label(job.entry)}",
+                    topic=job.entry["topic"], content_type=_content_type(job.entry)
+                )
+            else:
+                emit(NOTE, f"\nBack to Post #{post_number} (attempt {job.state.attempts + 1})")
+            try:
+                self._attempt(job.entry, job.state)
+            except Exception as e:
+                # Give up on this entry, not the batch
+                emit(ERROR, f"  Error processing post #{post_number}: {e}", error=str(e))
+                job.state.attempts = self.max_retries
+                job.state.best_feedback = job.state.best_feedback or f"Error: {e}"
+        seconds = time.monotonic() - started
+        job.elapsed += seconds
+        after = job.usage.totals
+        return (
+            after["prompt_tokens"] - before["prompt_tokens"],
+            after["completion_tokens"] - before["completion_tokens"],
+            after["cost"] - before["cost"],
+            seconds
+        )
         
-        return results
+    def _scheduled_result(self, job: _ScheduledEntry) -> Dict:
+        """Result dict of a scheduled entry, with its usage and elapsed time."""
+        result = self._state_result(job.entry, job.state)
+        result["usage"] = job.usage.summary()
+        result["elapsed"] = round(job.elapsed, 3)
+        return result
+        
+    def _model_for(self, tier: Optional[str]) -> str:
+        """Model an attempt on a cascade tier (or the fixed model) runs on."""
+        if tier is None:
+            return self.model
+        return self.cascade.model_for(tier)
+        
+    def _settings_key(self) -> str:
+        """Key of the settings a finished result depends on (see settings_key).
+        
+        A result generated with other models or another pass threshold
+        isn't reused from a journal or a work queue.
+        """
+        tiers = self.cascade.tiers if self.cascade is not None else [None]
+        return settings_key({
+            "models": [self._model_for(tier) for tier in tiers],
+            "min_score": MIN_SCORE,
+        })
+        
+    def _queue_keys(
+        self,
+        pending: Iterable[Tuple[int, Dict, Optional[str]]]
+    ) -> Iterator[Tuple[int, Dict, str]]:
+        """Work queue key of each pending entry.
+        
+        Entries with the same calendar fields would share a queue row, so
+        a repeat gets its own key (numbered by occurrence, which stays the
+        same across restarts) and is processed separately, with a warning.
         
-    def export_results(self, results: List[Dict], output_file: str = "batch_results.json"):
+        Args:
+            pending: (index, entry, draft) to process
+            
+        Yields:
+            (index, entry, key)
+        """
+        settings = self._settings_key()
+        seen: Counter = Counter()
+        for i, entry, _ in pending:
+            key = f"{entry_key(entry)}:{settings}"
+            seen[key] += 1
+            if seen[key] > 1:
+                emit(
+                    NOTE,
+                    f"  Warning: post #{entry['post_number']} repeats an earlier calendar "
+                    f"entry; processing it separately",
+                    post_number=entry["post_number"], duplicate=True
+                )
+                key = f"{key}:{seen[key]}"
+            yield i, entry, key
+            
+    def _process_queued(
+        self,
+        pending: Iterator[Tuple[int, Dict, Optional[str]]],
+        finish: Callable[[int, Dict, Dict], None],
+        resume: bool = False,
+        poll_interval: float = 0.5
+    ):
+        """Hand entries to worker processes through the work queue.
+        
+        Entries are enqueued as they are read and collected as workers
+        finish them. A worker that dies is replaced; the entry it held is
+        retried by another worker once its lease expires.
+        
+        Args:
+            pending: (index, entry, draft) to process; drafts are ignored
+            finish: Callback(index, entry, result) for each finished entry
+            resume: Keep failed results an interrupted run left in the queue
+            poll_interval: Seconds between checks for finished entries
+        """
+        run = uuid.uuid4().hex
+        queue = WorkQueue(self.queue_path)
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        options = self._worker_options()
+        started = 0
+        
+        def start_worker() -> multiprocessing.Process:
+            nonlocal started
+            worker_id = f"{run[:8]}-{started}"
+            started += 1
+            process = context.Process(
+                target=run_queue_worker,
+                args=(self.queue_path, options, worker_id, stop),
+                name=f"batch-worker-{worker_id}",
+                daemon=True
+            )
+            process.start()
+            return process
+            
+        def collect() -> int:
+            collected = queue.collect(run)
+            for i, entry, result, attempts in collected:
+                if result is None:
+                    result = self._build_result(
+                        entry, None, 0.0, f"Error: worker lease expired {attempts} times", 0
+                    )
+                merge_usage(result.get("usage", {}))
+                finish(i, entry, result)
+            return len(collected)
+            
+        processes = [start_worker() for _ in range(self.workers)]
+        emit(
+            NOTE, f"Started {self.workers} worker processes on {self.queue_path}",
+            workers=self.workers
+        )
+        try:
+            outstanding = 0
+            last_check = time.monotonic()
+            for i, entry, key in self._queue_keys(pending):
+                outstanding += queue.enqueue(key, entry, run, i, resume)
+                if time.monotonic() - last_check >= poll_interval:
+                    outstanding -= collect()
+                    last_check = time.monotonic()
+                    
+            while outstanding:
+                outstanding -= collect()
+                for n, process in enumerate(processes):
+                    if process.exitcode is None:
+                        continue
+                    if started >= self.workers * (QUEUE_MAX_ATTEMPTS + 1):
+                        raise RuntimeError(
+                            f"Batch workers keep exiting (last exit code {process.exitcode})"
+                        )
+                    emit(
+                        NOTE, f"Worker {process.name} exited ({process.exitcode}); replacing it",
+                        worker=process.name, exit_code=process.exitcode
+                    )
+                    processes[n] = start_worker()
+                if outstanding:
+                    time.sleep(poll_interval)
+            queue.purge(run)
+        finally:
+            stop.set()
+            for process in processes:
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
+            queue.close()
+            
+    def _worker_options(self) -> Dict:
+        """Keyword arguments that rebuild this processor in a worker process."""
+        return {
+            "model": self.model,
+            "max_retries": self.max_retries,
+            "parallel_candidates": self.parallel_candidates,
+            "cascade": self.cascade,
+            "revise_on_failure": self.revise_on_failure,
+            "batch_validation": self.batch_validation,
+            "style_scorer": self.style_scorer is not None,
+            "pipeline": self.pipeline,
+            "concurrency": self.concurrency,
+            "type_concurrency": self.type_concurrency,
+            "seed": self.seed,
+        }
+        
+    def _drafted(
+        self,
+        group: List[Tuple[int, Dict]]
+    ) -> Iterator[Tuple[int, Dict, Optional[str]]]:
+        """Draft one group of same-week entries in a single call (posts_per_call > 1)."""
+        with self._seeded(f"drafts:{group[0][1]['post_number']}"):
+            drafts = self.generate_drafts([entry for _, entry in group])
+        for i, entry in group:
+            yield i, entry, drafts.get(entry["post_number"])
+            
+    def export_results(
+        self,
+        results: List[Dict],
+        output_file: str = "batch_results.json",
+        usage: Optional[Dict] = None
+    ):
         """Export batch results to JSON.
         
         Args:
             results: List of result dicts
             output_file: Output filename
+            usage: Optional batch usage summary; when given the file holds
+                {"results": [...], "usage": {...}} instead of a bare list
         """
+        data = results if usage is None else {"results": results, "usage": usage}
         with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+            json.dump(data, f, indent=2)
         print(f"Results exported to {output_file}")
         
-    def run_week_2_4(self) -> List[Dict]:
+    def run_week_2_4(
+        self,
+        journal: Optional[str] = BATCH_JOURNAL_PATH,
+        resume: bool = False,
+        stream: Optional[str] = None,
+        budget: Optional[BatchBudget] = None
+    ) -> List[Dict]:
         """Run batch processor for Week 2-4 (Posts 4-12).
         
+        Args:
+            journal: JSONL journal path (None to run without one)
+            resume: Keep failed posts from the journal instead of retrying them
+            stream: Optional .jsonl/.ndjson/.csv(.gz) file results are
+                streamed to as they finish
+            budget: Optional token/cost/deadline limits
+            
         Returns:
             List of results
         """
-        results = self.process_batch(start_post=4, end_post=12)
-        self.export_results(results, "week_2_4_results.json")
+        sink = open_sink(stream) if stream else None
+        try:
+            results = self.process_batch(
+                start_post=4, end_post=12, journal=journal, resume=resume, sink=sink,
+                budget=budget
+            )
+        finally:
+            if sink is not None:
+                sink.close()
+        self.export_results(results, "week_2_4_results.json", usage=self.last_usage)
         return results
 
 
+def run_queue_worker(
+    queue_path: str,
+    options: Dict,
+    worker_id: str,
+    stop=None,
+    poll_interval: float = 0.5
+):
+    """Claim and process entries from a work queue.
+    
+    Runs in a worker process: it builds its own KnowledgeBase and
+    processor, then each of the processor's ``concurrency`` threads claims
+    one entry at a time, skipping content types the worker already has
+    its limit of in flight. Leases are renewed while entries are in
+    progress, so only a dead worker's entries are handed out again.
+    
+    Args:
+        queue_path: Work queue file
+        options: BatchProcessor keyword arguments (see _worker_options);
+            "style_scorer" is a flag
+        worker_id: Lease owner id
+        stop: Event that ends the worker; without one it exits once the
+            queue has no unfinished entries
+        poll_interval: Seconds to wait when nothing is claimable
+    """
+    options = dict(options)
+    knowledge_base = KnowledgeBase()
+    scorer = None
+    if options.pop("style_scorer"):
+        scorer = StyleScorer(embeddings=knowledge_base.embeddings)
+    processor = BatchProcessor(knowledge_base=knowledge_base, style_scorer=scorer, **options)
+    queue = WorkQueue(queue_path)
+    held: Set[int] = set()
+    running: Counter = Counter()
+    held_lock = threading.Lock()
+    finished = threading.Event()
+    
+    def stopped() -> bool:
+        if stop is not None:
+            return stop.is_set()
+        return queue.unfinished() == 0
+        
+    def renew_leases():
+        while not finished.wait(queue.visibility_timeout / 3):
+            with held_lock:
+                task_ids = list(held)
+            queue.renew(task_ids, worker_id)
+            
+    def work():
+        while not stopped():
+            with held_lock:
+                full = [
+                    content_type for content_type, count in running.items()
+                    if count >= processor._type_limit(content_type)
+                ]
+                task = queue.claim(worker_id, skip_types=full)
+                if task is not None:
+                    held.add(task.id)
+                    running[_content_type(task.entry)] += 1
+            if task is None:
+                time.sleep(poll_interval)
+                continue
+            try:
+                result = processor.process_single(task.entry)
+                if not queue.complete(task.id, worker_id, result):
+                    with processor._reporting():
+                        emit(
+                            NOTE, f"  Lease on post #{task.entry['post_number']} was lost; "
+                            "result dropped",
+                            post_number=task.entry["post_number"], lease_lost=True
+                        )
+            finally:
+                with held_lock:
+                    held.discard(task.id)
+                    running[_content_type(task.entry)] -= 1
+                    
+    renewer = threading.Thread(target=renew_leases, daemon=True)
+    renewer.start()
+    threads = [
+        threading.Thread(target=work, name=f"{worker_id}-{n}") for n in range(processor.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    finished.set()
+    queue.close()
+
+
+def _week_range(value: str) -> Tuple[int, int]:
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+
 def main():
     """Main entry point for batch processing."""
+    parser = argparse.ArgumentParser(description="Content Agent Batch Processor")
+    parser.add_argument(
+        "--calendar",
+        help="calendar file (.jsonl, .csv or .yaml) instead of the built-in Week 2-4 calendar"
+    )
+    parser.add_argument("--start-post", type=int, help="first post number to process")
+    parser.add_argument("--end-post", type=int, help="last post number to process")
+    parser.add_argument("--weeks", type=_week_range, help="week range, e.g. 10-20")
+    parser.add_argument("--lens", action="append", help="only these lenses (repeatable)")
+    parser.add_argument("--objective", action="append", help="only these objectives (repeatable)")
+    parser.add_argument("--brand", action="append", help="only these brands (repeatable)")
+    parser.add_argument("--type", dest="content_type", action="append", choices=list(GENERATORS),
+                        help="only these content types (repeatable)")
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat,
+                        help="only posts dated on or after YYYY-MM-DD")
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat,
+                        help="only posts dated on or before YYYY-MM-DD")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="posts processed at once (per worker process with --workers)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes fed from a SQLite work queue (0 = none)")
+    parser.add_argument("--max-tokens", type=int, help="stop before exceeding this many tokens")
+    parser.add_argument("--max-cost", type=float, help="stop before exceeding this cost in USD")
+    parser.add_argument("--deadline", type=datetime.fromisoformat,
+                        help="stop starting attempts that would end after YYYY-MM-DDTHH:MM")
+    parser.add_argument("--time-limit", type=float,
+                        help="like --deadline, in minutes from now")
+    parser.add_argument(
+        "--journal",
+        default=BATCH_JOURNAL_PATH,
+        help="JSONL journal of finished posts (empty string to disable)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip every post already in the journal, including failed ones"
+    )
+    parser.add_argument(
+        "--stream",
+        help="also write each result as it finishes to a .jsonl, .ndjson or .csv file (.gz ok)"
+    )
+    args = parser.parse_args()
+    
     print("Content Agent Batch Processor")
     print("="*60)
     
+    # Overnight runs: hard limits on spend and wall-clock
+    budget = None
+    deadline = args.deadline.timestamp() if args.deadline else None
+    if args.time_limit is not None:
+        deadline = min(deadline or float("inf"), time.time() + args.time_limit * 60)
+    if args.max_tokens is not None or args.max_cost is not None or deadline is not None:
+        budget = BatchBudget(max_tokens=args.max_tokens, max_cost=args.max_cost, deadline=deadline)
+        if args.workers:
+            parser.error(
+                "--workers can't be combined with --max-tokens, --max-cost, --deadline "
+                "or --time-limit"
+            )
+        
     # Initialize processor
-    processor = BatchProcessor()
+    processor = BatchProcessor(concurrency=args.concurrency, workers=args.workers)
     
-    # Run Week 2-4
-    results = processor.run_week_2_4()
+    if args.calendar is None:
+        # Run Week 2-4
+        results = processor.run_week_2_4(
+            journal=args.journal or None, resume=args.resume, stream=args.stream, budget=budget
+        )
+    else:
+        where = CalendarFilter(
+            weeks=args.weeks,
+            lenses=args.lens,
+            objectives=args.objective,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            brands=args.brand,
+            content_types=args.content_type
+        )
+        sink = open_sink(args.stream) if args.stream else None
+        try:
+            # When streaming, results go to the sink instead of memory
+            results = processor.process_batch(
+                calendar=args.calendar,
+                start_post=args.start_post,
+                end_post=args.end_post,
+                where=where,
+                journal=args.journal or None,
+                resume=args.resume,
+                sink=sink,
+                keep_results=sink is None,
+                budget=budget
+            )
+        finally:
+            if sink is not None:
+                sink.close()
+        if sink is None:
+            output_file = f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            processor.export_results(results, output_file, usage=processor.last_usage)
     
     # Print summary
     for result in results:
+        if result.get("skipped"):
+            print(f"Post {result['post_number']}: - SKIPPED ({result['skipped']})")
+            continue
         status = "✓ PASSED" if result["passed"] else "✗ FAILED"
         print(f"Post {result['post_number']}: {status} (Score: {result['score']:.1f})")
 
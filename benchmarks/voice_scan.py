@@ -0,0 +1,110 @@
+"""Micro-benchmark for the voice rule scanner.
+
+Compares the single-pass VoiceScanner with checking each rule separately
+(one regex per rule plus a substring search per signature phrase) on
+synthetic LinkedIn-length posts, and checks both find the same issues::
+
+    python benchmarks/voice_scan.py --posts 20000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import BANNED_TERMS, SIGNATURE_PHRASES  # noqa: E402
+from core.output_guard import EMOJI_PATTERN  # noqa: E402
+from core.voice_rules import VoiceScanner  # noqa: E402
+
+WORDS = (
+    "teams systems incentives process metrics feedback loops constraints "
+    "behavior execution design ownership clarity roadmap quarter review "
+    "hiring onboarding decisions tradeoffs narrative culture managers the a "
+    "of and to in is that we it for on with"
+).split()
+
+
+def make_posts(count: int, seed: int = 0):
+    """Synthetic 150-250 word posts, some breaking the voice rules."""
+    rng = random.Random(seed)
+    posts = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(150, 250))]
+        if rng.random() < 0.7:
+            words.insert(rng.randrange(len(words)), rng.choice(SIGNATURE_PHRASES) + ".")
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(BANNED_TERMS))
+        if rng.random() < 0.1:
+            words.append("\U0001F680")
+        if rng.random() < 0.1:
+            words.append("#leadership")
+        text = " ".join(words)
+        posts.append(text + ("?" if rng.random() < 0.1 else "."))
+    return posts
+
+
+def separate_checks(content: str):
+    """Per-rule checks, the way the validator ran them before the scanner."""
+    banned_pattern = re.compile(
+        r'\b(' + '|'.join(re.escape(term) for term in BANNED_TERMS) + r')\b', re.I
+    )
+    lowered = content.lower()
+    return (
+        len(content.split()),
+        bool(EMOJI_PATTERN.search(content)),
+        content.strip().endswith("?"),
+        sorted({m.group(1).lower() for m in banned_pattern.finditer(content)}),
+        bool(re.search(r'(?<![\w&])#[A-Za-z]\w*', content)),
+        any(phrase.lower() in lowered for phrase in SIGNATURE_PHRASES),
+    )
+
+
+def scanner_checks(scanner: VoiceScanner, content: str):
+    report = scanner.scan(content)
+    return (
+        report.word_count,
+        bool(report.emojis),
+        report.ends_with_question,
+        report.banned_terms,
+        bool(report.hashtags),
+        report.has_signature_phrase,
+    )
+
+
+def rate(fn, posts, repeat: int) -> float:
+    """Best-of-repeat posts per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for post in posts:
+            fn(post)
+        best = min(best, time.perf_counter() - start)
+    return len(posts) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Voice rule scanner benchmark")
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    posts = make_posts(args.posts)
+    scanner = VoiceScanner()
+
+    mismatches = sum(
+        separate_checks(post) != scanner_checks(scanner, post) for post in posts
+    )
+    separate = rate(separate_checks, posts, args.repeat)
+    single = rate(lambda post: scanner_checks(scanner, post), posts, args.repeat)
+
+    print(f"{args.posts} posts, {mismatches} disagreements")
+    print(f"separate checks: {separate:10,.0f} posts/s")
+    print(f"voice scanner:   {single:10,.0f} posts/s  ({single / separate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Model cascade policy: start on the cheapest tier, escalate on failure."""
+
+from typing import List, Optional
+
+import openai
+
+from core.config import (
+    MODELS,
+    MIN_SCORE,
+    CASCADE_TIERS,
+    CASCADE_ESCALATE_BELOW,
+    CASCADE_ATTEMPTS_PER_TIER,
+    CASCADE_VALIDATION_BAND,
+)
+from core.hedging import CircuitOpenError
+
+
+# Errors that say "this model can't do this request" rather than "try again":
+# a higher tier may succeed where retrying the same one won't.
+ESCALATING_ERRORS = (
+    CircuitOpenError,
+    openai.BadRequestError,
+    openai.NotFoundError,
+    openai.PermissionDeniedError,
+    openai.UnprocessableEntityError,
+    openai.ContentFilterFinishReasonError,
+    openai.LengthFinishReasonError,
+)
+
+
+def _root_errors(error: BaseException) -> List[BaseException]:
+    """Collect an exception and the exceptions it was raised from.
+
+    Agents re-raise provider errors as plain ``Exception``, so the original
+    error type is only reachable through the cause/context chain.
+    """
+    errors = []
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        errors.append(error)
+        error = error.__cause__ or error.__context__
+    return errors
+
+
+class ModelCascade:
+    """Escalation policy over the MODELS tiers for generation and validation."""
+
+    def __init__(
+        self,
+        tiers: Optional[List[str]] = None,
+        escalate_below: float = CASCADE_ESCALATE_BELOW,
+        attempts_per_tier: int = CASCADE_ATTEMPTS_PER_TIER,
+        validation_band: float = CASCADE_VALIDATION_BAND
+    ):
+        """Initialize cascade policy.
+
+        Args:
+            tiers: Tier names from MODELS, cheapest first
+            escalate_below: Failing scores under this escalate immediately
+            attempts_per_tier: Attempts on one tier before escalating anyway
+            validation_band: Distance from MIN_SCORE that triggers a
+                confirmation by the next validator tier
+        """
+        self.tiers = list(tiers or CASCADE_TIERS)
+        unknown = [tier for tier in self.tiers if tier not in MODELS]
+        if unknown:
+            raise ValueError(f"Unknown model tiers: {unknown}")
+
+        self.escalate_below = escalate_below
+        self.attempts_per_tier = attempts_per_tier
+        self.validation_band = validation_band
+
+    @property
+    def first_tier(self) -> str:
+        """Cheapest tier, where every post starts."""
+        return self.tiers[0]
+
+    def model_for(self, tier: str) -> str:
+        """Resolve a tier name to its model id."""
+        return MODELS[tier]
+
+    def escalate(self, tier: str) -> Optional[str]:
+        """Return the next tier up, or None if already at the top."""
+        index = self.tiers.index(tier)
+        if index + 1 < len(self.tiers):
+            return self.tiers[index + 1]
+        return None
+
+    def should_escalate_error(self, error: BaseException) -> bool:
+        """Check whether a generation error calls for a stronger model.
+
+        Rate limits, timeouts and server errors are retried on the same tier;
+        errors tied to the model itself (bad request, unavailable model,
+        content filter, truncation, open circuit) escalate.
+        """
+        return any(isinstance(e, ESCALATING_ERRORS) for e in _root_errors(error))
+
+    def next_tier(
+        self,
+        tier: str,
+        tier_attempts: int,
+        score: Optional[float] = None,
+        error: Optional[BaseException] = None
+    ) -> str:
+        """Pick the tier for the next generation attempt.
+
+        Args:
+            tier: Tier used for the attempt that just failed
+            tier_attempts: Attempts made so far on that tier
+            score: Validator score of the failed attempt, if it got that far
+            error: Exception raised by the failed attempt, if any
+
+        Returns:
+            Tier for the next attempt (the same tier if there is nothing
+            to escalate to or the failure doesn't warrant it)
+        """
+        if error is not None:
+            escalate = self.should_escalate_error(error)
+        else:
+            escalate = score is not None and score < self.escalate_below
+
+        if escalate or tier_attempts >= self.attempts_per_tier:
+            return self.escalate(tier) or tier
+        return tier
+
+    def needs_confirmation(self, score: float, feedback: str) -> bool:
+        """Check whether a validation result should be re-judged a tier up.
+
+        Args:
+            score: Validator score
+            feedback: Validator feedback text
+
+        Returns:
+            True if the score is too close to MIN_SCORE to trust, or the
+            validation call itself failed. Deterministic pre-check
+            rejections and confident style pre-scores are never re-judged.
+        """
+        if feedback.startswith("Error during validation"):
+            return True
+        if feedback.startswith(("PRE-CHECK FAILED", "STYLE PRE-SCORE")):
+            return False
+        return abs(score - MIN_SCORE) < self.validation_band
+
+
+def tier_for_model(model: str) -> Optional[str]:
+    """Reverse-lookup the tier name for a model id.
+
+    Args:
+        model: Model id
+
+    Returns:
+        Tier name from MODELS, or None if the model isn't a named tier
+    """
+    for tier, tier_model in MODELS.items():
+        if tier_model == model:
+            return tier
+    return None
@@ -9,6 +9,15 @@ load_dotenv()
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# LLM Backend: "openrouter" (any OpenAI-compatible endpoint at LLM_BASE_URL)
+# or "fake" (in-process deterministic stand-in, see core/fake_llm.py)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openrouter")
+LLM_BASE_URL = os.getenv("LLM_BASE_URL", OPENROUTER_BASE_URL)
+
+# Fake backend knobs for offline load tests and profiling
+FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "0"))
+FAKE_LLM_TIME_SCALE = float(os.getenv("FAKE_LLM_TIME_SCALE", "1.0"))
+
 # Free/Cheap Models
 MODELS = {
     "free": "meta-llama/llama-3.1-8b-instruct:free",
@@ -18,6 +27,63 @@ MODELS = {
 
 DEFAULT_MODEL = MODELS["free"]
 
+# Prices in USD per million tokens: (prompt, completion)
+MODEL_PRICES = {
+    MODELS["free"]: (0.0, 0.0),
+    MODELS["cheap"]: (0.50, 1.50),
+    MODELS["quality"]: (0.25, 1.25),
+}
+
+# Model Cascade: tiers tried in order, cheapest first
+CASCADE_TIERS = ["free", "cheap", "quality"]
+
+# Failing scores below this escalate straight to the next tier;
+# near misses get another try on the same tier first
+CASCADE_ESCALATE_BELOW = 6.0
+
+# Attempts allowed on one tier before escalating regardless of score
+CASCADE_ATTEMPTS_PER_TIER = 2
+
+# Validator scores within this band of MIN_SCORE are re-checked by the
+# next validator tier, since cheap judges are least reliable near the line
+CASCADE_VALIDATION_BAND = 0.5
+
+# Rate Limiting (per model, shared by all agents in the process)
+RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))
+RATE_LIMIT_MAX_CONCURRENCY = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "8"))
+
+# Per-model overrides of the defaults above
+RATE_LIMITS = {
+    MODELS["free"]: {"requests_per_minute": 20, "burst": 5, "max_concurrency": 4},
+}
+
+# Retry/backoff for rate-limited and failed LLM calls
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE = 1.0
+LLM_BACKOFF_MAX = 60.0
+# Overall deadline in seconds for one call, across all retries and backoff
+LLM_RETRY_DEADLINE = float(os.getenv("LLM_RETRY_DEADLINE", "300"))
+
+# Per-request deadlines in seconds (long-form agents get more room)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+LLM_LONG_FORM_TIMEOUT = float(os.getenv("LLM_LONG_FORM_TIMEOUT", "180"))
+
+# Hedged requests: once a call runs past this latency percentile of calls like
+# it (same model, stage and output size), fire a duplicate (optionally to a
+# fallback model) and take the first
+LLM_HEDGE = os.getenv("LLM_HEDGE", "false").lower() in ("1", "true", "yes")
+LLM_HEDGE_PERCENTILE = 95
+LLM_HEDGE_MIN_SAMPLES = 20
+
+# Model to send hedged/diverted requests to, keyed by primary model
+# (models not listed hedge against themselves)
+HEDGE_FALLBACK_MODELS = {}
+
+# Circuit breaker: stop routing to a model after consecutive failures
+LLM_CIRCUIT_FAILURE_THRESHOLD = 5
+LLM_CIRCUIT_RESET_SECONDS = 30.0
+
 # Paths
 KNOWLEDGE_BASE_DIR = "./knowledge_bases"
 VECTOR_STORE_DIR = "./vector_stores"
@@ -25,6 +91,87 @@ VECTOR_STORE_DIR = "./vector_stores"
 # Quality Threshold
 MIN_SCORE = 8.0
 
+# Batch runs append each finished post here so an interrupted run can resume
+BATCH_JOURNAL_PATH = os.getenv("BATCH_JOURNAL_PATH", "./batch_journal.jsonl")
+
+# Multi-process batch runs: SQLite work queue shared by the worker processes.
+# A claimed entry is leased for QUEUE_VISIBILITY_TIMEOUT seconds (renewed while
+# its worker is alive); an expired lease is handed to another worker, at most
+# QUEUE_MAX_ATTEMPTS times
+WORK_QUEUE_PATH = os.getenv("WORK_QUEUE_PATH", "./batch_queue.db")
+QUEUE_VISIBILITY_TIMEOUT = float(os.getenv("QUEUE_VISIBILITY_TIMEOUT", "300"))
+QUEUE_MAX_ATTEMPTS = int(os.getenv("QUEUE_MAX_ATTEMPTS", "3"))
+
+# Pre-generation daemon: drafts for calendar entries due within the next
+# PREGEN_HORIZON_DAYS are generated ahead of time and kept in DRAFT_STORE_PATH.
+# The calendar is re-checked every PREGEN_POLL_INTERVAL seconds; a draft that
+# failed validation is retried after PREGEN_RETRY_FAILED_AFTER seconds
+DRAFT_STORE_PATH = os.getenv("DRAFT_STORE_PATH", "./draft_store.db")
+PREGEN_HORIZON_DAYS = int(os.getenv("PREGEN_HORIZON_DAYS", "7"))
+PREGEN_POLL_INTERVAL = float(os.getenv("PREGEN_POLL_INTERVAL", "600"))
+PREGEN_RETRY_FAILED_AFTER = float(os.getenv("PREGEN_RETRY_FAILED_AFTER", "21600"))
+
+# Budgeted batch runs: predicted tokens and wall-clock seconds of one
+# attempt (generation + validation) per content type, used until the batch
+# has observed its own averages
+PREDICTED_ATTEMPT_TOKENS = {
+    "LinkedIn": {"prompt": 2500, "completion": 600},
+    "Blog": {"prompt": 3500, "completion": 1800},
+    "Article": {"prompt": 4500, "completion": 3200},
+}
+PREDICTED_ATTEMPT_SECONDS = {
+    "LinkedIn": 20.0,
+    "Blog": 60.0,
+    "Article": 120.0,
+}
+
+# Mixed-type batches: most entries of a content type in flight at once
+# (within the batch's concurrency), so long-form entries can't hold every
+# slot while short posts wait. Types not listed are limited only by the
+# batch's concurrency.
+CONTENT_TYPE_CONCURRENCY = {
+    "Blog": int(os.getenv("BLOG_CONCURRENCY", "2")),
+    "Article": int(os.getenv("ARTICLE_CONCURRENCY", "1")),
+}
+
+# Style pre-scorer: example posts per content type (under KNOWLEDGE_BASE_DIR)
+EXAMPLE_DIRS = {
+    "LinkedIn": "examples/linkedin_posts",
+    "Blog": "examples/blog_samples",
+    "Article": "examples/article_samples",
+}
+
+# Sentences in the voice the guidelines ban; drafts close to them score lower
+BANNED_VOICE_EXAMPLES = [
+    "Believe in yourself and you can achieve anything you set your mind to!",
+    "This game-changing strategy will help you crush your goals and unlock your potential.",
+    "Leverage synergies to drive innovation and move the needle on key deliverables.",
+    "What do you think? Let me know in the comments below and follow for more tips!",
+    "Never give up on your dreams, hustle every single day and success will follow.",
+]
+
+# Calibration of the style pre-scorer against historical validator scores
+STYLE_CALIBRATION_PATH = os.getenv("STYLE_CALIBRATION_PATH", "./style_calibration.json")
+STYLE_SCORER_AGREEMENT = 0.98  # required pass/fail agreement for skipped drafts
+STYLE_SCORER_MIN_SAMPLES = 30
+
+# Target word ranges per content type
+TARGET_WORDS = {
+    "LinkedIn": "150-250",
+    "Blog": "800-1500",
+    "Article": "1000-2000",
+}
+
+# Output sizing: max_tokens = top of range x OUTPUT_WORD_MARGIN x TOKENS_PER_WORD
+TOKENS_PER_WORD = 1.4
+OUTPUT_WORD_MARGIN = 1.3
+
+# Streaming generation is stopped once it passes top of range x this factor
+EARLY_STOP_OVERSHOOT = 1.2
+
+# Fresh generations after an early stop before giving up
+EARLY_STOP_RETRIES = 1
+
 # Content Lenses
 LENSES = ["incentives", "processes", "constraints", "narratives", "feedback", "metrics"]
 
@@ -51,6 +198,58 @@ CORE_THESIS = (
     "feedback loops, and metrics shape behavior more than individual capability."
 )
 
+# Drafts judged per batched validation call (ValidatorAgent.validate_many)
+VALIDATION_BATCH_SIZE = 5
+
+# Validation cache: in-memory LRU entries, plus an optional SQLite file
+# that survives restarts (empty = memory only)
+VALIDATION_CACHE_SIZE = int(os.getenv("VALIDATION_CACHE_SIZE", "2048"))
+VALIDATION_CACHE_PATH = os.getenv("VALIDATION_CACHE_PATH", "")
+
+# Feedback prefixes of scores that were not judged by the validator LLM, and
+# the content recorded for entries that never produced a draft
+PRECHECK_FAILED = "PRE-CHECK FAILED"
+STYLE_PRESCORE = "STYLE PRE-SCORE"
+FAILED_CONTENT = "Failed to generate content"
+
+# Deterministic pre-validation: drafts with a hard failure, or whose deducted
+# penalties alone put MIN_SCORE out of reach, are rejected without an LLM call
+WORD_COUNT_TOLERANCE = 0.2  # fraction outside the target range that is "far off"
+PRECHECK_PENALTIES = {
+    "word_count_far": 3.0,
+    "word_count_near": 1.0,
+    "emoji": 2.0,
+    "question_ending": 1.0,
+    "banned_term": 1.0,  # per term, capped at 3
+    "hashtag": 1.0,
+    "no_signature_phrase": 1.5,
+}
+# Pre-check findings that are also deducted from the LLM score; the others
+# are listed as feedback for revisions
+SCORE_PENALTIES = ("emoji", "question_ending")
+# Pre-check findings that reject a draft whatever the LLM would score it
+PRECHECK_HARD_FAILURES = ("word_count_far",)
+
+# Terms that break the voice guidelines (buzzwords, motivational language, CTAs)
+BANNED_TERMS = [
+    "synergy",
+    "game-changer",
+    "game changer",
+    "paradigm shift",
+    "move the needle",
+    "low-hanging fruit",
+    "thought leader",
+    "hustle",
+    "crush it",
+    "never give up",
+    "dream big",
+    "follow me",
+    "comment below",
+    "like and share",
+    "let me know in the comments",
+    "link in bio",
+]
+
 # Voice Guidelines
 VOICE_GUIDELINES = {
     "tone": "Clear, slightly contrarian, calm, practical",
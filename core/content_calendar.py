@@ -0,0 +1,320 @@
+"""Content calendars loaded from JSONL, CSV or YAML files.
+
+Entries are read lazily and validated one at a time, so a year-long
+calendar is never held in memory::
+
+    entries = CalendarFilter(weeks=(10, 20), lenses=["metrics"]).apply(
+        read_calendar("calendars/2025.jsonl")
+    )
+    processor.process_batch(calendar=entries)
+
+Each entry needs post_number, week, topic, lens and objective; description,
+date (YYYY-MM-DD), brand, content_type (LinkedIn, Blog or Article; defaults
+to LinkedIn) and priority (integer, higher is scheduled first in budgeted
+runs) are optional. YAML files need
+PyYAML (``pip install pyyaml``).
+"""
+
+import csv
+import json
+import os
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.config import LENSES, OBJECTIVES, TARGET_WORDS
+
+REQUIRED_FIELDS = ("post_number", "week", "topic", "lens", "objective")
+OPTIONAL_FIELDS = ("description", "date", "brand", "content_type", "priority")
+
+
+class CalendarError(ValueError):
+    """A calendar file or entry that doesn't match the schema."""
+
+
+def validate_entry(raw: Dict, source: str = "calendar") -> Dict:
+    """Check and normalize one calendar entry.
+
+    Args:
+        raw: Entry as read from the file (CSV values are strings)
+        source: Location for error messages, e.g. "plan.csv:12"
+
+    Returns:
+        Entry with int post_number/week/priority and only known fields
+
+    Raises:
+        CalendarError: If a field is missing or invalid
+    """
+    if not isinstance(raw, dict):
+        raise CalendarError(f"{source}: expected a mapping, got {type(raw).__name__}")
+    missing = [f for f in REQUIRED_FIELDS if raw.get(f) in (None, "")]
+    if missing:
+        raise CalendarError(f"{source}: missing {', '.join(missing)}")
+
+    entry = {}
+    for field in ("post_number", "week", "priority"):
+        if field not in REQUIRED_FIELDS and raw.get(field) in (None, ""):
+            continue
+        try:
+            entry[field] = int(raw[field])
+        except (TypeError, ValueError):
+            raise CalendarError(f"{source}: {field} must be an integer, got {raw[field]!r}")
+    entry["topic"] = str(raw["topic"]).strip()
+    entry["lens"] = str(raw["lens"]).strip()
+    entry["objective"] = str(raw["objective"]).strip()
+    if entry["lens"] not in LENSES:
+        raise CalendarError(f"{source}: unknown lens {entry['lens']!r}")
+    if entry["objective"] not in OBJECTIVES:
+        raise CalendarError(f"{source}: unknown objective {entry['objective']!r}")
+
+    for field in OPTIONAL_FIELDS:
+        if field not in entry and raw.get(field) not in (None, ""):
+            entry[field] = raw[field] if field == "date" else str(raw[field]).strip()
+    if "content_type" in entry and entry["content_type"] not in TARGET_WORDS:
+        raise CalendarError(f"{source}: unknown content_type {entry['content_type']!r}")
+    if "date" in entry:
+        try:
+            entry["date"] = _parse_date(entry["date"]).isoformat()
+        except ValueError:
+            raise CalendarError(f"{source}: date must be YYYY-MM-DD, got {entry['date']!r}")
+    entry.setdefault("description", "")
+    return entry
+
+
+def _parse_date(value) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+def _format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    if extension in (".yaml", ".yml"):
+        return "yaml"
+    raise CalendarError(f"Unsupported calendar format: {path} (use .jsonl, .csv or .yaml)")
+
+
+def read_calendar(path: str, strict: bool = True) -> Iterator[Dict]:
+    """Lazily read and validate a calendar file.
+
+    Args:
+        path: .jsonl/.ndjson, .csv or .yaml/.yml file. A YAML file is either
+            one list of entries or a stream of entry documents separated
+            by ``---`` (the stream form is read one document at a time)
+        strict: Raise on an invalid entry; if False, print a warning and
+            skip it
+
+    Yields:
+        Validated entries in file order
+
+    Raises:
+        CalendarError: On an invalid entry (strict) or unsupported format
+    """
+    for source, raw in _records(path):
+        try:
+            yield validate_entry(raw, source)
+        except CalendarError as e:
+            if strict:
+                raise
+            print(f"Warning: skipping calendar entry: {e}")
+
+
+def _records(path: str) -> Iterator[Tuple[str, Dict]]:
+    """Raw (source, record) pairs from a calendar file."""
+    kind = _format(path)
+    if kind == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield f"{path}:{number}", json.loads(line)
+                except ValueError as e:
+                    raise CalendarError(f"{path}:{number}: invalid JSON: {e}")
+    elif kind == "csv":
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield f"{path}:{reader.line_num}", row
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Reading YAML calendars requires PyYAML: pip install pyyaml")
+        with open(path, encoding="utf-8") as f:
+            for doc_number, document in enumerate(yaml.safe_load_all(f), 1):
+                if isinstance(document, list):
+                    for i, raw in enumerate(document, 1):
+                        yield f"{path}: document {doc_number}, entry {i}", raw
+                elif document is not None:
+                    yield f"{path}: document {doc_number}", document
+
+
+@dataclass
+class CalendarFilter:
+    """Selection of calendar entries; unset criteria match everything.
+
+    Ranges are inclusive. Entries without a date never match a date window.
+    """
+
+    start_post: Optional[int] = None
+    end_post: Optional[int] = None
+    weeks: Optional[Tuple[int, int]] = None
+    lenses: Optional[Sequence[str]] = None
+    objectives: Optional[Sequence[str]] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    brands: Optional[Sequence[str]] = None
+    content_types: Optional[Sequence[str]] = None
+
+    def matches(self, entry: Dict) -> bool:
+        """Check whether an entry is selected."""
+        post_number = entry["post_number"]
+        if self.start_post is not None and post_number < self.start_post:
+            return False
+        if self.end_post is not None and post_number > self.end_post:
+            return False
+        if self.weeks is not None and not self.weeks[0] <= entry["week"] <= self.weeks[1]:
+            return False
+        if self.lenses is not None and entry["lens"] not in self.lenses:
+            return False
+        if self.objectives is not None and entry["objective"] not in self.objectives:
+            return False
+        if self.brands is not None and entry.get("brand") not in self.brands:
+            return False
+        if (
+            self.content_types is not None
+            and entry.get("content_type", "LinkedIn") not in self.content_types
+        ):
+            return False
+        if self.start_date is not None or self.end_date is not None:
+            if not entry.get("date"):
+                return False
+            day = _parse_date(entry["date"])
+            if self.start_date is not None and day < self.start_date:
+                return False
+            if self.end_date is not None and day > self.end_date:
+                return False
+        return True
+
+    def apply(self, entries: Iterable[Dict]) -> Iterator[Dict]:
+        """Lazily keep the selected entries."""
+        return (entry for entry in entries if self.matches(entry))
+
+
+class CalendarIndex:
+    """Post-number index over a JSONL or CSV calendar file.
+
+    Building the index reads the file once and keeps only the byte offset
+    of each entry; lookups seek straight to the entry and parse just that
+    record.
+    """
+
+    def __init__(self, path: str):
+        """Index a calendar file.
+
+        Args:
+            path: .jsonl/.ndjson or .csv calendar
+
+        Raises:
+            CalendarError: For YAML files (not seekable per entry), invalid
+                records or duplicate post numbers
+        """
+        self.path = path
+        self.kind = _format(path)
+        if self.kind == "yaml":
+            raise CalendarError(f"{path}: only JSONL and CSV calendars can be indexed")
+        self.offsets: Dict[int, int] = {}
+        self._header: Optional[List[str]] = None
+
+        with open(path, "rb") as f:
+            if self.kind == "csv":
+                self._header = next(csv.reader([f.readline().decode("utf-8")]))
+            for offset, text in self._raw_lines(f):
+                raw = self._decode(text, offset)
+                entry = validate_entry(raw, f"{path}@{offset}")
+                if entry["post_number"] in self.offsets:
+                    raise CalendarError(f"{path}: duplicate post_number {entry['post_number']}")
+                self.offsets[entry["post_number"]] = offset
+
+    @staticmethod
+    def supports(path: str) -> bool:
+        """Check whether a calendar file can be indexed (JSONL and CSV can)."""
+        return _format(path) != "yaml"
+
+    def count(self, start_post: Optional[int] = None, end_post: Optional[int] = None) -> int:
+        """Number of entries in a post-number range (inclusive, None for no bound)."""
+        return sum(
+            1 for post_number in self.offsets
+            if (start_post is None or post_number >= start_post)
+            and (end_post is None or post_number <= end_post)
+        )
+
+    def get(self, post_number: int) -> Optional[Dict]:
+        """Load one entry by post number.
+
+        Args:
+            post_number: Post number
+
+        Returns:
+            Validated entry, or None if the calendar has no such post
+        """
+        if post_number not in self.offsets:
+            return None
+        with open(self.path, "rb") as f:
+            return self._load(f, post_number)
+
+    def entries(
+        self,
+        start_post: Optional[int] = None,
+        end_post: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Lazily load the entries in a post-number range, in post-number order."""
+        with open(self.path, "rb") as f:
+            for post_number in sorted(self.offsets):
+                if start_post is not None and post_number < start_post:
+                    continue
+                if end_post is not None and post_number > end_post:
+                    break
+                yield self._load(f, post_number)
+
+    def __contains__(self, post_number: int) -> bool:
+        return post_number in self.offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _load(self, f, post_number: int) -> Dict:
+        offset = self.offsets[post_number]
+        f.seek(offset)
+        _, text = next(self._raw_lines(f))
+        return validate_entry(self._decode(text, offset), f"{self.path}@{offset}")
+
+    def _raw_lines(self, f) -> Iterator[Tuple[int, str]]:
+        """(offset, text) per record; CSV records may span lines inside quotes."""
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                return
+            text = line.decode("utf-8")
+            if self.kind == "csv":
+                while text.count('"') % 2:
+                    more = f.readline()
+                    if not more:
+                        break
+                    text += more.decode("utf-8")
+            if text.strip():
+                yield offset, text
+
+    def _decode(self, text: str, offset: int) -> Dict:
+        if self.kind == "csv":
+            return dict(zip(self._header, next(csv.reader([text]))))
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            raise CalendarError(f"{self.path}@{offset}: invalid JSON: {e}")
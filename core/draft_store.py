@@ -0,0 +1,138 @@
+"""SQLite store of pre-generated drafts for upcoming calendar entries.
+
+The pre-generation daemon (pregenerator.py) writes one validated result per
+calendar entry, tagged with the knowledge base fingerprint it was generated
+against; the UI looks entries up and serves the stored draft instead of
+generating live::
+
+    store = DraftStore("draft_store.db")
+    result = store.get(entry, fingerprint=knowledge_base_fingerprint())
+    if result is None:
+        ...  # generate live
+
+Entries are keyed like the batch journal (core.journal.entry_key), so an
+edited calendar entry never matches a draft of its old version.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from core.journal import entry_key
+
+
+class DraftStore:
+    """Drafts keyed by calendar entry, safe to share between processes."""
+
+    def __init__(self, path: str):
+        """Open (or create) a draft store.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS drafts ("
+            "key TEXT PRIMARY KEY, post_number INTEGER NOT NULL, due TEXT, "
+            "content_type TEXT NOT NULL, entry TEXT NOT NULL, result TEXT NOT NULL, "
+            "passed INTEGER NOT NULL, fingerprint TEXT NOT NULL, created REAL NOT NULL)"
+        )
+
+    def put(self, entry: Dict, result: Dict, fingerprint: str):
+        """Store (or replace) the draft for an entry.
+
+        Args:
+            entry: Calendar entry
+            result: Batch result for the entry (see BatchProcessor.process_single)
+            fingerprint: Knowledge base fingerprint the draft was generated with
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO drafts (key, post_number, due, content_type, entry, "
+                "result, passed, fingerprint, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry_key(entry), entry["post_number"], entry.get("date"),
+                    entry.get("content_type", "LinkedIn"), json.dumps(entry),
+                    json.dumps(result), int(bool(result.get("passed"))), fingerprint,
+                    time.time()
+                )
+            )
+
+    def get(self, entry: Dict, fingerprint: Optional[str] = None) -> Optional[Dict]:
+        """Look up the validated draft for an entry.
+
+        Args:
+            entry: Calendar entry
+            fingerprint: Current knowledge base fingerprint; drafts generated
+                against another one are not returned (None to skip the check)
+
+        Returns:
+            Stored result with a passing draft, or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result, fingerprint FROM drafts WHERE key = ? AND passed = 1",
+                (entry_key(entry),)
+            ).fetchone()
+        if row is None or (fingerprint is not None and row[1] != fingerprint):
+            return None
+        return json.loads(row[0])
+
+    def needs_draft(self, entry: Dict, fingerprint: str, retry_failed_after: float) -> bool:
+        """Check whether an entry should be (re)generated.
+
+        Args:
+            entry: Calendar entry
+            fingerprint: Current knowledge base fingerprint
+            retry_failed_after: Seconds before a failed draft is retried
+
+        Returns:
+            True if the entry has no draft, its draft predates the current
+            knowledge base, or its draft failed long enough ago
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT passed, fingerprint, created FROM drafts WHERE key = ?",
+                (entry_key(entry),)
+            ).fetchone()
+        if row is None or row[1] != fingerprint:
+            return True
+        passed, _, created = row
+        return not passed and time.time() - created >= retry_failed_after
+
+    def prune(self, before: str) -> int:
+        """Delete drafts of entries due before a date.
+
+        Args:
+            before: YYYY-MM-DD; undated drafts are kept
+
+        Returns:
+            Number of drafts deleted
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM drafts WHERE due IS NOT NULL AND due < ?", (before,)
+            )
+            return cursor.rowcount
+
+    def counts(self, fingerprint: Optional[str] = None) -> Dict[str, int]:
+        """Number of passing, failing and (with a fingerprint) stale drafts."""
+        with self._lock:
+            rows = self._db.execute("SELECT passed, fingerprint FROM drafts").fetchall()
+        counts = {"passed": 0, "failed": 0, "stale": 0}
+        for passed, draft_fingerprint in rows:
+            if fingerprint is not None and draft_fingerprint != fingerprint:
+                counts["stale"] += 1
+            else:
+                counts["passed" if passed else "failed"] += 1
+        return counts
+
+    def close(self):
+        """Close the store file."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,163 @@
+"""Structured progress events emitted by the batch processor.
+
+Code inside a batch reports what it is doing with ``emit``; every listener
+active in the current context receives a BatchEvent. Listeners and the
+enclosing entry travel with ``submit_with_context`` like usage trackers do,
+so events from worker threads are attributed to the right post::
+
+    with listen(lambda event: print(event.kind, event.post_number)):
+        processor.process_batch()
+
+Each event carries a human-readable ``message`` (what the console shows),
+the seconds since its entry (or the batch) started, and the running token
+and cost totals of that entry (or the batch).
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from core.usage import UsageTracker
+
+# Event kinds
+BATCH_STARTED = "batch_started"
+ENTRY_STARTED = "entry_started"
+ATTEMPT = "attempt"
+SCORE = "score"
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+ESCALATED = "escalated"
+NOTE = "note"
+ENTRY_FINISHED = "entry_finished"
+BATCH_FINISHED = "batch_finished"
+
+
+@dataclass
+class BatchEvent:
+    """One thing that happened during a batch."""
+
+    kind: str
+    message: str = ""
+    post_number: Optional[int] = None
+    elapsed: float = 0.0
+    tokens: int = 0
+    cost: float = 0.0
+    data: Dict = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the event (e.g. for a JSONL event log)."""
+        return asdict(self)
+
+
+Listener = Callable[[BatchEvent], None]
+
+
+@dataclass
+class _Scope:
+    post_number: Optional[int]
+    started: float
+    tracker: Optional[UsageTracker]
+
+
+_listeners: contextvars.ContextVar[Tuple[Listener, ...]] = contextvars.ContextVar(
+    "event_listeners", default=()
+)
+_scope: contextvars.ContextVar[Optional[_Scope]] = contextvars.ContextVar(
+    "event_scope", default=None
+)
+
+
+@contextmanager
+def listen(listener: Listener) -> Iterator[None]:
+    """Send every event emitted inside the block to a listener.
+
+    Listeners are called on the emitting thread, so they must be
+    thread-safe. Registering a listener that is already active is a no-op.
+
+    Args:
+        listener: Callable taking a BatchEvent
+    """
+    active = _listeners.get()
+    if listener in active:
+        yield
+        return
+    token = _listeners.set(active + (listener,))
+    try:
+        yield
+    finally:
+        _listeners.reset(token)
+
+
+@contextmanager
+def event_scope(
+    post_number: Optional[int] = None,
+    tracker: Optional[UsageTracker] = None
+) -> Iterator[None]:
+    """Attribute events emitted inside the block to a post (or the batch).
+
+    Args:
+        post_number: Post the events belong to, None for batch-level events
+        tracker: Usage tracker whose running totals events carry
+    """
+    token = _scope.set(_Scope(post_number, time.monotonic(), tracker))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def emit(
+    kind: str,
+    message: str = "",
+    post_number: Optional[int] = None,
+    **data
+) -> Optional[BatchEvent]:
+    """Send an event to the listeners active in the current context.
+
+    Args:
+        kind: Event kind (one of the constants in this module)
+        message: Console line for the event ("" for none)
+        post_number: Post the event is about, if not the enclosing entry's
+        **data: Kind-specific fields (score, attempt, tier, ...)
+
+    Returns:
+        The event, or None if nothing is listening
+    """
+    listeners = _listeners.get()
+    if not listeners:
+        return None
+    event = BatchEvent(kind=kind, message=message, post_number=post_number, data=data)
+    scope = _scope.get()
+    if scope is not None:
+        if post_number is None:
+            event.post_number = scope.post_number
+        event.elapsed = round(time.monotonic() - scope.started, 3)
+        if scope.tracker is not None:
+            event.tokens = scope.tracker.totals["total_tokens"]
+            event.cost = round(scope.tracker.totals["cost"], 6)
+    for listener in listeners:
+        listener(event)
+    return event
+
+
+class ConsoleReporter:
+    """Listener that prints each event's message (the CLI's output)."""
+
+    def __call__(self, event: BatchEvent):
+        if event.message:
+            print(event.message)
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format an ETA in seconds as e.g. "4m 05s" ("?" if unknown)."""
+    if seconds is None:
+        return "?"
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    return f"{minutes}m {seconds:02d}s"
@@ -0,0 +1,626 @@
+"""Deterministic local stand-in for the LLM provider.
+
+Used to load-test and profile the pipeline offline. Runs either in-process
+(``LLM_BACKEND=fake``) or as a tiny OpenAI-compatible HTTP server that the
+real client can point at::
+
+    python -m core.fake_llm --port 8089 --latency 0.8 --rate-limit-rate 0.05
+    LLM_BASE_URL=http://127.0.0.1:8089/v1 OPENROUTER_API_KEY=fake streamlit run app.py
+
+Outputs are canned but deterministic for a given seed, model and prompt,
+and validation prompts get parseable ``SCORE:`` lines.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional, Tuple
+
+import httpx
+import openai
+
+from core.config import MODELS, SIGNATURE_PHRASES, FAKE_LLM_SEED, FAKE_LLM_TIME_SCALE
+
+
+SENTENCES = [
+    "Most teams don't have a motivation problem. They have a design problem.",
+    "Incentives create behavior, whether you planned them or not.",
+    "The process looked rigorous on paper. Nobody could say what it produced.",
+    "I watched a team hit every metric and miss the point entirely.",
+    "People adapt to the system they are in, not the one on the slide.",
+    "Constraints decide what is possible long before talent gets a vote.",
+    "When the feedback loop is slow, everyone optimizes for looking busy.",
+    "Execution is a design problem, not a willpower problem.",
+    "The narrative a team tells itself sets the ceiling on what it tries.",
+    "Measure the wrong thing and you will get more of the wrong thing.",
+    "Good people in a bad system still produce bad outcomes.",
+    "Fix the system and the heroics stop being necessary.",
+]
+
+# Mean validator score per model, so cascades and best-of-N behave plausibly
+MODEL_QUALITY = {
+    MODELS["free"]: 7.4,
+    MODELS["cheap"]: 7.9,
+    MODELS["quality"]: 8.5,
+}
+
+# Revision outputs remembered for revision_gain (a draft is judged soon after
+# it is written, so only recent ones matter)
+REVISED_MEMORY = 10_000
+
+
+class FakeLLMError(Exception):
+    """Injected provider failure (HTTP status plus optional Retry-After)."""
+
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class FakeLLM:
+    """Canned-output completion engine with configurable latency and errors."""
+
+    def __init__(
+        self,
+        seed: int = FAKE_LLM_SEED,
+        latency: float = 0.8,
+        latency_sigma: float = 0.3,
+        tokens_per_second: float = 60.0,
+        slow_rate: float = 0.0,
+        slow_factor: float = 10.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        score_sigma: float = 1.0,
+        revision_gain: float = 0.0,
+        time_scale: float = FAKE_LLM_TIME_SCALE
+    ):
+        """Initialize fake LLM.
+
+        Args:
+            seed: Seed for all sampled outputs, latencies and failures
+            latency: Median time to first token in seconds (lognormal)
+            latency_sigma: Lognormal sigma of time to first token
+            tokens_per_second: Completion token rate after the first token
+            slow_rate: Probability a call hangs for slow_factor x its latency
+            slow_factor: Latency multiplier for hanging calls
+            error_rate: Probability of an injected 500
+            rate_limit_rate: Probability of an injected 429
+            retry_after: Retry-After seconds sent with injected 429s
+            score_sigma: Spread of validator scores around the model mean
+            revision_gain: Validator score bonus for drafts written from
+                a revision prompt. Off by default: a positive value builds
+                in the assumption that revising beats regenerating, so only
+                set it to benchmark how much that assumption is worth
+            time_scale: Multiplier on all sleeps (0 for instant runs)
+        """
+        self.seed = seed
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.slow_rate = slow_rate
+        self.slow_factor = slow_factor
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.score_sigma = score_sigma
+        self.revision_gain = revision_gain
+        self.time_scale = time_scale
+
+        self.calls = 0
+        self._prompt_calls: Dict[str, int] = {}
+        # Digests of the last REVISED_MEMORY revision outputs, oldest first
+        self._revised: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _rng(self, model: str, prompt: str) -> random.Random:
+        """RNG for this call: same seed, model, prompt and repeat count -> same output."""
+        digest = hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+        with self._lock:
+            self.calls += 1
+            n = self._prompt_calls.get(digest, 0)
+            self._prompt_calls[digest] = n + 1
+        return random.Random(f"{self.seed}:{digest}:{n}")
+
+    def complete(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[str, int, int]:
+        """Produce a completion, sleeping for the sampled latency.
+
+        Args:
+            prompt: Prompt text
+            model: Model id (drives the validator score mean)
+            max_tokens: Completion token limit; longer outputs are truncated
+
+        Returns:
+            Tuple of (text, prompt_tokens, completion_tokens)
+
+        Raises:
+            FakeLLMError: For injected 429s and 500s
+        """
+        text, prompt_tokens, completion_tokens, ttft, slowdown = self._sample(
+            prompt, model, max_tokens
+        )
+        duration = (ttft + completion_tokens / self.tokens_per_second) * slowdown
+        time.sleep(duration * self.time_scale)
+        return text, prompt_tokens, completion_tokens
+
+    def stream(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Produce a completion word by word at the configured token rate.
+
+        Closing the iterator early skips the rest of the sleeps, like a
+        dropped connection.
+
+        Args:
+            prompt: Prompt text
+            model: Model id
+            max_tokens: Completion token limit
+
+        Yields:
+            Chunks of text (a word plus its trailing whitespace)
+
+        Raises:
+            FakeLLMError: For injected 429s and 500s
+        """
+        text, _, completion_tokens, ttft, slowdown = self._sample(prompt, model, max_tokens)
+        chunks = re.findall(r'\S+\s*', text)
+        per_chunk = completion_tokens / max(1, len(chunks)) / self.tokens_per_second
+        time.sleep(ttft * slowdown * self.time_scale)
+        for chunk in chunks:
+            time.sleep(per_chunk * slowdown * self.time_scale)
+            yield chunk
+
+    def _sample(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int]
+    ) -> Tuple[str, int, int, float, float]:
+        """Sample output, token counts, time to first token and slowdown for a call.
+
+        Raises:
+            FakeLLMError: For injected 429s and 500s
+        """
+        rng = self._rng(model, prompt)
+        ttft = rng.lognormvariate(math.log(max(self.latency, 1e-6)), self.latency_sigma)
+
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            time.sleep(0.05 * self.time_scale)
+            raise FakeLLMError(429, "Rate limit exceeded", retry_after=self.retry_after)
+        if roll < self.rate_limit_rate + self.error_rate:
+            time.sleep(ttft * self.time_scale)
+            raise FakeLLMError(500, "Internal server error")
+
+        text = self._respond(prompt, model, rng)
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(text)
+        if max_tokens and completion_tokens > max_tokens:
+            text = " ".join(text.split()[:int(max_tokens / 1.3)])
+            completion_tokens = max_tokens
+
+        slowdown = self.slow_factor if rng.random() < self.slow_rate else 1.0
+        return text, prompt_tokens, completion_tokens, ttft, slowdown
+
+    def _respond(self, prompt: str, model: str, rng: random.Random) -> str:
+        """Pick a canned response shape from the prompt."""
+        if "=== RESULT [number] ===" in prompt:
+            return self._batch_validation(prompt, model, rng)
+        if "content quality validator" in prompt:
+            return self._validation(prompt, model, rng)
+        if "TITLE: [title]" in prompt:
+            return self._outline(rng)
+        if "TRANSITION 1: [sentence]" in prompt:
+            count = len(re.findall(r'Boundary \d+:', prompt))
+            return "\n".join(
+                f"TRANSITION {i + 1}: {rng.choice(SENTENCES)}" for i in range(count)
+            )
+
+        if "=== POST [number] ===" in prompt:
+            return self._multi_post(prompt, rng)
+
+        low, high = _target_range(prompt, default=(150, 250))
+        if "Reviewer Feedback:" in prompt:
+            # Revisions respect the length feedback
+            text = self._post(prompt, low, high, rng, overshoot=False)
+            if self.revision_gain:
+                with self._lock:
+                    self._revised[_digest(text)] = None
+                    if len(self._revised) > REVISED_MEMORY:
+                        self._revised.popitem(last=False)
+            return text
+        return self._post(prompt, low, high, rng)
+
+    def _post(
+        self,
+        prompt: str,
+        low: int,
+        high: int,
+        rng: random.Random,
+        overshoot: bool = True
+    ) -> str:
+        """Short-paragraph post of roughly the requested length."""
+        # Now and then overshoot the range, like real models do
+        if overshoot and rng.random() < 0.1:
+            target = int(high * rng.uniform(1.3, 2.5))
+        else:
+            target = rng.randint(low, high)
+
+        match = re.search(r'signature phrase[^:\n]*:\s*(.+)', prompt)
+        phrase = match.group(1).strip() if match else rng.choice(SIGNATURE_PHRASES)
+
+        paragraphs = [f"{phrase}."]
+        words = len(phrase.split())
+        while words < target:
+            sentence = rng.choice(SENTENCES)
+            paragraphs.append(sentence)
+            words += len(sentence.split())
+        return "\n\n".join(paragraphs)
+
+    def _multi_post(self, prompt: str, rng: random.Random) -> str:
+        """Delimited posts for every brief, with the odd malformed block."""
+        blocks = []
+        briefs = re.findall(r'^POST (\d+)\n(?:.*\n)*?Signature phrase: (.+)$', prompt, re.M)
+        for number, phrase in briefs:
+            roll = rng.random()
+            if roll < 0.05:
+                continue  # post dropped entirely
+            body = self._post(f"signature phrase: {phrase}", 150, 250, rng)
+            end = "" if roll < 0.1 else f"\n=== END POST {number} ==="
+            blocks.append(f"=== POST {number} ===\n{body}{end}")
+        return "\n\n".join(blocks)
+
+    def _outline(self, rng: random.Random) -> str:
+        """TITLE/SECTION outline."""
+        lines = ["TITLE: Systems Beat Skill"]
+        for i in range(rng.randint(4, 5)):
+            lines.append(f"SECTION: Part {i + 1} | {rng.choice(SENTENCES)}")
+        return "\n".join(lines)
+
+    def _validation(self, prompt: str, model: str, rng: random.Random) -> str:
+        """Validator response with a SCORE line."""
+        match = re.search(r'Content to Validate:\n(.*?)\n\nContent Type:', prompt, re.S)
+        content = match.group(1) if match else ""
+        low, high = _target_range(prompt, default=(0, 10 ** 6))
+        return self._judgement(content, low, high, model, rng)
+
+    def _batch_validation(self, prompt: str, model: str, rng: random.Random) -> str:
+        """One RESULT block per draft, now and then leaving one out."""
+        low, high = _target_range(prompt, default=(0, 10 ** 6))
+        blocks = []
+        for number, content in re.findall(
+            r'=== DRAFT (\d+) ===\n(.*?)\n=== END DRAFT \1 ===', prompt, re.S
+        ):
+            if rng.random() < 0.05:
+                continue
+            blocks.append(
+                f"=== RESULT {number} ===\n{self._judgement(content, low, high, model, rng)}"
+            )
+        return "\n\n".join(blocks)
+
+    def _judgement(
+        self,
+        content: str,
+        low: int,
+        high: int,
+        model: str,
+        rng: random.Random
+    ) -> str:
+        """SCORE / WORD_COUNT / FEEDBACK block for one piece of content."""
+        word_count = len(content.split())
+
+        score = rng.gauss(MODEL_QUALITY.get(model, 7.8), self.score_sigma)
+        with self._lock:
+            revised = _digest(content.strip()) in self._revised
+        if revised:
+            score += self.revision_gain
+        if not low <= word_count <= high:
+            score -= 3.0
+        score = min(10.0, max(0.0, score))
+
+        return (
+            f"SCORE: {score:.1f}\n"
+            f"WORD_COUNT: {word_count}\n"
+            "FEEDBACK:\n"
+            f"- Criterion 1: {word_count} words (target {low}-{high})\n"
+            "- Criterion 2: Voice is calm and declarative\n"
+            "- Criterion 4: Systems thinking present"
+        )
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.strip().encode()).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def _target_range(prompt: str, default: Tuple[int, int]) -> Tuple[int, int]:
+    """Read the requested word range from a prompt."""
+    for pattern in (r'Target Word Count:\s*(\d+)-(\d+)', r'\((\d+)-(\d+) words\)'):
+        match = re.search(pattern, prompt)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+    match = re.search(r'about (\d+) words', prompt)
+    if match:
+        words = int(match.group(1))
+        return int(words * 0.8), int(words * 1.2)
+    return default
+
+
+class FakeMessage:
+    """Response message shaped like a LangChain AIMessage."""
+
+    def __init__(self, content: str, model: str, prompt_tokens: int, completion_tokens: int):
+        self.content = content
+        self.usage_metadata = {
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        self.response_metadata = {"model_name": model}
+
+
+class FakeChatModel:
+    """Chat model facade over FakeLLM with provider-shaped errors."""
+
+    def __init__(self, fake: FakeLLM, model: str, max_tokens: Optional[int] = None):
+        self.fake = fake
+        self.model = model
+        self.max_tokens = max_tokens
+
+    def invoke(self, prompt: str) -> FakeMessage:
+        """Complete a prompt.
+
+        Raises:
+            openai.RateLimitError: For injected 429s
+            openai.InternalServerError: For injected 500s
+        """
+        try:
+            text, prompt_tokens, completion_tokens = self.fake.complete(
+                prompt, self.model, self.max_tokens
+            )
+        except FakeLLMError as e:
+            raise _to_openai_error(e)
+        return FakeMessage(text, self.model, prompt_tokens, completion_tokens)
+
+    def stream(self, prompt: str) -> Iterator[FakeMessage]:
+        """Stream a completion; the last chunk carries the usage metadata.
+
+        Raises:
+            openai.RateLimitError: For injected 429s
+            openai.InternalServerError: For injected 500s
+        """
+        prompt_tokens = estimate_tokens(prompt)
+        parts = []
+        try:
+            for chunk in self.fake.stream(prompt, self.model, self.max_tokens):
+                parts.append(chunk)
+                yield FakeMessage(chunk, self.model, 0, 0)
+        except FakeLLMError as e:
+            raise _to_openai_error(e)
+        yield FakeMessage("", self.model, prompt_tokens, estimate_tokens("".join(parts)))
+
+
+def _to_openai_error(error: FakeLLMError) -> openai.APIStatusError:
+    """Convert an injected failure into the error the real client raises."""
+    headers = {}
+    if error.retry_after is not None:
+        headers["retry-after"] = str(error.retry_after)
+    response = httpx.Response(
+        error.status,
+        headers=headers,
+        request=httpx.Request("POST", "http://fake-llm/v1/chat/completions")
+    )
+    error_cls = openai.RateLimitError if error.status == 429 else openai.InternalServerError
+    return error_cls(str(error), response=response, body=None)
+
+
+class FakeLLMServer:
+    """Minimal OpenAI-compatible HTTP server backed by FakeLLM."""
+
+    def __init__(self, fake: FakeLLM, host: str = "127.0.0.1", port: int = 8089):
+        fake_llm = fake
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/models"):
+                    models = [{"id": m, "object": "model"} for m in MODELS.values()]
+                    self._send(200, {"data": models})
+                else:
+                    self._send(404, {"error": {"message": "Not found"}})
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": "Not found"}})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                model = body.get("model", "")
+                prompt = "\n".join(
+                    m.get("content", "") for m in body.get("messages", [])
+                    if isinstance(m.get("content"), str)
+                )
+                if body.get("stream"):
+                    self._stream(prompt, model, body)
+                    return
+
+                try:
+                    text, prompt_tokens, completion_tokens = fake_llm.complete(
+                        prompt, model, body.get("max_tokens")
+                    )
+                except FakeLLMError as e:
+                    headers = {"Retry-After": str(e.retry_after)} if e.retry_after else {}
+                    self._send(e.status, {"error": {"message": str(e)}}, headers)
+                    return
+
+                self._send(200, {
+                    "id": f"fake-{hashlib.sha1(text.encode()).hexdigest()[:12]}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                })
+
+            def _stream(self, prompt: str, model: str, body: Dict):
+                """Send the completion as server-sent events."""
+                chunks = fake_llm.stream(prompt, model, body.get("max_tokens"))
+                try:
+                    first = next(chunks, "")
+                except FakeLLMError as e:
+                    headers = {"Retry-After": str(e.retry_after)} if e.retry_after else {}
+                    self._send(e.status, {"error": {"message": str(e)}}, headers)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                completion_id = f"fake-{int(time.time() * 1000)}"
+                created = int(time.time())
+
+                def event(delta: Dict, finish_reason=None, usage=None):
+                    payload = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [] if usage else [{
+                            "index": 0,
+                            "delta": delta,
+                            "finish_reason": finish_reason,
+                        }],
+                    }
+                    if usage:
+                        payload["usage"] = usage
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                    self.wfile.flush()
+
+                parts = []
+                try:
+                    event({"role": "assistant", "content": ""})
+                    if first:
+                        parts.append(first)
+                        event({"content": first})
+                    for chunk in chunks:
+                        parts.append(chunk)
+                        event({"content": chunk})
+                    event({}, finish_reason="stop")
+                    if (body.get("stream_options") or {}).get("include_usage"):
+                        prompt_tokens = estimate_tokens(prompt)
+                        completion_tokens = estimate_tokens("".join(parts))
+                        event({}, usage={
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens,
+                        })
+                    self.wfile.write(b"data: [DONE]\n\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client hung up mid-stream (early stop)
+                    chunks.close()
+
+            def _send(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as LLM_BASE_URL."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def serve_forever(self):
+        """Serve until shutdown() is called."""
+        self.httpd.serve_forever()
+
+    def start(self) -> "FakeLLMServer":
+        """Serve from a daemon thread (for in-process load tests)."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def shutdown(self):
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    """Run the stand-in as an HTTP server."""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--seed", type=int, default=FAKE_LLM_SEED)
+    parser.add_argument("--latency", type=float, default=0.8, help="median seconds to first token")
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0,
+                        help="probability of a hanging call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="probability of a 429")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--revision-gain", type=float, default=0.0,
+                        help="validator score bonus for revised drafts")
+    parser.add_argument("--time-scale", type=float, default=FAKE_LLM_TIME_SCALE)
+    args = parser.parse_args()
+
+    fake = FakeLLM(
+        seed=args.seed,
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        tokens_per_second=args.tokens_per_second,
+        slow_rate=args.slow_rate,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        revision_gain=args.revision_gain,
+        time_scale=args.time_scale
+    )
+    server = FakeLLMServer(fake, host=args.host, port=args.port)
+    print(f"Fake LLM listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
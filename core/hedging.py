@@ -0,0 +1,160 @@
+"""Latency tracking and circuit breaking for hedged LLM calls."""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from core.config import (
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_RESET_SECONDS,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a model's circuit breaker is refusing calls."""
+
+    def __init__(self, model: str):
+        super().__init__(f"Circuit open for {model}: too many consecutive failures")
+        self.model = model
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for one kind of call."""
+
+    def __init__(self, window: int = 200, min_samples: int = LLM_HEDGE_MIN_SAMPLES):
+        """Initialize latency tracker.
+
+        Args:
+            window: Number of most recent latencies kept
+            min_samples: Samples needed before percentiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Record one call latency.
+
+        Args:
+            seconds: Call duration
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency at the given percentile.
+
+        Args:
+            p: Percentile (0-100)
+
+        Returns:
+            Latency in seconds, or None until enough samples are collected
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = sorted(self._samples)
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        return samples[index]
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over consecutive call failures."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = LLM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = LLM_CIRCUIT_RESET_SECONDS
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Time the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call may go through.
+
+        Returns:
+            True if closed, or if this caller gets the single half-open trial
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    print(f"Warning: circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+_trackers: Dict[Tuple[str, str, int], LatencyTracker] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def size_bucket(max_tokens: int) -> int:
+    """Round a completion token limit up to a power of two."""
+    return 1 << max(0, max_tokens - 1).bit_length()
+
+
+def get_latency_tracker(model: str, stage: str = "", max_tokens: int = 0) -> LatencyTracker:
+    """Get the process-wide latency tracker for one kind of call.
+
+    Calls are grouped by model, stage and output size (see size_bucket), so
+    long generations aren't measured against short validation calls.
+
+    Args:
+        model: Model id
+        stage: Pipeline stage (generation, validation, ...)
+        max_tokens: Completion token limit of the call
+    """
+    key = (model, stage, size_bucket(max_tokens))
+    with _registry_lock:
+        if key not in _trackers:
+            _trackers[key] = LatencyTracker()
+        return _trackers[key]
+
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a model."""
+    with _registry_lock:
+        if model not in _breakers:
+            _breakers[model] = CircuitBreaker()
+        return _breakers[model]
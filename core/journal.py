@@ -0,0 +1,129 @@
+"""Append-only JSONL journal of finished batch entries.
+
+Each finished entry is written as one line and fsynced before the batch
+moves on, so a crash or interrupt loses at most the entries in flight.
+Entries are identified by a key derived from their calendar fields, so a
+re-run can tell which work is already done. Each record also carries the key
+of the settings it was produced with (models, pass threshold); a journal
+opened with other settings doesn't reuse it::
+
+    journal = BatchJournal("batch_journal.jsonl", settings=settings_key({...}))
+    done = journal.get(entry_key(entry))
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+
+def entry_key(calendar_entry: Dict) -> str:
+    """Stable key for a calendar entry.
+
+    Args:
+        calendar_entry: Calendar entry dict
+
+    Returns:
+        Hex digest of the fields that define the work (post number, week,
+        topic, lens, objective, content type)
+    """
+    fields = [
+        calendar_entry.get("post_number"),
+        calendar_entry.get("week"),
+        calendar_entry.get("topic"),
+        calendar_entry.get("lens"),
+        calendar_entry.get("objective"),
+        calendar_entry.get("content_type", "LinkedIn"),
+    ]
+    return hashlib.sha256(json.dumps(fields).encode()).hexdigest()[:16]
+
+
+def settings_key(settings: Dict) -> str:
+    """Stable key for the generation settings a result was produced with.
+
+    Args:
+        settings: JSON-serializable settings (e.g. models and pass threshold)
+
+    Returns:
+        Hex digest of the settings
+    """
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class BatchJournal:
+    """Durable record of finished entries, keyed by entry_key."""
+
+    def __init__(self, path: str, settings: Optional[str] = None):
+        """Open (or create) a journal and load the entries already in it.
+
+        A torn last line from a crash mid-write is ignored. Later records
+        for the same key replace earlier ones.
+
+        Args:
+            path: JSONL file path
+            settings: Settings key (see settings_key) stored with new records;
+                records written with other settings aren't returned by get
+                (None to reuse records regardless of settings)
+        """
+        self.path = path
+        self.settings = settings
+        # Offsets of the records on disk at open; results are read back on
+        # demand, so a journal of a large calendar isn't held in memory
+        self.offsets: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        needs_newline = False
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                offset = 0
+                for line in f:
+                    needs_newline = not line.endswith(b"\n")
+                    try:
+                        self.offsets[json.loads(line)["key"]] = offset
+                    except (ValueError, KeyError, TypeError):
+                        pass
+                    offset += len(line)
+
+        self._file = open(path, "a", encoding="utf-8")
+        if needs_newline:
+            # Start fresh after a torn line instead of appending to it
+            self._file.write("\n")
+        self._reader = open(path, "rb")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get the result journaled for a key before this run, if any.
+
+        Results produced with other settings than the journal's are ignored.
+        """
+        offset = self.offsets.get(key)
+        if offset is None:
+            return None
+        with self._lock:
+            self._reader.seek(offset)
+            record = json.loads(self._reader.readline())
+        if self.settings is not None and record.get("settings") != self.settings:
+            return None
+        return record["result"]
+
+    def append(self, key: str, result: Dict):
+        """Durably record a finished entry.
+
+        Args:
+            key: Entry key
+            result: Result dict
+        """
+        line = json.dumps({"key": key, "settings": self.settings, "result": result}) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
+            self._reader.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
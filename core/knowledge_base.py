@@ -1,6 +1,10 @@
 """RAG knowledge base implementation with ChromaDB and HuggingFace embeddings."""
 
+import glob
+import hashlib
 import os
+import threading
+import time
 from typing import List, Optional
 
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -9,6 +13,59 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders import DirectoryLoader, TextLoader
 
 from core.config import KNOWLEDGE_BASE_DIR, VECTOR_STORE_DIR
+from core.usage import UsageRecord, record_usage
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Written next to the persisted index: fingerprint of the documents it holds
+FINGERPRINT_FILE = "kb_fingerprint"
+# Fingerprint prefix of an index built from documents passed in explicitly;
+# such an index is kept as built instead of following the knowledge base
+EXPLICIT_FINGERPRINT_PREFIX = "explicit:"
+
+
+def documents_fingerprint(documents: List) -> str:
+    """Hash of explicitly indexed documents, marked with EXPLICIT_FINGERPRINT_PREFIX.
+    
+    Args:
+        documents: Documents with page_content and metadata
+        
+    Returns:
+        Prefixed hex digest
+    """
+    digest = hashlib.sha256()
+    for document in documents:
+        digest.update(str(document.metadata.get("source", "")).encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(document.page_content.encode()).digest())
+    return EXPLICIT_FINGERPRINT_PREFIX + digest.hexdigest()
+
+
+def knowledge_base_fingerprint(directory: Optional[str] = None) -> str:
+    """Hash of the documents the knowledge base is built from.
+    
+    Covers the same .md and .txt files load_documents reads, by relative
+    path and content, so it changes whenever a document is added, removed
+    or edited.
+    
+    Args:
+        directory: Knowledge base directory, or None for KNOWLEDGE_BASE_DIR
+        
+    Returns:
+        Hex digest (the same for every empty or missing directory)
+    """
+    directory = directory or KNOWLEDGE_BASE_DIR
+    paths = set()
+    for pattern in ("**/*.md", "**/*.txt"):
+        paths.update(glob.glob(os.path.join(directory, pattern), recursive=True))
+        
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, directory).encode())
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
 
 
 class KnowledgeBase:
@@ -22,10 +79,13 @@ class KnowledgeBase:
         """
         self.collection_name = collection_name
         self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
+            model_name=EMBEDDING_MODEL
         )
         self.vector_store_path = os.path.join(VECTOR_STORE_DIR, collection_name)
         self.vector_store = None
+        # Agents share one knowledge base across threads; only one of them
+        # may load (or build) the vector store
+        self._load_lock = threading.Lock()
         
     def load_documents(self, directory: Optional[str] = None) -> List:
         """Load documents from knowledge base directory.
@@ -74,14 +134,26 @@ class KnowledgeBase:
         return documents
         
     def build_vector_store(self, documents: Optional[List] = None):
-        """Build or update vector store from documents.
+        """Build vector store from documents, replacing any existing index.
+        
+        The index is stamped with a fingerprint of what it holds. One built
+        from explicit documents is loaded as is by load_vector_store and left
+        alone by refresh; build again with None to go back to the knowledge
+        base directory.
         
         Args:
             documents: List of documents to index, or None to load all
         """
         if documents is None:
+            fingerprint = knowledge_base_fingerprint()
             documents = self.load_documents()
+        else:
+            fingerprint = documents_fingerprint(documents)
             
+        # Chroma adds to an existing collection, so old chunks (including
+        # those of deleted or edited documents) have to go first
+        self.clear_vector_store()
+        
         if not documents:
             print("Warning: No documents found to index")
             return
@@ -103,21 +175,90 @@ class KnowledgeBase:
             collection_name=self.collection_name
         )
         
+        with open(os.path.join(self.vector_store_path, FINGERPRINT_FILE), "w") as f:
+            f.write(fingerprint)
+        
         print(f"Indexed {len(splits)} chunks from {len(documents)} documents")
         
+    def clear_vector_store(self):
+        """Delete the persisted collection and its fingerprint."""
+        store = self.vector_store
+        if store is None and os.path.exists(self.vector_store_path):
+            store = Chroma(
+                persist_directory=self.vector_store_path,
+                embedding_function=self.embeddings,
+                collection_name=self.collection_name
+            )
+        if store is not None:
+            store.delete_collection()
+        self.vector_store = None
+        
+        fingerprint_path = os.path.join(self.vector_store_path, FINGERPRINT_FILE)
+        if os.path.exists(fingerprint_path):
+            os.remove(fingerprint_path)
+            
+    def stored_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the documents the persisted index was built from.
+        
+        Returns:
+            Hex digest, or None if there is no index or it predates
+            fingerprinting
+        """
+        try:
+            with open(os.path.join(self.vector_store_path, FINGERPRINT_FILE)) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+            
+    def is_current(self) -> bool:
+        """Check whether the persisted index needs no rebuild.
+        
+        Returns:
+            True if it was built from explicit documents or from the
+            knowledge base documents as they are now
+        """
+        stored = self.stored_fingerprint()
+        if stored is not None and stored.startswith(EXPLICIT_FINGERPRINT_PREFIX):
+            return True
+        return stored == knowledge_base_fingerprint()
+        
     def load_vector_store(self):
-        """Load existing vector store from disk."""
-        if os.path.exists(self.vector_store_path):
+        """Load existing vector store from disk.
+        
+        An index built from other documents than the knowledge base holds
+        now (or with no fingerprint) is rebuilt instead, unless it was built
+        from explicit documents.
+        """
+        if not os.path.exists(self.vector_store_path):
+            print(f"No existing vector store found at {self.vector_store_path}")
+            print("Building new vector store...")
+            self.build_vector_store()
+        elif not self.is_current():
+            print("Knowledge base changed since the vector store was built; rebuilding...")
+            self.build_vector_store()
+        else:
             self.vector_store = Chroma(
                 persist_directory=self.vector_store_path,
                 embedding_function=self.embeddings,
                 collection_name=self.collection_name
             )
             print(f"Loaded vector store from {self.vector_store_path}")
-        else:
-            print(f"No existing vector store found at {self.vector_store_path}")
-            print("Building new vector store...")
+            
+    def refresh(self) -> bool:
+        """Rebuild the index if the knowledge base documents changed.
+        
+        An index built from explicit documents is never rebuilt.
+        
+        Returns:
+            True if the index was rebuilt
+        """
+        with self._load_lock:
+            if self.is_current():
+                if self.vector_store is None:
+                    self.load_vector_store()
+                return False
             self.build_vector_store()
+            return True
             
     def search(self, query: str, k: int = 5) -> List[str]:
         """Search knowledge base for relevant context.
@@ -130,18 +271,27 @@ class KnowledgeBase:
             List of relevant text chunks
         """
         if self.vector_store is None:
-            self.load_vector_store()
-            
+            with self._load_lock:
+                if self.vector_store is None:
+                    self.load_vector_store()
+                    
         if self.vector_store is None:
             print("Warning: Vector store not available")
             return []
             
+        start = time.monotonic()
         try:
             results = self.vector_store.similarity_search(query, k=k)
             return [doc.page_content for doc in results]
         except Exception as e:
             print(f"Error searching vector store: {e}")
             return []
+        finally:
+            record_usage(UsageRecord(
+                stage="rag",
+                model=EMBEDDING_MODEL,
+                latency=time.monotonic() - start
+            ))
             
     def get_context(self, topic: str, lens: str, objective: str, k: int = 5) -> str:
         """Get relevant context for content generation.
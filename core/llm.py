@@ -0,0 +1,435 @@
+"""Shared LLM client used by all agents."""
+
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Tuple
+
+import httpx
+import openai
+from langchain_core.messages import AIMessage
+from langchain_openai import ChatOpenAI
+
+from core.config import (
+    OPENROUTER_API_KEY,
+    LLM_BACKEND,
+    LLM_BASE_URL,
+    LLM_TIMEOUT,
+    LLM_HEDGE,
+    LLM_HEDGE_PERCENTILE,
+    HEDGE_FALLBACK_MODELS,
+    MODELS,
+    RATE_LIMIT_MAX_CONCURRENCY,
+    RATE_LIMITS,
+)
+from core.fake_llm import FakeChatModel, FakeLLM, estimate_tokens
+from core.hedging import CircuitOpenError, get_circuit_breaker, get_latency_tracker
+from core.output_guard import EarlyStopError
+from core.rate_limiter import get_rate_limiter
+from core.usage import UsageRecord, record_usage, submit_with_context
+
+
+def _hedge_workers() -> int:
+    """Threads needed for both legs of every call the rate limits let through."""
+    models = set(MODELS.values()) | set(HEDGE_FALLBACK_MODELS.values())
+    return 2 * sum(
+        RATE_LIMITS.get(model, {}).get("max_concurrency", RATE_LIMIT_MAX_CONCURRENCY)
+        for model in models
+    )
+
+
+# Runs the primary and backup legs of hedged calls
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=_hedge_workers(), thread_name_prefix="llm-hedge"
+)
+
+
+class LLMBackend(ABC):
+    """Source of chat models for LLMClient.
+
+    A chat model is anything with ``invoke(prompt)`` returning a message
+    with a ``content`` string and ``stream(prompt)`` yielding chunks with a
+    ``content`` string, raising ``openai`` errors on failure.
+    """
+
+    @abstractmethod
+    def chat_model(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: float
+    ) -> Any:
+        """Create a chat model.
+
+        Args:
+            model: Model id
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            timeout: Deadline in seconds for a single request
+
+        Returns:
+            Chat model instance
+        """
+
+
+class OpenRouterBackend(LLMBackend):
+    """OpenAI-compatible HTTP endpoint (OpenRouter unless LLM_BASE_URL says otherwise)."""
+
+    def __init__(
+        self,
+        base_url: str = LLM_BASE_URL,
+        api_key: Optional[str] = OPENROUTER_API_KEY
+    ):
+        """Initialize backend.
+
+        Args:
+            base_url: API base URL
+            api_key: API key
+        """
+        self.base_url = base_url
+        self.api_key = api_key
+
+    def chat_model(self, model: str, temperature: float, max_tokens: int, timeout: float):
+        """Create a ChatOpenAI model against the configured endpoint."""
+        # Retries are handled by the rate limiter so that 429s feed back
+        # into its concurrency limit instead of hammering the provider
+        return ChatOpenAI(
+            model=model,
+            openai_api_key=self.api_key,
+            openai_api_base=self.base_url,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            max_retries=0,
+            stream_usage=True
+        )
+
+
+class FakeBackend(LLMBackend):
+    """In-process deterministic stand-in (see core.fake_llm)."""
+
+    def __init__(self, fake: Optional[FakeLLM] = None):
+        """Initialize backend.
+
+        Args:
+            fake: FakeLLM instance to share across models (default settings if None)
+        """
+        self.fake = fake or FakeLLM()
+
+    def chat_model(self, model: str, temperature: float, max_tokens: int, timeout: float):
+        """Create a fake chat model."""
+        return FakeChatModel(self.fake, model, max_tokens)
+
+
+_backend: Optional[LLMBackend] = None
+
+
+def get_backend() -> LLMBackend:
+    """Get the process-wide backend, chosen by LLM_BACKEND on first use."""
+    global _backend
+    if _backend is None:
+        if LLM_BACKEND == "fake":
+            _backend = FakeBackend()
+        elif LLM_BACKEND == "openrouter":
+            _backend = OpenRouterBackend()
+        else:
+            raise ValueError(f"Unknown LLM_BACKEND: {LLM_BACKEND}")
+    return _backend
+
+
+def set_backend(backend: LLMBackend):
+    """Replace the process-wide backend (affects clients created afterwards).
+
+    Args:
+        backend: Backend to use
+    """
+    global _backend
+    _backend = backend
+
+
+def response_tokens(prompt: str, response: Any) -> Tuple[int, int]:
+    """Read prompt/completion token counts from a chat model response.
+
+    Falls back to a character-based estimate when the provider didn't
+    report usage.
+
+    Args:
+        prompt: Prompt text
+        response: Chat model response message
+
+    Returns:
+        Tuple of (prompt_tokens, completion_tokens)
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage.get("input_tokens") or usage.get("output_tokens"):
+        return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+    token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    if token_usage:
+        return token_usage.get("prompt_tokens", 0), token_usage.get("completion_tokens", 0)
+
+    return estimate_tokens(prompt), estimate_tokens(getattr(response, "content", "") or "")
+
+
+class LLMClient:
+    """Chat model from the configured backend behind the shared rate limiter.
+
+    Every request has a deadline. With hedging enabled, a call that runs past
+    the p95 latency of calls like it (same model, stage and output size) gets
+    a duplicate request (to the fallback model if one is configured) and the
+    first response wins. A circuit breaker stops
+    routing to a model that keeps failing, diverting to the fallback if any.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = LLM_TIMEOUT,
+        hedge: bool = LLM_HEDGE,
+        fallback_model: Optional[str] = None,
+        backend: Optional[LLMBackend] = None,
+        stage: str = "generation"
+    ):
+        """Initialize LLM client.
+
+        Args:
+            model: Model id
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            timeout: Deadline in seconds for a single request
+            hedge: Whether to hedge calls slower than the model's p95
+            fallback_model: Model for hedged/diverted requests
+                (defaults to HEDGE_FALLBACK_MODELS, else the same model)
+            backend: Backend to create the chat model from
+                (defaults to the process-wide backend)
+            stage: Pipeline stage recorded in usage accounting
+                (generation, validation, ...)
+        """
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.hedge = hedge
+        self.fallback_model = fallback_model or HEDGE_FALLBACK_MODELS.get(model)
+        self.backend = backend or get_backend()
+        self.stage = stage
+        self._fallback = None
+
+        self.llm = self.backend.chat_model(model, temperature, max_tokens, timeout)
+        self.rate_limiter = get_rate_limiter(model)
+        self.latency = get_latency_tracker(model, stage, max_tokens)
+        self.breaker = get_circuit_breaker(model)
+
+    @property
+    def fallback(self) -> Optional["LLMClient"]:
+        """Client for the fallback model, created on first use."""
+        if self.fallback_model and self._fallback is None:
+            self._fallback = LLMClient(
+                model=self.fallback_model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                timeout=self.timeout,
+                hedge=False,
+                backend=self.backend,
+                stage=self.stage
+            )
+        return self._fallback
+
+    def invoke(self, prompt: str):
+        """Send a prompt to the model.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Chat model response message
+
+        Raises:
+            CircuitOpenError: If the model's circuit is open and there is
+                no fallback model to divert to
+        """
+        if not self.breaker.allow():
+            if self.fallback is not None:
+                print(f"Warning: circuit open for {self.model}, routing to {self.fallback_model}")
+                return self.fallback.invoke(prompt)
+            raise CircuitOpenError(self.model)
+
+        if self.hedge:
+            return self._invoke_hedged(prompt)
+        return self._invoke_direct(prompt)
+
+    def _invoke_direct(self, prompt: str):
+        """Make one rate-limited call, feeding the latency tracker, breaker and usage."""
+        tries = 0
+
+        def call():
+            nonlocal tries
+            tries += 1
+            return self.llm.invoke(prompt)
+
+        start = time.monotonic()
+        try:
+            response = self.rate_limiter.call(call)
+        except Exception:
+            self.breaker.record_failure()
+            record_usage(UsageRecord(
+                stage=self.stage,
+                model=self.model,
+                prompt_tokens=estimate_tokens(prompt),
+                latency=time.monotonic() - start,
+                retries=max(0, tries - 1),
+                error=True
+            ))
+            raise
+        latency = time.monotonic() - start
+        self.breaker.record_success()
+        self.latency.record(latency)
+
+        prompt_tokens, completion_tokens = response_tokens(prompt, response)
+        record_usage(UsageRecord(
+            stage=self.stage,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency=latency,
+            retries=tries - 1
+        ))
+        return response
+
+    def stream(
+        self,
+        prompt: str,
+        should_stop: Optional[Callable[[str], Optional[str]]] = None
+    ) -> AIMessage:
+        """Stream a completion, abandoning it as soon as it goes wrong.
+
+        The whole stream shares the request deadline, not just each chunk; a
+        stream that runs past it fails like a timed-out request. A started
+        stream can't be hedged, so with hedging enabled this makes a hedged
+        invoke instead and runs should_stop over the finished text.
+
+        Args:
+            prompt: Prompt text
+            should_stop: Called with each new chunk of text; returning a
+                reason closes the stream
+
+        Returns:
+            Message with the full content and usage metadata
+
+        Raises:
+            EarlyStopError: If should_stop asked to stop (carries the partial text)
+            CircuitOpenError: If the model's circuit is open and there is
+                no fallback model to divert to
+        """
+        if not self.breaker.allow():
+            if self.fallback is not None:
+                print(f"Warning: circuit open for {self.model}, routing to {self.fallback_model}")
+                return self.fallback.stream(prompt, should_stop)
+            raise CircuitOpenError(self.model)
+
+        if self.hedge:
+            response = self._invoke_hedged(prompt)
+            reason = should_stop(response.content) if should_stop else None
+            if reason:
+                raise EarlyStopError(reason, response.content)
+            return response
+
+        tries = 0
+
+        def call():
+            nonlocal tries
+            tries += 1
+            parts = []
+            usage = None
+            deadline = time.monotonic() + self.timeout
+            for chunk in self.llm.stream(prompt):
+                if time.monotonic() > deadline:
+                    raise openai.APITimeoutError(
+                        request=httpx.Request("POST", f"stream://{self.model}")
+                    )
+                text = chunk.content or ""
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                if not text:
+                    continue
+                parts.append(text)
+                reason = should_stop(text) if should_stop else None
+                if reason:
+                    # Leaving the loop closes the stream, so the provider
+                    # stops generating (and billing) the rest
+                    raise EarlyStopError(reason, "".join(parts))
+            return AIMessage(content="".join(parts), usage_metadata=usage)
+
+        start = time.monotonic()
+        try:
+            response = self.rate_limiter.call(call)
+        except EarlyStopError as e:
+            self.breaker.record_success()
+            record_usage(UsageRecord(
+                stage=self.stage,
+                model=self.model,
+                prompt_tokens=estimate_tokens(prompt),
+                completion_tokens=estimate_tokens(e.partial),
+                latency=time.monotonic() - start,
+                retries=tries - 1,
+                early_stopped=True
+            ))
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            record_usage(UsageRecord(
+                stage=self.stage,
+                model=self.model,
+                prompt_tokens=estimate_tokens(prompt),
+                latency=time.monotonic() - start,
+                retries=max(0, tries - 1),
+                error=True
+            ))
+            raise
+        latency = time.monotonic() - start
+        self.breaker.record_success()
+        self.latency.record(latency)
+
+        prompt_tokens, completion_tokens = response_tokens(prompt, response)
+        record_usage(UsageRecord(
+            stage=self.stage,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency=latency,
+            retries=tries - 1
+        ))
+        return response
+
+    def _invoke_hedged(self, prompt: str):
+        """Make a call, firing a backup request if it runs past p95."""
+        hedge_after = self.latency.percentile(LLM_HEDGE_PERCENTILE)
+        if hedge_after is None:
+            # Not enough history yet to know what "slow" means
+            return self._invoke_direct(prompt)
+
+        primary = submit_with_context(_hedge_executor, self._invoke_direct, prompt)
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        backup_model = self.fallback_model or self.model
+        print(f"Hedging {self.model} call after {hedge_after:.1f}s -> {backup_model}")
+        if self.fallback is not None:
+            backup = submit_with_context(_hedge_executor, self.fallback.invoke, prompt)
+        else:
+            backup = submit_with_context(_hedge_executor, self._invoke_direct, prompt)
+
+        # First successful response wins; the loser finishes in the background
+        pending = {primary, backup}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+        raise error
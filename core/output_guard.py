@@ -0,0 +1,135 @@
+"""Output sizing and early-stop checks for streamed generations."""
+
+import math
+import re
+from typing import Any, Optional, Tuple
+
+from core.config import (
+    TOKENS_PER_WORD,
+    OUTPUT_WORD_MARGIN,
+    EARLY_STOP_OVERSHOOT,
+    EARLY_STOP_RETRIES,
+)
+
+# Emoji blocks plus the BMP symbols that render as emoji by default; text
+# symbols such as ✓, ✗ and ★ in the same BMP blocks are left alone. Must stay
+# a single character class (core.voice_rules builds its scanner from it)
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F300-\U0001F5FF"  # misc symbols and pictographs
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F680-\U0001F6FF"  # transport and map symbols
+    "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
+    "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
+    "\U0001F1E6-\U0001F1FF"  # flags
+    "\u231A\u231B\u23E9-\u23EC\u23F0\u23F3"  # watch, hourglass, media, alarm
+    "\u2614\u2615\u2648-\u2653\u267F\u2693\u26A1\u26AA\u26AB"
+    "\u26BD\u26BE\u26C4\u26C5\u26CE\u26D4\u26EA\u26F2\u26F3\u26F5\u26FA\u26FD"
+    "\u2705\u270A\u270B\u2728\u274C\u274E\u2753-\u2755\u2757"
+    "\u2795-\u2797\u27B0\u27BF\u2B1B\u2B1C\u2B50\u2B55"
+    "]"
+)
+
+
+class EarlyStopError(Exception):
+    """A streamed generation was abandoned because it can't pass validation."""
+
+    def __init__(self, reason: str, partial: str = ""):
+        super().__init__(f"Generation stopped early: {reason}")
+        self.reason = reason
+        self.partial = partial
+
+
+def word_range(target_words: str) -> Tuple[int, int]:
+    """Parse a target range like "150-250" into (low, high)."""
+    low, high = (int(n) for n in target_words.split("-"))
+    return low, high
+
+
+def max_tokens_for(target_words: str, margin: float = OUTPUT_WORD_MARGIN) -> int:
+    """Completion token limit for a target word range.
+
+    Args:
+        target_words: Target word range, e.g. "150-250"
+        margin: Headroom over the top of the range
+
+    Returns:
+        max_tokens for the generation call
+    """
+    _, high = word_range(target_words)
+    return math.ceil(high * margin * TOKENS_PER_WORD)
+
+
+class OutputGuard:
+    """Incremental check of a streamed draft against its content rules.
+
+    Feed it each streamed chunk; it returns a reason as soon as the draft
+    clearly can't pass (too long, or contains an emoji).
+    """
+
+    def __init__(self, target_words: str, overshoot: float = EARLY_STOP_OVERSHOOT):
+        """Initialize guard.
+
+        Args:
+            target_words: Target word range, e.g. "150-250"
+            overshoot: Stop once the draft passes the top of the range
+                by this factor
+        """
+        _, high = word_range(target_words)
+        self.max_words = int(high * overshoot)
+        self.words = 0
+        self._in_word = False
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Account for a new chunk of output.
+
+        Args:
+            chunk: Newly streamed text
+
+        Returns:
+            Reason to stop, or None to keep streaming
+        """
+        if EMOJI_PATTERN.search(chunk):
+            return "emoji in output"
+
+        for piece in re.split(r'(\s+)', chunk):
+            if not piece:
+                continue
+            if piece.isspace():
+                self._in_word = False
+            elif not self._in_word:
+                self.words += 1
+                self._in_word = True
+
+        if self.words > self.max_words:
+            return f"output exceeded {self.max_words} words"
+        return None
+
+
+def stream_guarded(
+    llm: Any,
+    prompt: str,
+    target_words: str,
+    retries: int = EARLY_STOP_RETRIES
+) -> str:
+    """Stream a generation under an OutputGuard, regenerating after early stops.
+
+    Args:
+        llm: LLMClient to stream from
+        prompt: Prompt text
+        target_words: Target word range, e.g. "150-250"
+        retries: Fresh generations to try after an early stop
+
+    Returns:
+        Generated content
+
+    Raises:
+        EarlyStopError: If every generation was stopped early
+    """
+    for attempt in range(retries + 1):
+        try:
+            return llm.stream(prompt, should_stop=OutputGuard(target_words).feed).content
+        except EarlyStopError as e:
+            if attempt >= retries:
+                raise
+            print(f"Warning: {e}, regenerating...")
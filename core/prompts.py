@@ -31,6 +31,75 @@ Generate a LinkedIn post (150-250 words) that:
 Word count: 150-250 words
 Format: Short paragraphs, no emojis, no hashtags"""
 
+# Multi-post LinkedIn Prompt Template (several calendar posts in one call)
+MULTI_POST_PROMPT = """You are an expert content creator generating a series of LinkedIn posts.
+
+Core Thesis: {core_thesis}
+
+Voice Guidelines:
+- Clear, slightly contrarian, calm, practical
+- Grounded in lived experience
+- NO motivational language, buzzwords, emojis, questions at end, or CTAs
+- Short paragraphs (1-2 lines)
+- Declarative statements
+
+Relevant Context from Knowledge Base:
+{context}
+
+Generate {count} separate LinkedIn posts (150-250 words each), one per brief below.
+Each post:
+1. Opens with a contrarian or surprising statement
+2. Analyzes its topic through its lens
+3. Grounds insights in specific, practical examples
+4. Achieves its objective
+5. Uses its signature phrase naturally
+6. Ends with a declarative insight (NO questions or CTAs)
+7. Stands on its own; do not refer to the other posts
+
+{briefs}
+
+Format your response exactly as:
+=== POST [number] ===
+[post text]
+=== END POST [number] ===
+
+Repeat for every brief, using its post number. No other text.
+Word count: 150-250 words per post
+Format: Short paragraphs, no emojis, no hashtags"""
+
+# LinkedIn Revision Prompt Template
+REVISION_PROMPT = """You are an expert content editor revising a LinkedIn post that failed review.
+
+Core Thesis: {core_thesis}
+
+Voice Guidelines:
+- Clear, slightly contrarian, calm, practical
+- Grounded in lived experience
+- NO motivational language, buzzwords, emojis, questions at end, or CTAs
+- Short paragraphs (1-2 lines)
+- Declarative statements
+
+Content Framework:
+Topic: {topic}
+Primary Lens: {lens}
+Objective: {objective}
+
+Previous Draft (score {score:.1f}/10, passing is {min_score:.1f}):
+{draft}
+
+Reviewer Feedback:
+{feedback}
+
+Rewrite the post (150-250 words) so that it:
+1. Fixes every issue raised in the feedback
+2. Keeps the opening, examples and phrasing that already work
+3. Keeps the signature phrase: {signature_phrase}
+4. Ends with a declarative insight (NO questions or CTAs)
+
+Word count: 150-250 words
+Format: Short paragraphs, no emojis, no hashtags
+Return only the revised post."""
+
 # Blog Post Prompt Template
 BLOG_PROMPT = """You are an expert content creator generating blog posts.
 
@@ -95,6 +164,10 @@ Generate an article (1000-2000 words) that:
 Word count: 1000-2000 words
 Format: Well-structured sections, short paragraphs, analytical depth"""
 
+# Bump when VALIDATION_PROMPT or the validator's scoring changes, so cached
+# validation results from the old version are not reused
+VALIDATION_PROMPT_VERSION = "2"
+
 # Validation Prompt Template
 VALIDATION_PROMPT = """You are a content quality validator. Evaluate this content on a 0-10 scale.
 
@@ -125,3 +198,106 @@ FEEDBACK:
 ...
 
 Minimum passing score: 8.0"""
+
+# Batched Validation Prompt Template (several drafts judged in one call)
+BATCH_VALIDATION_PROMPT = """You are a content quality validator.
+Evaluate each draft below independently on a 0-10 scale.
+
+Content Type: {content_type}
+Target Word Count: {target_words}
+
+Evaluation Criteria:
+1. Word Count (meets target range)
+2. Voice Compliance (clear, contrarian, calm, practical)
+3. No Banned Elements (emojis, CTAs, questions at end, buzzwords, motivational language)
+4. Systems Thinking (reflects core thesis about systems vs. skill)
+5. Practical Grounding (specific examples, lived experience)
+6. Insight Quality (contrarian, actionable, well-supported)
+7. Paragraph Structure (short, 1-2 lines)
+8. Declarative Style (avoids questions, especially at end)
+
+Judge every draft on its own merits; do not compare drafts with each other.
+
+{drafts}
+
+For every draft, respond exactly as:
+=== RESULT [number] ===
+SCORE: [number]
+WORD_COUNT: [actual count]
+FEEDBACK:
+- Criterion 1: [feedback]
+- Criterion 2: [feedback]
+...
+
+Minimum passing score: 8.0"""
+
+# Long-form Outline Prompt Template
+OUTLINE_PROMPT = """You are an expert content creator planning a {content_type}.
+
+Core Thesis: {core_thesis}
+
+Content Framework:
+Topic: {topic}
+Primary Lens: {lens}
+Objective: {objective}
+
+Relevant Context from Knowledge Base:
+{context}
+
+Plan a {content_type} of {target_words} words with {min_sections}-{max_sections} sections.
+The first section opens with a hook that challenges conventional wisdom.
+The last section ends with synthesis and practical implications.
+
+Format your response exactly as:
+TITLE: [title]
+SECTION: [subheading] | [one-sentence point the section makes]
+SECTION: [subheading] | [one-sentence point the section makes]
+...
+
+No other text."""
+
+# Long-form Section Prompt Template
+SECTION_PROMPT = """You are an expert content creator writing one section of a {content_type}.
+
+Core Thesis: {core_thesis}
+
+Voice Guidelines:
+- Clear, slightly contrarian, calm, practical
+- Grounded in lived experience
+- NO motivational language, buzzwords, emojis
+- Short paragraphs (1-2 lines)
+- Declarative statements
+
+Topic: {topic}
+Primary Lens: {lens}
+Objective: {objective}
+
+Full Outline:
+{outline}
+
+You are writing section {index} of {total}: "{heading}"
+Point of this section: {point}
+{position_note}
+
+Relevant Context from Knowledge Base:
+{context}
+
+Write only the body of this section (about {section_words} words).
+Do not repeat the subheading. Do not summarize other sections.
+Use this signature phrase if it fits naturally: {signature_phrase}"""
+
+# Long-form Transition Prompt Template
+TRANSITION_PROMPT = """You are editing a {content_type} whose sections were written separately.
+
+For each boundary below, write one short sentence that opens the next section
+and connects it to the end of the previous one. Same voice: calm, declarative,
+no questions, no emojis.
+
+{boundaries}
+
+Format your response exactly as:
+TRANSITION 1: [sentence]
+TRANSITION 2: [sentence]
+...
+
+No other text."""
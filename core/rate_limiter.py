@@ -0,0 +1,287 @@
+"""Per-model rate limiting with AIMD concurrency and retry/backoff."""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, TypeVar
+
+import openai
+
+from core.config import (
+    RATE_LIMIT_REQUESTS_PER_MINUTE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_CONCURRENCY,
+    RATE_LIMITS,
+    LLM_MAX_RETRIES,
+    LLM_BACKOFF_BASE,
+    LLM_BACKOFF_MAX,
+    LLM_RETRY_DEADLINE,
+)
+
+T = TypeVar("T")
+
+# Errors worth retrying after a pause; anything else is raised immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for a while (e.g. after Retry-After).
+
+        Args:
+            seconds: Pause duration
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(
+                        self.capacity, self.tokens + (now - self.updated) * self.rate
+                    )
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.updated = self.paused_until
+                    wait = self.paused_until - now
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted AIMD-style from observed rate limiting.
+
+    Every success grows the limit by 1/limit (about +1 per full window);
+    a 429 halves it, at most once per cooldown so one burst of rejections
+    doesn't collapse it to the floor.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial: Optional[int] = None,
+        cooldown: float = 5.0
+    ):
+        """Initialize concurrency limiter.
+
+        Args:
+            max_limit: Upper bound on concurrent calls
+            min_limit: Lower bound on concurrent calls
+            initial: Starting limit (defaults to max_limit)
+            cooldown: Minimum seconds between multiplicative decreases
+        """
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(initial or max_limit)
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until a concurrency slot is free and take it."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self):
+        """Return a concurrency slot."""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        """Additive increase after a successful call."""
+        with self._cond:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def on_rate_limited(self):
+        """Multiplicative decrease after a 429."""
+        with self._cond:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self.limit = max(self.min_limit, self.limit / 2)
+                self._last_decrease = now
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read the Retry-After delay from a provider error, if present.
+
+    Args:
+        error: Exception raised by the provider client
+
+    Returns:
+        Delay in seconds, or None if the response carried no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class ModelRateLimiter:
+    """Token bucket, adaptive concurrency and retry/backoff for one model."""
+
+    def __init__(
+        self,
+        model: str,
+        requests_per_minute: int = RATE_LIMIT_REQUESTS_PER_MINUTE,
+        burst: int = RATE_LIMIT_BURST,
+        max_concurrency: int = RATE_LIMIT_MAX_CONCURRENCY,
+        max_retries: int = LLM_MAX_RETRIES,
+        backoff_base: float = LLM_BACKOFF_BASE,
+        backoff_max: float = LLM_BACKOFF_MAX,
+        retry_deadline: float = LLM_RETRY_DEADLINE
+    ):
+        """Initialize model rate limiter.
+
+        Args:
+            model: Model id this limiter guards
+            requests_per_minute: Sustained request rate
+            burst: Requests allowed back to back
+            max_concurrency: Upper bound on concurrent calls
+            max_retries: Retries for retryable errors before giving up
+            backoff_base: First backoff delay in seconds
+            backoff_max: Cap on a single backoff delay
+            retry_deadline: Seconds after the first attempt starts beyond
+                which no retry is started
+        """
+        self.model = model
+        self.bucket = TokenBucket(rate=requests_per_minute / 60.0, capacity=burst)
+        self.concurrency = AdaptiveConcurrencyLimiter(max_limit=max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_deadline = retry_deadline
+
+    def backoff(self, retry: int) -> float:
+        """Exponential backoff with full jitter.
+
+        Args:
+            retry: Zero-based retry number
+
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** retry))
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run an LLM call under this model's limits, retrying transient errors.
+
+        Args:
+            fn: Zero-argument callable making the request
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            The last error once retries are exhausted or the retry deadline
+            would be passed, or any non-retryable error immediately
+        """
+        deadline = time.monotonic() + self.retry_deadline
+        for retry in range(self.max_retries + 1):
+            self.bucket.acquire()
+            self.concurrency.acquire()
+            started = time.monotonic()
+            try:
+                result = fn()
+            except RETRYABLE_ERRORS as e:
+                if retry >= self.max_retries:
+                    raise
+                delay = self.backoff(retry)
+                # A retried timeout is expected to take as long again, so
+                # it needs that much time left before the deadline
+                needed = delay
+                if isinstance(e, openai.APITimeoutError):
+                    needed += time.monotonic() - started
+                if isinstance(e, openai.RateLimitError):
+                    self.concurrency.on_rate_limited()
+                    retry_after = retry_after_seconds(e)
+                    if retry_after is not None:
+                        # Provider told us when to come back: hold every
+                        # caller of this model, not just this one
+                        self.bucket.pause(retry_after)
+                        delay = max(delay, retry_after)
+                        needed = max(needed, retry_after)
+                if time.monotonic() + needed > deadline:
+                    raise
+                print(
+                    f"Warning: {self.model} call failed ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s ({retry + 1}/{self.max_retries})"
+                )
+            else:
+                self.concurrency.on_success()
+                return result
+            finally:
+                self.concurrency.release()
+            time.sleep(delay)
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: str) -> ModelRateLimiter:
+    """Get the process-wide rate limiter for a model.
+
+    Args:
+        model: Model id
+
+    Returns:
+        Shared ModelRateLimiter, created with RATE_LIMITS overrides on first use
+    """
+    with _limiters_lock:
+        if model not in _limiters:
+            _limiters[model] = ModelRateLimiter(model, **RATE_LIMITS.get(model, {}))
+        return _limiters[model]
@@ -0,0 +1,138 @@
+"""Budgets, cost prediction and ordering for budgeted batch runs.
+
+With a budget, the batch processor schedules single attempts rather than
+whole entries. Every entry gets its first attempt before any entry gets a
+retry, and within the same attempt count earlier weeks and higher
+priorities go first. Before each attempt, its predicted cost is checked
+against what is left; once an attempt would overrun the budget or the
+deadline, nothing more is started and the unfinished entries are reported::
+
+    budget = BatchBudget(max_cost=5.0, deadline=time.time() + 8 * 3600)
+    processor.process_batch(calendar="calendars/q3.jsonl", budget=budget)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from core.config import PREDICTED_ATTEMPT_SECONDS, PREDICTED_ATTEMPT_TOKENS
+from core.usage import estimate_cost
+
+# Why a budgeted run stopped early
+TOKEN_BUDGET = "token budget"
+COST_BUDGET = "cost budget"
+DEADLINE = "deadline"
+
+
+@dataclass
+class BatchBudget:
+    """Limits for one batch run; unset limits don't apply."""
+
+    max_tokens: Optional[int] = None
+    max_cost: Optional[float] = None
+    deadline: Optional[float] = None  # time.time() timestamp
+
+    def exceeded_by(
+        self,
+        tokens: int,
+        cost: float,
+        seconds: float,
+        now: Optional[float] = None
+    ) -> Optional[str]:
+        """Check whether spending this much more would break a limit.
+
+        Args:
+            tokens: Tokens spent or committed, including the next attempt
+            cost: Cost spent or committed, including the next attempt
+            seconds: Predicted duration of the next attempt
+            now: Current time.time() (defaults to now)
+
+        Returns:
+            TOKEN_BUDGET, COST_BUDGET or DEADLINE for the first limit that
+            would be broken, or None if everything fits
+        """
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            return TOKEN_BUDGET
+        if self.max_cost is not None and cost > self.max_cost:
+            return COST_BUDGET
+        if self.deadline is not None and (now or time.time()) + seconds > self.deadline:
+            return DEADLINE
+        return None
+
+
+class CostModel:
+    """Predicted tokens, cost and duration of one attempt, per content type.
+
+    Predictions start at PREDICTED_ATTEMPT_TOKENS / PREDICTED_ATTEMPT_SECONDS
+    and move to the averages of the attempts observed so far, with the
+    configured values counting as ``prior_weight`` observations.
+    """
+
+    def __init__(self, prior_weight: int = 3):
+        """Initialize cost model.
+
+        Args:
+            prior_weight: How many observed attempts the configured
+                predictions are worth
+        """
+        self.prior_weight = prior_weight
+        # content_type -> [attempts, prompt_tokens, completion_tokens, seconds]
+        self._observed: Dict[str, list] = {}
+
+    def observe(
+        self,
+        content_type: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        seconds: float
+    ):
+        """Record a finished attempt.
+
+        Args:
+            content_type: Entry's content type
+            prompt_tokens: Prompt tokens the attempt used
+            completion_tokens: Completion tokens the attempt used
+            seconds: Wall-clock duration of the attempt
+        """
+        totals = self._observed.setdefault(content_type, [0, 0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += prompt_tokens
+        totals[2] += completion_tokens
+        totals[3] += seconds
+
+    def predict(self, content_type: str, model: str) -> Tuple[int, float, float]:
+        """Predict the next attempt.
+
+        Args:
+            content_type: Entry's content type
+            model: Model the attempt will run on
+
+        Returns:
+            Tuple of (tokens, cost, seconds)
+        """
+        prior = PREDICTED_ATTEMPT_TOKENS.get(content_type, PREDICTED_ATTEMPT_TOKENS["LinkedIn"])
+        prior_seconds = PREDICTED_ATTEMPT_SECONDS.get(
+            content_type, PREDICTED_ATTEMPT_SECONDS["LinkedIn"]
+        )
+        count, prompt, completion, seconds = self._observed.get(content_type, [0, 0, 0, 0.0])
+        weight = self.prior_weight + count
+        prompt_tokens = round((prior["prompt"] * self.prior_weight + prompt) / weight)
+        completion_tokens = round((prior["completion"] * self.prior_weight + completion) / weight)
+        duration = (prior_seconds * self.prior_weight + seconds) / weight
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        return prompt_tokens + completion_tokens, cost, duration
+
+
+def schedule_key(entry: Dict, attempts: int, index: int) -> Tuple[int, int, int, int]:
+    """Sort key for an entry's next attempt (smallest runs first).
+
+    Args:
+        entry: Calendar entry (its optional integer "priority" defaults to
+            0; higher runs first)
+        attempts: Attempts the entry has had so far
+        index: Entry's position in the calendar (tie-breaker)
+
+    Returns:
+        (attempts, week, -priority, index)
+    """
+    return attempts, entry["week"], -int(entry.get("priority", 0)), index
@@ -0,0 +1,47 @@
+"""Per-task random number generators for reproducible concurrent runs.
+
+Agents draw their random choices (signature phrases, ...) from ``get_rng()``.
+Outside a ``seeded`` block that is the global ``random`` module; inside one
+it is a generator private to the block, so concurrent tasks with their own
+seeds make the same choices whatever order they run in::
+
+    with seeded(f"{seed}:{post_number}"):
+        agent.generate(...)
+"""
+
+import contextvars
+import random
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+_rng: contextvars.ContextVar[Optional[random.Random]] = contextvars.ContextVar(
+    "task_rng", default=None
+)
+
+
+def get_rng():
+    """Get the random number generator for the current context.
+
+    Returns:
+        The enclosing ``seeded`` block's generator, or the ``random``
+        module itself outside one
+    """
+    return _rng.get() or random
+
+
+@contextmanager
+def seeded(seed: Union[int, str]) -> Iterator[random.Random]:
+    """Give the code inside the block its own seeded generator.
+
+    Args:
+        seed: Seed for the block's generator
+
+    Yields:
+        The generator
+    """
+    rng = random.Random(seed)
+    token = _rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _rng.reset(token)
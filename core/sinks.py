@@ -0,0 +1,142 @@
+"""Streaming destinations for batch results.
+
+A sink receives each result as soon as its entry finishes and flushes it
+straight to disk, so other tools can tail the file while the batch runs
+and nothing accumulates in memory::
+
+    with open_sink("results.jsonl.gz") as sink:
+        processor.process_batch(sink=sink, keep_results=False)
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+# Columns written by CsvSink; usage is flattened to tokens and cost
+CSV_FIELDS = [
+    "post_number",
+    "week",
+    "topic",
+    "lens",
+    "objective",
+    "content_type",
+    "passed",
+    "score",
+    "attempts",
+    "revisions",
+    "word_count",
+    "tier",
+    "tokens",
+    "cost",
+    "timestamp",
+    "content",
+    "feedback",
+]
+
+
+class ResultSink(ABC):
+    """Destination that takes results one at a time."""
+
+    def __init__(self, path: str):
+        """Open the sink.
+
+        Args:
+            path: Output file (appended to; gzip-compressed if it ends in .gz)
+        """
+        self.path = path
+        self.count = 0
+        self.is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.compress = path.endswith(".gz")
+        # A compressed sink is one gzip stream (a new member when appending
+        # to an existing file); each record is sync-flushed, so readers can
+        # decompress everything written so far while the batch runs
+        self._file = gzip.open(path, "ab") if self.compress else open(path, "ab")
+        self._lock = threading.Lock()
+
+    def write(self, result: Dict):
+        """Write one result and flush it to disk.
+
+        Args:
+            result: Result dict
+        """
+        self._write_text(self._format(result))
+        self.count += 1
+
+    def _write_text(self, text: str):
+        with self._lock:
+            self._file.write(text.encode("utf-8"))
+            self._file.flush()
+
+    @abstractmethod
+    def _format(self, result: Dict) -> str:
+        """Serialize one result."""
+
+    def close(self):
+        """Close the sink."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    """One JSON object per line (JSONL / NDJSON)."""
+
+    def _format(self, result: Dict) -> str:
+        return json.dumps(result) + "\n"
+
+
+class CsvSink(ResultSink):
+    """One CSV row per result, with a header for a new file."""
+
+    def __init__(self, path: str, fields: List[str] = CSV_FIELDS):
+        """Open the sink.
+
+        Args:
+            path: Output file (appended to; gzip-compressed if it ends in .gz)
+            fields: Columns to write
+        """
+        super().__init__(path)
+        self.fields = fields
+        if self.is_new:
+            self._write_text(self._row(dict(zip(fields, fields))))
+
+    def _format(self, result: Dict) -> str:
+        usage = result.get("usage") or {}
+        return self._row(
+            dict(result, tokens=usage.get("total_tokens", 0), cost=usage.get("cost", 0.0))
+        )
+
+    def _row(self, row: Dict) -> str:
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=self.fields, extrasaction="ignore").writerow(row)
+        return buffer.getvalue()
+
+
+def open_sink(path: str) -> ResultSink:
+    """Open a sink for a path, choosing the format from its extension.
+
+    Args:
+        path: .jsonl, .ndjson or .csv file, optionally with .gz appended
+
+    Returns:
+        Open sink
+
+    Raises:
+        ValueError: For any other extension
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith((".jsonl", ".ndjson")):
+        return JsonlSink(path)
+    if name.endswith(".csv"):
+        return CsvSink(path)
+    raise ValueError(f"Unsupported result sink format: {path} (use .jsonl, .ndjson or .csv)")
@@ -0,0 +1,277 @@
+"""Embedding-based style pre-scorer, calibrated against validator scores.
+
+Rates a draft by its similarity to the example posts in
+``knowledge_bases/examples`` and its distance from banned-voice sentences,
+using the same MiniLM embeddings as the knowledge base. A linear fit on
+historical validator scores turns those two features into a predicted
+score, and a margin around MIN_SCORE marks the drafts it can't call.
+
+Calibrate from exported batch results::
+
+    python -m core.style_scorer week_2_4_results.json batch_results_*.json
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.config import (
+    MIN_SCORE,
+    KNOWLEDGE_BASE_DIR,
+    EXAMPLE_DIRS,
+    FAILED_CONTENT,
+    PRECHECK_FAILED,
+    STYLE_PRESCORE,
+    BANNED_VOICE_EXAMPLES,
+    STYLE_CALIBRATION_PATH,
+    STYLE_SCORER_AGREEMENT,
+    STYLE_SCORER_MIN_SAMPLES,
+)
+
+
+class StyleScorer:
+    """Cheap first-stage judge for clear passes and clear failures."""
+
+    def __init__(
+        self,
+        embeddings=None,
+        calibration_path: Optional[str] = STYLE_CALIBRATION_PATH,
+        examples_dir: str = KNOWLEDGE_BASE_DIR
+    ):
+        """Initialize style scorer.
+
+        Args:
+            embeddings: LangChain embeddings (defaults to the knowledge
+                base's MiniLM model; pass KnowledgeBase.embeddings to share it)
+            calibration_path: JSON file with saved calibrations, loaded if
+                it exists (None to start uncalibrated)
+            examples_dir: Root containing the EXAMPLE_DIRS folders
+        """
+        if embeddings is None:
+            from langchain_community.embeddings import HuggingFaceEmbeddings
+            from core.knowledge_base import EMBEDDING_MODEL
+            embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+        self.embeddings = embeddings
+        self.examples_dir = examples_dir
+
+        # Per content type: {"coef": [a, b, c], "margin": m, ...}
+        self.calibrations: Dict[str, Dict] = {}
+        if calibration_path and os.path.exists(calibration_path):
+            with open(calibration_path) as f:
+                self.calibrations = json.load(f)
+
+        self._examples: Dict[str, Optional[np.ndarray]] = {}
+        self._banned = self._embed(BANNED_VOICE_EXAMPLES)
+
+    def features(self, contents: Sequence[str], content_type: str) -> Optional[np.ndarray]:
+        """Style features for drafts.
+
+        Args:
+            contents: Drafts
+            content_type: Type (LinkedIn, Blog, Article)
+
+        Returns:
+            Array of shape (n, 2): mean similarity to the 3 closest examples,
+            and maximum similarity to a banned-voice sentence. None if the
+            content type has no examples.
+        """
+        examples = self._example_vectors(content_type)
+        if examples is None:
+            return None
+        vectors = self._embed(list(contents))
+
+        example_sims = vectors @ examples.T
+        k = min(3, examples.shape[0])
+        style = np.sort(example_sims, axis=1)[:, -k:].mean(axis=1)
+        banned = (vectors @ self._banned.T).max(axis=1)
+        return np.column_stack([style, banned])
+
+    def predict(self, content: str, content_type: str) -> Optional[float]:
+        """Predicted validator score for a draft, or None if uncalibrated."""
+        calibration = self.calibrations.get(content_type)
+        if calibration is None:
+            return None
+        features = self.features([content], content_type)
+        if features is None:
+            return None
+        return float((_design(features) @ np.array(calibration["coef"]))[0])
+
+    def judge(self, content: str, content_type: str) -> Optional[Tuple[float, str]]:
+        """Call a clear pass or clear failure without the LLM.
+
+        Args:
+            content: Draft
+            content_type: Type (LinkedIn, Blog, Article)
+
+        Returns:
+            Tuple of (predicted score, "pass" or "fail"), or None when the
+            draft is borderline or the scorer isn't calibrated
+        """
+        predicted = self.predict(content, content_type)
+        if predicted is None:
+            return None
+        margin = self.calibrations[content_type]["margin"]
+        if predicted >= MIN_SCORE + margin:
+            return predicted, "pass"
+        if predicted < MIN_SCORE - margin:
+            return predicted, "fail"
+        return None
+
+    def calibrate(
+        self,
+        history: List[Tuple[str, float]],
+        content_type: str,
+        agreement: float = STYLE_SCORER_AGREEMENT
+    ) -> Dict:
+        """Fit the score mapping and decision margin on validator history.
+
+        The mapping is fitted on half the history and the margin chosen on
+        the other half: the smallest margin at which drafts outside it get
+        the same pass/fail as the validator gave them at least ``agreement``
+        of the time. The mapping is then refitted on everything.
+
+        Args:
+            history: (content, validator score) pairs
+            content_type: Type the history belongs to
+            agreement: Required pass/fail agreement on skipped drafts
+
+        Returns:
+            Calibration dict (also stored on the scorer)
+
+        Raises:
+            ValueError: If there is too little history or no examples
+        """
+        if len(history) < STYLE_SCORER_MIN_SAMPLES:
+            raise ValueError(
+                f"Need at least {STYLE_SCORER_MIN_SAMPLES} scored drafts, got {len(history)}"
+            )
+        features = self.features([content for content, _ in history], content_type)
+        if features is None:
+            raise ValueError(f"No {content_type} examples under {self.examples_dir}")
+        scores = np.array([score for _, score in history], dtype=float)
+
+        fit, held_out = np.arange(len(scores)) % 2 == 0, np.arange(len(scores)) % 2 == 1
+        coef = _fit(features[fit], scores[fit])
+        margin = _choose_margin(_design(features[held_out]) @ coef, scores[held_out], agreement)
+
+        coef = _fit(features, scores)
+        predicted = _design(features) @ coef
+        decided = np.abs(predicted - MIN_SCORE) >= margin
+        calibration = {
+            "coef": coef.tolist(),
+            "margin": margin,
+            "samples": len(scores),
+            "skip_rate": float(decided.mean()),
+            "agreement": float(
+                ((predicted >= MIN_SCORE) == (scores >= MIN_SCORE))[decided].mean()
+            ) if decided.any() else None,
+        }
+        self.calibrations[content_type] = calibration
+        return calibration
+
+    def save(self, path: str = STYLE_CALIBRATION_PATH):
+        """Write calibrations to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.calibrations, f, indent=2)
+
+    def _example_vectors(self, content_type: str) -> Optional[np.ndarray]:
+        """Embed (once) the example files for a content type."""
+        if content_type not in self._examples:
+            directory = os.path.join(self.examples_dir, EXAMPLE_DIRS.get(content_type, ""))
+            texts = []
+            if os.path.isdir(directory):
+                for name in sorted(os.listdir(directory)):
+                    if name.endswith((".md", ".txt")):
+                        with open(os.path.join(directory, name), encoding="utf-8") as f:
+                            # Several examples per file may be separated by "---" lines
+                            texts.extend(
+                                part.strip() for part in f.read().split("\n---\n") if part.strip()
+                            )
+            self._examples[content_type] = self._embed(texts) if texts else None
+        return self._examples[content_type]
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as unit vectors."""
+        vectors = np.array(self.embeddings.embed_documents(texts), dtype=float)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+def _design(features: np.ndarray) -> np.ndarray:
+    return np.column_stack([features, np.ones(len(features))])
+
+
+def _fit(features: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    coef, *_ = np.linalg.lstsq(_design(features), scores, rcond=None)
+    return coef
+
+
+def _choose_margin(predicted: np.ndarray, scores: np.ndarray, agreement: float) -> float:
+    """Smallest margin around MIN_SCORE whose decided drafts agree often enough."""
+    agrees = (predicted >= MIN_SCORE) == (scores >= MIN_SCORE)
+    distance = np.abs(predicted - MIN_SCORE)
+    for margin in sorted(set(distance.tolist()) | {0.0}):
+        decided = distance >= margin
+        if decided.any() and agrees[decided].mean() >= agreement:
+            return float(margin)
+    # Never confident enough: send everything to the LLM
+    return float("inf")
+
+
+def load_history(paths: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+    """Read (content, score) pairs from exported batch results.
+
+    Only scores the validator LLM gave are used: pre-check rejections,
+    style pre-scores (the scorer's own predictions) and entries that never
+    produced a draft are left out.
+
+    Args:
+        paths: JSON files written by BatchProcessor.export_results
+
+    Returns:
+        Dict mapping content type to (content, score) pairs
+    """
+    history: Dict[str, List[Tuple[str, float]]] = {}
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        results = data["results"] if isinstance(data, dict) else data
+        for result in results:
+            content = result.get("content")
+            feedback = result.get("feedback") or ""
+            if not content or content == FAILED_CONTENT:
+                continue
+            if feedback.startswith(("Error", PRECHECK_FAILED, STYLE_PRESCORE)):
+                continue
+            content_type = result.get("content_type", "LinkedIn")
+            history.setdefault(content_type, []).append((content, result["score"]))
+    return history
+
+
+def main():
+    """Calibrate the style pre-scorer from exported batch results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("results", nargs="+", help="batch result JSON files")
+    parser.add_argument("--output", default=STYLE_CALIBRATION_PATH)
+    args = parser.parse_args()
+
+    scorer = StyleScorer(calibration_path=args.output)
+    for content_type, history in load_history(args.results).items():
+        try:
+            calibration = scorer.calibrate(history, content_type)
+        except ValueError as e:
+            print(f"{content_type}: {e}")
+            continue
+        print(
+            f"{content_type}: {calibration['samples']} drafts, margin "
+            f"{calibration['margin']:.2f}, skips {calibration['skip_rate']:.0%} of validations"
+        )
+    scorer.save(args.output)
+    print(f"Calibration written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""Token, latency and cost accounting for LLM and RAG calls.
+
+Every LLM call records a UsageRecord into all trackers active in the
+current context::
+
+    with track_usage() as usage:
+        agent.generate(...)
+    print(usage.summary())
+
+Trackers nest (entry inside batch inside session), and work submitted with
+``submit_with_context`` is attributed to the trackers of the submitting code.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from core.config import MODEL_PRICES
+
+_active_trackers: contextvars.ContextVar[Tuple["UsageTracker", ...]] = contextvars.ContextVar(
+    "active_usage_trackers", default=()
+)
+_attempt: contextvars.ContextVar[int] = contextvars.ContextVar("usage_attempt", default=1)
+
+# Stages whose records aren't LLM calls (retrieval is an embedding lookup)
+NON_LLM_STAGES = ("rag",)
+
+
+@dataclass
+class UsageRecord:
+    """One LLM or retrieval call (or, with avoided=True, a call a local check made unnecessary)."""
+
+    stage: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    retries: int = 0
+    cost: float = 0.0
+    error: bool = False
+    attempt: int = 1
+    early_stopped: bool = False
+    avoided: bool = False
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the cost of a call from the MODEL_PRICES table.
+
+    Args:
+        model: Model id
+        prompt_tokens: Prompt tokens
+        completion_tokens: Completion tokens
+
+    Returns:
+        Cost in USD (0 for models without a listed price)
+    """
+    prompt_price, completion_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def _empty_totals() -> Dict:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "retries": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "cost": 0.0,
+        "latency": 0.0,
+        "early_stops": 0,
+        "wasted_tokens": 0,
+        "wasted_latency": 0.0,
+        "calls_avoided": 0,
+    }
+
+
+def _add(totals: Dict, record: UsageRecord):
+    if record.avoided:
+        totals["calls_avoided"] += 1
+        return
+    totals["calls"] += 1
+    totals["errors"] += int(record.error)
+    totals["retries"] += record.retries
+    totals["prompt_tokens"] += record.prompt_tokens
+    totals["completion_tokens"] += record.completion_tokens
+    totals["total_tokens"] += record.prompt_tokens + record.completion_tokens
+    totals["cost"] += record.cost
+    totals["latency"] += record.latency
+    if record.early_stopped:
+        # Output streamed before an early stop is paid for and thrown away
+        totals["early_stops"] += 1
+        totals["wasted_tokens"] += record.completion_tokens
+        totals["wasted_latency"] += record.latency
+
+
+def llm_calls(summary: Dict) -> int:
+    """Number of LLM calls in a usage summary, leaving out NON_LLM_STAGES.
+
+    Args:
+        summary: Dict returned by a tracker's summary()
+    """
+    by_stage = summary.get("by_stage", {})
+    return summary.get("calls", 0) - sum(
+        by_stage.get(stage, {}).get("calls", 0) for stage in NON_LLM_STAGES
+    )
+
+
+def _rounded(totals: Dict) -> Dict:
+    rounded = dict(totals)
+    rounded["cost"] = round(rounded["cost"], 6)
+    rounded["latency"] = round(rounded["latency"], 3)
+    rounded["wasted_latency"] = round(rounded["wasted_latency"], 3)
+    return rounded
+
+
+def _merge(totals: Dict, other: Dict):
+    for key in totals:
+        totals[key] += other.get(key, 0)
+
+
+class UsageTracker:
+    """Thread-safe running totals of usage records.
+
+    Only aggregates are kept, so memory stays flat however many calls
+    are recorded.
+    """
+
+    def __init__(self):
+        """Initialize empty tracker."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all totals."""
+        with self._lock:
+            self.totals = _empty_totals()
+            self.by_stage: Dict[str, Dict] = {}
+            self.by_model: Dict[str, Dict] = {}
+            self.retry_attempts = _empty_totals()
+
+    def add(self, record: UsageRecord):
+        """Add one record to the totals.
+
+        Args:
+            record: Usage record
+        """
+        with self._lock:
+            _add(self.totals, record)
+            _add(self.by_stage.setdefault(record.stage, _empty_totals()), record)
+            _add(self.by_model.setdefault(record.model, _empty_totals()), record)
+            if record.attempt > 1:
+                _add(self.retry_attempts, record)
+
+    def merge(self, summary: Dict):
+        """Fold a summary from another tracker into this one.
+
+        Args:
+            summary: Dict returned by another tracker's summary()
+        """
+        with self._lock:
+            _merge(self.totals, summary)
+            for stage, totals in summary.get("by_stage", {}).items():
+                _merge(self.by_stage.setdefault(stage, _empty_totals()), totals)
+            for model, totals in summary.get("by_model", {}).items():
+                _merge(self.by_model.setdefault(model, _empty_totals()), totals)
+            _merge(self.retry_attempts, summary.get("retry_attempts", {}))
+
+    def summary(self) -> Dict:
+        """Snapshot of the totals.
+
+        Returns:
+            Dict with overall totals plus by_stage, by_model and
+            retry_attempts (calls made by attempts after the first) breakdowns
+        """
+        with self._lock:
+            summary = _rounded(self.totals)
+            summary["by_stage"] = {k: _rounded(v) for k, v in self.by_stage.items()}
+            summary["by_model"] = {k: _rounded(v) for k, v in self.by_model.items()}
+            summary["retry_attempts"] = _rounded(self.retry_attempts)
+        return summary
+
+
+@contextmanager
+def track_usage(tracker: Optional[UsageTracker] = None) -> Iterator[UsageTracker]:
+    """Record every call made inside the block into a tracker.
+
+    Args:
+        tracker: Tracker to record into (a new one if None)
+
+    Yields:
+        The active tracker
+    """
+    tracker = tracker or UsageTracker()
+    token = _active_trackers.set(_active_trackers.get() + (tracker,))
+    try:
+        yield tracker
+    finally:
+        _active_trackers.reset(token)
+
+
+@contextmanager
+def usage_attempt(attempt: int) -> Iterator[None]:
+    """Tag calls made inside the block with a generation attempt number.
+
+    Args:
+        attempt: 1-based attempt number
+    """
+    token = _attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _attempt.reset(token)
+
+
+def record_usage(record: UsageRecord):
+    """Add a record to every tracker active in the current context.
+
+    Args:
+        record: Usage record (its cost and attempt are filled in here)
+    """
+    trackers = _active_trackers.get()
+    if not trackers:
+        return
+    record.attempt = _attempt.get()
+    if not record.cost:
+        record.cost = estimate_cost(record.model, record.prompt_tokens, record.completion_tokens)
+    for tracker in trackers:
+        tracker.add(record)
+
+
+def merge_usage(summary: Dict):
+    """Fold a summary recorded elsewhere (e.g. in a worker process) into
+    every tracker active in the current context.
+
+    Args:
+        summary: Dict returned by a tracker's summary()
+    """
+    for tracker in _active_trackers.get():
+        tracker.merge(summary)
+
+
+def submit_with_context(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """Submit work to an executor so it records into the caller's trackers.
+
+    Args:
+        executor: Executor to submit to
+        fn: Callable to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Future for the call
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
@@ -0,0 +1,135 @@
+"""Content-hash cache of validation results."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from core.config import VALIDATION_CACHE_SIZE, VALIDATION_CACHE_PATH
+from core.prompts import VALIDATION_PROMPT_VERSION
+
+
+def validation_key(content: str, content_type: str, target_words: str, model: str) -> str:
+    """Cache key for one validation.
+
+    Args:
+        content: Content being validated
+        content_type: Type (LinkedIn, Blog, Article)
+        target_words: Target word count range
+        model: Validator model id
+
+    Returns:
+        Hex digest over the inputs and VALIDATION_PROMPT_VERSION
+    """
+    parts = [VALIDATION_PROMPT_VERSION, model, content_type, target_words, content]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ValidationCache:
+    """Bounded LRU of (score, feedback, word_count), optionally backed by SQLite.
+
+    Memory holds the most recent ``max_size`` results. With a path, every
+    result is also written to disk and misses fall through to it, so
+    identical text stays a lookup across restarts.
+    """
+
+    def __init__(self, max_size: int = VALIDATION_CACHE_SIZE, path: Optional[str] = None):
+        """Initialize cache.
+
+        Args:
+            max_size: Entries kept in memory
+            path: Optional SQLite file for persistence
+        """
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS validations ("
+                "key TEXT PRIMARY KEY, score REAL, feedback TEXT, "
+                "word_count INTEGER, created REAL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Tuple[float, str, int]]:
+        """Look up a validation result.
+
+        Args:
+            key: Key from validation_key()
+
+        Returns:
+            Tuple of (score, feedback, word_count), or None on a miss
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT score, feedback, word_count FROM validations WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is not None:
+                    result = (row[0], row[1], row[2])
+                    self._remember(key, result)
+
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def put(self, key: str, result: Tuple[float, str, int]):
+        """Store a validation result.
+
+        Args:
+            key: Key from validation_key()
+            result: Tuple of (score, feedback, word_count)
+        """
+        with self._lock:
+            self._remember(key, result)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO validations VALUES (?, ?, ?, ?, ?)",
+                    (key, result[0], result[1], result[2], time.time())
+                )
+                self._db.commit()
+
+    def clear(self):
+        """Drop every cached result, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM validations")
+                self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remember(self, key: str, result: Tuple[float, str, int]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_cache: Optional[ValidationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get the process-wide validation cache (persisted if VALIDATION_CACHE_PATH is set)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ValidationCache(path=VALIDATION_CACHE_PATH or None)
+        return _cache
@@ -0,0 +1,145 @@
+"""Single-pass scanner for the deterministic voice rules.
+
+Emojis, hashtags, BANNED_TERMS and SIGNATURE_PHRASES are compiled into one
+alternation, so a draft is scanned once however many rules there are::
+
+    report = get_voice_scanner().scan(content)
+    if report.emojis or not report.has_signature_phrase:
+        ...
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from core.config import BANNED_TERMS, SIGNATURE_PHRASES
+from core.output_guard import EMOJI_PATTERN
+
+# Finding rules, in the order they are tried at each position
+EMOJI = "emoji"
+HASHTAG = "hashtag"
+SIGNATURE_PHRASE = "signature_phrase"
+BANNED_TERM = "banned_term"
+
+
+@dataclass(frozen=True)
+class Finding:
+    """One rule match in a draft."""
+
+    rule: str
+    text: str
+    start: int
+    end: int
+
+
+@dataclass
+class VoiceReport:
+    """Everything the scanner found in one draft."""
+
+    findings: List[Finding] = field(default_factory=list)
+    word_count: int = 0
+    ends_with_question: bool = False
+
+    def matches(self, rule: str) -> List[str]:
+        """Distinct lowercased matches of one rule, sorted."""
+        return sorted({f.text.lower() for f in self.findings if f.rule == rule})
+
+    @property
+    def emojis(self) -> List[str]:
+        return self.matches(EMOJI)
+
+    @property
+    def hashtags(self) -> List[str]:
+        return self.matches(HASHTAG)
+
+    @property
+    def banned_terms(self) -> List[str]:
+        return self.matches(BANNED_TERM)
+
+    @property
+    def signature_phrases(self) -> List[str]:
+        return self.matches(SIGNATURE_PHRASE)
+
+    @property
+    def has_signature_phrase(self) -> bool:
+        return any(f.rule == SIGNATURE_PHRASE for f in self.findings)
+
+
+class VoiceScanner:
+    """Precompiled voice rule matcher, safe to share between threads."""
+
+    def __init__(
+        self,
+        banned_terms: Sequence[str] = BANNED_TERMS,
+        signature_phrases: Sequence[str] = SIGNATURE_PHRASES
+    ):
+        """Compile the rules.
+
+        Args:
+            banned_terms: Whole-word terms the voice guidelines ban
+            signature_phrases: Phrases a draft should contain (matched
+                anywhere, case-insensitively)
+        """
+        # Longest first, so "game changer" wins over a shorter overlapping term
+        def alternation(terms: Sequence[str]) -> str:
+            terms = sorted({t.lower() for t in terms}, key=len, reverse=True)
+            return "|".join(re.escape(t) for t in terms)
+
+        emoji_class = EMOJI_PATTERN.pattern.strip("[]")
+        parts = [
+            rf"(?P<{EMOJI}>{EMOJI_PATTERN.pattern}+)",
+            rf"(?P<{HASHTAG}>(?<![\w&])#[A-Za-z]\w*)",
+        ]
+        first_chars = "#" + emoji_class
+        if signature_phrases:
+            parts.append(rf"(?P<{SIGNATURE_PHRASE}>{alternation(signature_phrases)})")
+            first_chars += "".join({re.escape(t[0].lower()) for t in signature_phrases})
+        if banned_terms:
+            parts.append(rf"\b(?P<{BANNED_TERM}>{alternation(banned_terms)})\b")
+            first_chars += "".join({re.escape(t[0].lower()) for t in banned_terms})
+        rules = "|".join(parts)
+
+        # Matching lowercased text against lowercase literals is much
+        # faster than re.I, and the leading lookahead lets the matcher skip
+        # positions where no rule can start without trying each alternative
+        self.pattern = re.compile(rf"(?=[{first_chars}])(?:{rules})")
+        # For the rare text whose length changes when lowercased
+        self._pattern_ignorecase = re.compile(rules, re.I)
+
+    def scan(self, content: str) -> VoiceReport:
+        """Scan a draft.
+
+        Args:
+            content: Draft text
+
+        Returns:
+            Report with every finding in text order
+        """
+        lowered = content.lower()
+        if len(lowered) == len(content):
+            matches = self.pattern.finditer(lowered)
+        else:
+            matches = self._pattern_ignorecase.finditer(content)
+        findings = [
+            Finding(match.lastgroup, content[match.start():match.end()], match.start(), match.end())
+            for match in matches
+        ]
+        return VoiceReport(
+            findings=findings,
+            word_count=len(content.split()),
+            ends_with_question=content.rstrip().endswith("?")
+        )
+
+
+_scanner: Optional[VoiceScanner] = None
+_scanner_lock = threading.Lock()
+
+
+def get_voice_scanner() -> VoiceScanner:
+    """Get the process-wide scanner for the configured rules."""
+    global _scanner
+    with _scanner_lock:
+        if _scanner is None:
+            _scanner = VoiceScanner()
+        return _scanner
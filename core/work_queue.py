@@ -0,0 +1,276 @@
+"""SQLite work queue with leases, shared by batch worker processes.
+
+A coordinator enqueues calendar entries; any number of worker processes
+claim them. A claim is a lease that expires after ``visibility_timeout``
+seconds unless its worker renews it, so an entry held by a worker that was
+killed becomes claimable again and is retried elsewhere::
+
+    queue = WorkQueue("batch_queue.db")
+    task = queue.claim("worker-1")
+    if task is not None:
+        queue.complete(task.id, "worker-1", process(task.entry))
+
+Entries are keyed (see core.journal.entry_key; the batch processor adds its
+settings_key), so enqueueing the same entry twice is a no-op. Each
+coordinator run tags its entries with a run id and collects the finished
+ones; rows left by an interrupted run are picked up by the next run that
+enqueues them (failed ones are redone unless that run resumes).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.config import QUEUE_MAX_ATTEMPTS, QUEUE_VISIBILITY_TIMEOUT
+
+# Task states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"  # lease expired QUEUE_MAX_ATTEMPTS times
+
+
+@dataclass
+class Task:
+    """One claimed entry."""
+
+    id: int
+    key: str
+    entry: Dict
+    attempts: int
+
+
+class WorkQueue:
+    """Durable queue of calendar entries, safe to share between processes.
+
+    Every process (and thread) using the queue file opens it through its
+    own WorkQueue; claims are serialized by SQLite's write lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        visibility_timeout: float = QUEUE_VISIBILITY_TIMEOUT,
+        max_attempts: int = QUEUE_MAX_ATTEMPTS
+    ):
+        """Open (or create) a queue file.
+
+        Args:
+            path: SQLite file path
+            visibility_timeout: Seconds a claim stays valid without renewal
+            max_attempts: Claims an entry gets before it is marked dead
+        """
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        # Autocommit mode; multi-statement updates use explicit transactions
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, run TEXT NOT NULL, "
+            "position INTEGER NOT NULL, entry TEXT NOT NULL, "
+            f"status TEXT NOT NULL DEFAULT '{PENDING}', attempts INTEGER NOT NULL DEFAULT 0, "
+            "owner TEXT, lease_expires REAL, result TEXT, "
+            "collected INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, position)")
+
+    def enqueue(
+        self,
+        key: str,
+        entry: Dict,
+        run: str,
+        position: int,
+        resume: bool = False
+    ) -> bool:
+        """Add an entry to a run.
+
+        An entry already queued by an earlier run moves to this one and
+        keeps its state: one in progress stays claimed, a passing one is
+        collected without being redone. A dead one is retried from scratch,
+        and so is a failed one unless resuming.
+
+        Args:
+            key: Entry key
+            entry: Calendar entry
+            run: Run id
+            position: Entry's index in the run's calendar
+            resume: Keep an earlier run's failed result instead of retrying
+
+        Returns:
+            True if the run will collect the entry, False if the run had
+            already enqueued it
+        """
+        # SQLite evaluates every SET expression against the old row
+        redo = (
+            f"(status = '{DEAD}' OR (NOT :resume AND status = '{DONE}' "
+            "AND NOT COALESCE(json_extract(result, '$.passed'), 0)))"
+        )
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO tasks (key, run, position, entry) "
+                "VALUES (:key, :run, :position, :entry) "
+                "ON CONFLICT (key) DO UPDATE SET run = excluded.run, "
+                "position = excluded.position, collected = 0, "
+                f"attempts = CASE WHEN {redo} THEN 0 ELSE attempts END, "
+                f"result = CASE WHEN {redo} THEN NULL ELSE result END, "
+                f"status = CASE WHEN {redo} THEN '{PENDING}' ELSE status END "
+                "WHERE run != excluded.run",
+                {
+                    "key": key, "run": run, "position": position,
+                    "entry": json.dumps(entry), "resume": int(resume)
+                }
+            )
+            return cursor.rowcount == 1
+
+    def claim(self, owner: str, skip_types: Iterable[str] = ()) -> Optional[Task]:
+        """Lease the next pending entry (or one whose lease has expired).
+
+        Args:
+            owner: Id of the claiming worker
+            skip_types: Content types not to claim (e.g. ones the worker
+                already has its limit of in flight)
+
+        Returns:
+            Claimed task, or None if nothing is claimable right now
+        """
+        now = time.time()
+        skip_types = list(skip_types)
+        skip = ""
+        if skip_types:
+            placeholders = ", ".join("?" * len(skip_types))
+            skip = (
+                "AND COALESCE(json_extract(entry, '$.content_type'), 'LinkedIn') "
+                f"NOT IN ({placeholders}) "
+            )
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    f"UPDATE tasks SET status = '{DEAD}', owner = NULL "
+                    f"WHERE status = '{LEASED}' AND lease_expires < ? AND attempts >= ?",
+                    (now, self.max_attempts)
+                )
+                row = self._db.execute(
+                    "SELECT id, key, entry, attempts FROM tasks "
+                    f"WHERE (status = '{PENDING}' OR (status = '{LEASED}' AND lease_expires < ?)) "
+                    f"{skip}ORDER BY position LIMIT 1",
+                    (now, *skip_types)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        f"UPDATE tasks SET status = '{LEASED}', owner = ?, "
+                        "attempts = attempts + 1, lease_expires = ? WHERE id = ?",
+                        (owner, now + self.visibility_timeout, row[0])
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return Task(id=row[0], key=row[1], entry=json.loads(row[2]), attempts=row[3] + 1)
+
+    def renew(self, task_ids: Iterable[int], owner: str) -> int:
+        """Extend the leases an owner still holds.
+
+        Args:
+            task_ids: Claimed task ids
+            owner: Id of the worker holding them
+
+        Returns:
+            Number of leases extended
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return 0
+        placeholders = ", ".join("?" * len(task_ids))
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE tasks SET lease_expires = ? WHERE status = '{LEASED}' "
+                f"AND owner = ? AND id IN ({placeholders})",
+                (time.time() + self.visibility_timeout, owner, *task_ids)
+            )
+            return cursor.rowcount
+
+    def complete(self, task_id: int, owner: str, result: Dict) -> bool:
+        """Store the result of a claimed entry.
+
+        Args:
+            task_id: Claimed task id
+            owner: Id of the worker that claimed it
+            result: Result dict
+
+        Returns:
+            False if the lease was lost to another worker (the result is
+            dropped; the other worker's will be kept)
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE tasks SET status = '{DONE}', result = ?, owner = NULL "
+                f"WHERE id = ? AND owner = ? AND status = '{LEASED}'",
+                (json.dumps(result), task_id, owner)
+            )
+            return cursor.rowcount == 1
+
+    def collect(self, run: str) -> List[Tuple[int, Dict, Optional[Dict], int]]:
+        """Take the run's newly finished entries.
+
+        Args:
+            run: Run id
+
+        Returns:
+            List of (position, entry, result, attempts) for entries that
+            finished since the last call; result is None for dead entries
+        """
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT id, position, entry, result, attempts FROM tasks "
+                    f"WHERE run = ? AND collected = 0 AND status IN ('{DONE}', '{DEAD}')",
+                    (run,)
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE tasks SET collected = 1 WHERE id = ?", [(row[0],) for row in rows]
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return [
+            (row[1], json.loads(row[2]), json.loads(row[3]) if row[3] else None, row[4])
+            for row in rows
+        ]
+
+    def unfinished(self, run: Optional[str] = None) -> int:
+        """Count pending and leased entries, in one run or overall."""
+        query = f"SELECT COUNT(*) FROM tasks WHERE status IN ('{PENDING}', '{LEASED}')"
+        params: Tuple = ()
+        if run is not None:
+            query += " AND run = ?"
+            params = (run,)
+        with self._lock:
+            return self._db.execute(query, params).fetchone()[0]
+
+    def purge(self, run: str):
+        """Delete a run's collected entries (the journal keeps their results)."""
+        with self._lock:
+            self._db.execute("DELETE FROM tasks WHERE run = ? AND collected = 1", (run,))
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entries in each state."""
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        """Close the queue file."""
+        with self._lock:
+            self._db.close()
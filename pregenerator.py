@@ -0,0 +1,190 @@
+"""Pre-generation daemon: validated drafts for upcoming calendar entries."""
+
+import argparse
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+
+from batch_processor import CONTENT_CALENDAR, BatchProcessor
+from core.config import (
+    DRAFT_STORE_PATH, PREGEN_HORIZON_DAYS, PREGEN_POLL_INTERVAL, PREGEN_RETRY_FAILED_AFTER
+)
+from core.content_calendar import CalendarFilter, read_calendar
+from core.draft_store import DraftStore
+from core.journal import entry_key
+from core.knowledge_base import knowledge_base_fingerprint
+
+
+class PreGenerator:
+    """Keeps validated drafts of upcoming calendar entries in a DraftStore.
+    
+    Each cycle re-reads the calendar and picks the entries due within the
+    horizon that still need a draft: none stored yet, stored against an
+    older knowledge base, or failed validation a while ago. They run through
+    the batch processor as one batch, and each draft is stored as soon as
+    its entry finishes.
+    """
+    
+    def __init__(
+        self,
+        processor: BatchProcessor,
+        store: DraftStore,
+        calendar: Optional[Union[str, Iterable[Dict]]] = None,
+        horizon_days: int = PREGEN_HORIZON_DAYS,
+        include_undated: Optional[bool] = None,
+        retry_failed_after: float = PREGEN_RETRY_FAILED_AFTER
+    ):
+        """Initialize pre-generator.
+        
+        Args:
+            processor: Batch processor that generates and validates drafts
+            store: Draft store the results go to
+            calendar: Calendar file path (re-read every cycle), iterable of
+                entries, or None for CONTENT_CALENDAR
+            horizon_days: Entries dated from today up to this many days
+                ahead are drafted
+            include_undated: Also draft entries without a date (defaults
+                to True for CONTENT_CALENDAR, whose entries have no dates)
+            retry_failed_after: Seconds before a draft that failed
+                validation is generated again
+        """
+        self.processor = processor
+        self.store = store
+        self.calendar = CONTENT_CALENDAR if calendar is None else calendar
+        if not isinstance(self.calendar, str):
+            self.calendar = list(self.calendar)
+        self.horizon_days = horizon_days
+        self.include_undated = calendar is None if include_undated is None else include_undated
+        self.retry_failed_after = retry_failed_after
+        
+    def upcoming(self, today: Optional[date] = None) -> List[Dict]:
+        """Calendar entries due within the horizon.
+        
+        Args:
+            today: First day of the horizon (defaults to today)
+            
+        Returns:
+            Entries in calendar order
+        """
+        today = today or date.today()
+        window = CalendarFilter(
+            start_date=today, end_date=today + timedelta(days=self.horizon_days)
+        )
+        entries = read_calendar(self.calendar) if isinstance(self.calendar, str) else self.calendar
+        return [
+            entry for entry in entries
+            if window.matches(entry) or (self.include_undated and not entry.get("date"))
+        ]
+        
+    def run_once(self, today: Optional[date] = None) -> Dict:
+        """Run one cycle: draft what is missing or stale, drop what is past due.
+        
+        Args:
+            today: First day of the horizon (defaults to today)
+            
+        Returns:
+            Dict with upcoming, generated, passed and pruned counts
+        """
+        today = today or date.today()
+        # Fingerprint first: an edit made while the index rebuilds leaves the
+        # drafts stale, so the next cycle picks it up
+        fingerprint = knowledge_base_fingerprint()
+        if self.processor.knowledge_base.refresh():
+            print("Knowledge base changed; rebuilt its index, refreshing drafts")
+        
+        entries = self.upcoming(today)
+        todo = [
+            entry for entry in entries
+            if self.store.needs_draft(entry, fingerprint, self.retry_failed_after)
+        ]
+        print(
+            f"[{datetime.now():%Y-%m-%d %H:%M}] {len(entries)} upcoming entries, "
+            f"{len(entries) - len(todo)} drafts current, {len(todo)} to generate"
+        )
+        
+        passed = 0
+        if todo:
+            by_key = {entry_key(entry): entry for entry in todo}
+            
+            def store(done: int, total: Optional[int], result: Dict):
+                nonlocal passed
+                self.store.put(by_key[entry_key(result)], result, fingerprint)
+                passed += bool(result["passed"])
+                
+            self.processor.process_batch(calendar=todo, progress=store, keep_results=False)
+            
+        pruned = self.store.prune(today.isoformat())
+        return {
+            "upcoming": len(entries),
+            "generated": len(todo),
+            "passed": passed,
+            "pruned": pruned,
+        }
+        
+    def run_forever(
+        self,
+        poll_interval: float = PREGEN_POLL_INTERVAL,
+        stop: Optional[threading.Event] = None
+    ):
+        """Run cycles until stopped.
+        
+        Args:
+            poll_interval: Seconds to wait after each cycle
+            stop: Optional event that ends the loop (checked between cycles)
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                # A bad cycle (unreadable calendar, provider outage) shouldn't
+                # end the daemon; the next cycle tries again
+                print(f"Pre-generation cycle failed: {e}")
+            stop.wait(poll_interval)
+
+
+def main():
+    """Main entry point for the pre-generation daemon."""
+    parser = argparse.ArgumentParser(
+        description="Pre-generate drafts for upcoming calendar entries"
+    )
+    parser.add_argument(
+        "--calendar",
+        help="calendar file (.jsonl, .csv or .yaml) instead of the built-in Week 2-4 calendar"
+    )
+    parser.add_argument("--store", default=DRAFT_STORE_PATH, help="draft store file")
+    parser.add_argument("--horizon", type=int, default=PREGEN_HORIZON_DAYS,
+                        help="draft entries dated up to this many days ahead")
+    parser.add_argument("--include-undated", action=argparse.BooleanOptionalAction,
+                        help="also draft entries without a date "
+                             "(default: only for the built-in calendar)")
+    parser.add_argument("--interval", type=float, default=PREGEN_POLL_INTERVAL,
+                        help="seconds between cycles")
+    parser.add_argument("--once", action="store_true", help="run one cycle and exit")
+    parser.add_argument("--concurrency", type=int, default=1, help="entries drafted at once")
+    parser.add_argument("--quiet", action="store_true", help="don't print per-post progress")
+    args = parser.parse_args()
+    
+    processor = BatchProcessor(concurrency=args.concurrency, verbose=not args.quiet)
+    store = DraftStore(args.store)
+    pregenerator = PreGenerator(
+        processor,
+        store,
+        calendar=args.calendar,
+        horizon_days=args.horizon,
+        include_undated=args.include_undated
+    )
+    try:
+        if args.once:
+            print(pregenerator.run_once())
+        else:
+            pregenerator.run_forever(args.interval)
+    except KeyboardInterrupt:
+        print("Stopped")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
+    
\ No newline at end of file
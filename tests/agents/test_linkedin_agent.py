@@ -0,0 +1,48 @@
+"""Tests for multi-post generation in the LinkedIn agent."""
+
+from agents import linkedin_agent
+from agents.linkedin_agent import LinkedInAgent
+
+
+def post(words):
+    return " ".join(["Systems decide outcomes."] * (words // 3))
+
+
+def test_split_posts_tolerates_decoration_and_missing_end_lines():
+    """Delimiters may carry markdown; a post without END runs to the next one."""
+    text = (
+        "Here you go.\n"
+        "**=== POST 4 ===**\nFirst post.\n=== END POST 4 ===\n"
+        "=== POST #5 ===\nSecond post.\n"
+        "### === post 6 ===\nThird post.\n"
+        "=== POST 6 ===\nDuplicate ignored.\n"
+        "=== POST 7 ===\n"
+    )
+    assert LinkedInAgent.split_posts(text) == {
+        4: "First post.", 5: "Second post.", 6: "Third post."
+    }
+
+
+def test_generate_many_keeps_only_posts_within_spec(monkeypatch, stub_knowledge_base):
+    """Missing, truncated and overlong posts are left for per-post generation."""
+    response = (
+        f"=== POST 1 ===\n{post(200)}\n=== END POST 1 ===\n"
+        f"=== POST 2 ===\n{post(30)}\n=== END POST 2 ===\n"
+        f"=== POST 3 ===\n{post(600)}\n=== END POST 3 ===\n"
+    )
+
+    class ScriptedClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def invoke(self, prompt):
+            return type("Message", (), {"content": response})()
+
+    monkeypatch.setattr(linkedin_agent, "LLMClient", ScriptedClient)
+    agent = LinkedInAgent(knowledge_base=stub_knowledge_base)
+    entries = [
+        {"post_number": n, "week": 1, "topic": f"Topic {n}", "lens": "metrics",
+         "objective": "reframe_belief"}
+        for n in (1, 2, 3, 4)
+    ]
+    assert list(agent.generate_many(entries)) == [1]
@@ -0,0 +1,96 @@
+"""Tests for outline-then-parallel-sections generation."""
+
+import re
+import threading
+
+import pytest
+
+from agents.long_form import LongFormWriter
+
+
+class ScriptedLLM:
+    """LLM stand-in answering outline, section and transition prompts."""
+
+    def __init__(self, outline, short_once=(), barrier=None):
+        self.outline = outline
+        self.short_once = set(short_once)
+        self.barrier = barrier
+        self.section_calls = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        if "planning a" in prompt:
+            text = self.outline
+        elif "writing one section" in prompt:
+            heading = re.search(r'section \d+ of \d+: "(.+)"', prompt).group(1)
+            with self._lock:
+                self.section_calls.append(heading)
+                short = heading in self.short_once
+                self.short_once.discard(heading)
+            if self.barrier is not None and not short:
+                self.barrier.wait()
+            text = "Too short." if short else " ".join([f"{heading} body."] * 60)
+        else:
+            text = "TRANSITION 1: Bridge one.\nTRANSITION 2: Bridge two."
+        return type("Message", (), {"content": text})()
+
+
+class StubKnowledgeBase:
+    def __init__(self):
+        self.queries = []
+
+    def search(self, query, k=5):
+        self.queries.append(query)
+        return ["shared chunk", f"chunk for {query}"]
+
+
+OUTLINE = (
+    "TITLE: Systems Over Skill\n"
+    "SECTION: The Myth | Skill looks decisive\n"
+    "SECTION: The System | Structure decides\n"
+    "SECTION: The Shift | Change the system"
+)
+
+
+def writer(llm, knowledge_base=None):
+    return LongFormWriter(
+        llm=llm, knowledge_base=knowledge_base or StubKnowledgeBase(), content_type="Blog",
+        target_words="800-1500", min_sections=3, max_sections=4
+    )
+
+
+def test_sections_are_written_concurrently_and_stitched_in_order():
+    """All sections run at once; the piece keeps outline order with transitions."""
+    llm = ScriptedLLM(OUTLINE, barrier=threading.Barrier(3, timeout=5))
+    text = writer(llm).write("Systems", "metrics", "reframe_belief")
+
+    headings = re.findall(r"^## (.+)$", text, re.M)
+    assert text.startswith("# Systems Over Skill")
+    assert headings == ["The Myth", "The System", "The Shift"]
+    assert "Bridge one.\n\nThe System body." in text
+    assert sorted(llm.section_calls) == sorted(headings)
+
+
+def test_short_section_is_retried_on_its_own():
+    """A truncated section is rewritten without redoing the others."""
+    llm = ScriptedLLM(OUTLINE, short_once=["The System"])
+    writer(llm).write("Systems", "metrics", "reframe_belief")
+
+    assert sorted(llm.section_calls) == ["The Myth", "The Shift", "The System", "The System"]
+
+
+def test_sections_draw_on_different_chunks():
+    """A chunk handed to one section isn't given to the next."""
+    knowledge_base = StubKnowledgeBase()
+    contexts = writer(ScriptedLLM(OUTLINE), knowledge_base)._section_contexts(
+        "Systems", [("A", "a"), ("B", "b")], use_rag=True
+    )
+
+    assert "shared chunk" in contexts[0]
+    assert "shared chunk" not in contexts[1]
+
+
+def test_unparseable_outline_raises_value_error():
+    """Callers fall back to single-pass generation on a ValueError."""
+    with pytest.raises(ValueError):
+        writer(ScriptedLLM("Here are some thoughts.")).write("Systems", "metrics", "reframe")
@@ -0,0 +1,135 @@
+"""Tests for the validator's deterministic pre-check and penalties."""
+
+import pytest
+
+from agents.validator_agent import PRECHECK_FAILED, ValidatorAgent, precheck_failed
+from core.llm import FakeBackend
+from core.validation_cache import ValidationCache
+
+
+class StubLLM:
+    """LLM client stand-in returning a fixed validation response."""
+
+    def __init__(self, score: float):
+        self.score = score
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return type("Response", (), {"content": f"SCORE: {self.score}\nFEEDBACK:\n- fine"})()
+
+
+def post(words: int = 200, extra: str = "", signature: bool = True) -> str:
+    """A LinkedIn-sized draft of about ``words`` words."""
+    body = " ".join(["Teams follow the system they work in."] * (words // 7))
+    if signature:
+        body = "Systems beat skill. " + body
+    return body + extra
+
+
+@pytest.fixture
+def validator(monkeypatch):
+    monkeypatch.setattr("core.llm._backend", FakeBackend())
+    agent = ValidatorAgent(use_cache=False)
+    agent.llm = StubLLM(9.0)
+    return agent
+
+
+def test_far_off_draft_is_rejected_without_llm_call(validator):
+    score, feedback, word_count = validator.validate(
+        post(words=600, signature=False), "LinkedIn", "150-250"
+    )
+    assert score == 0.0
+    assert feedback.startswith(PRECHECK_FAILED)
+    assert precheck_failed(feedback)
+    assert word_count > 500
+    assert validator.llm.calls == 0
+    assert validator.llm_calls_avoided == 1
+
+
+def test_precheck_only_penalties_do_not_change_llm_score(validator):
+    # Banned terms and hashtags only decide the pre-check
+    score, feedback, _ = validator.validate(
+        post(extra=" Real synergy. #leadership"), "LinkedIn", "150-250"
+    )
+    assert validator.llm.calls == 1
+    assert score == 9.0
+    assert not precheck_failed(feedback)
+    assert "PENALTY" not in feedback
+
+
+def test_emoji_and_question_penalties_are_deducted(validator):
+    score, feedback, _ = validator.validate(
+        post(extra=" Why? 🚀"), "LinkedIn", "150-250"
+    )
+    assert score == pytest.approx(9.0 - 2.0)
+    assert "Contains emojis (-2.0)" in feedback
+
+    score, feedback, _ = validator.validate(post(extra=" Why?"), "LinkedIn", "150-250")
+    assert score == pytest.approx(9.0 - 1.0)
+    assert "Ends with question (-1.0)" in feedback
+
+
+def test_precheck_reports_findings(validator):
+    issues = [issue for issue, _ in validator.precheck(post(signature=False), "150-250")]
+    assert issues == ["No signature phrase"]
+
+
+def test_feedback_only_penalties_do_not_reject_a_draft(validator):
+    """A banned term and a missing signature leave the LLM's score to decide."""
+    score, feedback, _ = validator.validate(
+        post(signature=False, extra=" Less hustle."), "LinkedIn", "150-250"
+    )
+    assert validator.llm.calls == 1
+    assert score == 9.0
+    assert not precheck_failed(feedback)
+
+
+def test_deducted_penalties_out_of_reach_are_rejected(validator):
+    """Emoji and question penalties that rule out MIN_SCORE skip the LLM."""
+    score, feedback, _ = validator.validate(post(extra=" 🚀 Why?"), "LinkedIn", "150-250")
+    assert score == 0.0
+    assert "cannot reach" in feedback
+    assert validator.llm.calls == 0
+
+
+def test_identical_text_is_scored_once(monkeypatch):
+    """Re-validating unchanged content is a cache lookup."""
+    monkeypatch.setattr("core.llm._backend", FakeBackend())
+    agent = ValidatorAgent(cache=ValidationCache())
+    agent.llm = StubLLM(9.0)
+    first = agent.validate(post(), "LinkedIn", "150-250")
+    assert agent.validate(post(), "LinkedIn", "150-250") == first
+    assert agent.llm.calls == 1
+    assert agent.llm_calls_avoided == 1
+
+
+def test_split_results_reads_decorated_result_markers():
+    """Each RESULT block is keyed by its number; the first copy wins."""
+    text = (
+        "Scores below.\n**=== RESULT 1 ===**\nSCORE: 8.5\nFEEDBACK:\n- good\n"
+        "=== RESULT #2 ===\nSCORE: 6\n=== RESULT 2 ===\nSCORE: 9\n"
+    )
+    blocks = ValidatorAgent.split_results(text)
+    assert sorted(blocks) == [1, 2]
+    assert blocks[1].startswith("SCORE: 8.5")
+    assert blocks[2] == "SCORE: 6"
+
+
+def test_validate_many_batches_drafts_and_falls_back_for_missing_results(validator):
+    """One call judges the batch; a draft missing from it is judged alone."""
+    class BatchLLM:
+        calls = 0
+
+        def invoke(self, prompt):
+            BatchLLM.calls += 1
+            text = "=== RESULT 1 ===\nSCORE: 8.5\n=== RESULT 3 ===\nSCORE: 7.0\n"
+            return type("Response", (), {"content": text})()
+
+    validator.batch_llm = BatchLLM()
+    drafts = [post(extra=" One."), post(extra=" Two."), post(extra=" Three."), post(extra=" One.")]
+    scores = [score for score, _, _ in validator.validate_many(drafts, "LinkedIn", "150-250")]
+
+    assert scores == [8.5, 9.0, 7.0, 8.5]
+    assert BatchLLM.calls == 1
+    assert validator.llm.calls == 1
@@ -24,3 +24,48 @@ def sample_agent_config():
         temperature=0.7,
         max_tokens=1000,
     )
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Deterministic offline LLM backend with rate limits lifted."""
+    from functools import lru_cache
+
+    from core import llm, validation_cache
+    from core.fake_llm import FakeLLM
+    from core.rate_limiter import ModelRateLimiter
+
+    @lru_cache(maxsize=None)
+    def unthrottled(model):
+        return ModelRateLimiter(
+            model, requests_per_minute=10**7, burst=10**6, max_concurrency=64
+        )
+
+    fake = FakeLLM(seed=5, time_scale=0)
+    monkeypatch.setattr(llm, "_backend", llm.FakeBackend(fake))
+    monkeypatch.setattr(llm, "get_rate_limiter", unthrottled)
+    monkeypatch.setattr(validation_cache, "_cache", None)
+    return fake
+
+
+class StubKnowledgeBase:
+    """Knowledge base stand-in with fixed context and no index."""
+
+    def __init__(self):
+        self.refreshes = 0
+
+    def get_context(self, topic, lens, objective, k=5):
+        return "Teams follow the systems they work in."
+
+    def search(self, query, k=5):
+        return ["Teams follow the systems they work in."]
+
+    def refresh(self):
+        self.refreshes += 1
+        return False
+
+
+@pytest.fixture
+def stub_knowledge_base():
+    """Knowledge base that needs no embeddings or vector store."""
+    return StubKnowledgeBase()
@@ -0,0 +1,53 @@
+"""Tests for the model cascade's escalation policy."""
+
+import httpx
+import openai
+import pytest
+
+from core.cascade import ModelCascade, tier_for_model
+from core.config import MODELS
+
+
+def provider_error(cls, status):
+    request = httpx.Request("POST", "https://example.invalid/chat")
+    return cls("provider error", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.fixture
+def cascade():
+    return ModelCascade(escalate_below=6.0, attempts_per_tier=2, validation_band=0.5)
+
+
+def test_low_scores_escalate_at_once_and_others_after_the_tier_budget(cascade):
+    """A hopeless draft moves up immediately; a near miss gets another try first."""
+    assert cascade.next_tier("free", 1, score=5.0) == "cheap"
+    assert cascade.next_tier("free", 1, score=7.5) == "free"
+    assert cascade.next_tier("free", 2, score=7.5) == "cheap"
+    assert cascade.next_tier("quality", 5, score=1.0) == "quality"
+
+
+def test_model_errors_escalate_and_transient_errors_do_not(cascade):
+    """Errors tied to the model escalate, even when re-raised by an agent."""
+    try:
+        try:
+            raise provider_error(openai.BadRequestError, 400)
+        except openai.BadRequestError as e:
+            raise Exception("Generation failed") from e
+    except Exception as wrapped:
+        assert cascade.next_tier("free", 1, error=wrapped) == "cheap"
+    assert cascade.next_tier("free", 1, error=provider_error(openai.RateLimitError, 429)) == "free"
+
+
+def test_only_borderline_or_failed_validations_need_confirmation(cascade):
+    """Scores near MIN_SCORE and validation errors are re-judged a tier up."""
+    assert cascade.needs_confirmation(7.8, "SCORE: 7.8")
+    assert not cascade.needs_confirmation(9.0, "SCORE: 9.0")
+    assert cascade.needs_confirmation(0.0, "Error during validation: timeout")
+    assert not cascade.needs_confirmation(0.0, "PRE-CHECK FAILED (cannot reach 8.0)")
+
+
+def test_unknown_tiers_are_rejected():
+    """Tiers must name MODELS entries."""
+    with pytest.raises(ValueError):
+        ModelCascade(tiers=["free", "premium"])
+    assert tier_for_model(MODELS["cheap"]) == "cheap"
@@ -0,0 +1,109 @@
+"""Tests for calendar files, filters and the post-number index."""
+
+import csv
+import json
+from datetime import date
+
+import pytest
+
+from core.content_calendar import (
+    CalendarError, CalendarFilter, CalendarIndex, read_calendar, validate_entry
+)
+
+ENTRIES = [
+    {"post_number": 3, "week": 1, "topic": "Quotas", "lens": "incentives",
+     "objective": "diagnose_failure", "date": "2026-03-02"},
+    {"post_number": 1, "week": 1, "topic": "Handoffs, and why they fail", "lens": "processes",
+     "objective": "establish_credibility", "description": "Line one\nline two"},
+    {"post_number": 2, "week": 2, "topic": "Dashboards", "lens": "metrics",
+     "objective": "reframe_belief", "content_type": "Blog", "priority": 5},
+]
+
+
+def write_calendar(path, entries=ENTRIES):
+    if path.suffix == ".jsonl":
+        path.write_text("".join(json.dumps(entry) + "\n\n" for entry in entries))
+    elif path.suffix == ".csv":
+        fields = ["post_number", "week", "topic", "lens", "objective", "description",
+                  "date", "content_type", "priority"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(entries)
+    else:
+        import yaml
+        path.write_text(yaml.safe_dump(entries))
+    return str(path)
+
+
+@pytest.mark.parametrize("name", ["plan.jsonl", "plan.csv", "plan.yaml"])
+def test_read_calendar_formats(tmp_path, name):
+    """All three formats read to the same validated entries, in file order."""
+    entries = list(read_calendar(write_calendar(tmp_path / name)))
+
+    assert [entry["post_number"] for entry in entries] == [3, 1, 2]
+    assert entries[1]["description"] == "Line one\nline two"
+    assert entries[2]["priority"] == 5
+    assert entries[2]["content_type"] == "Blog"
+    assert entries[0]["date"] == "2026-03-02"
+    assert "content_type" not in entries[0]
+
+
+def test_validate_entry_rejects_bad_fields():
+    """Unknown lenses, content types and malformed numbers or dates are errors."""
+    good = dict(ENTRIES[0])
+    validate_entry(good)
+    for field, value in [
+        ("lens", "vibes"), ("content_type", "Tweet"), ("week", "two"), ("date", "03/02/2026")
+    ]:
+        with pytest.raises(CalendarError, match=field):
+            validate_entry(dict(good, **{field: value}), "plan.csv:2")
+    with pytest.raises(CalendarError, match="missing topic"):
+        validate_entry({k: v for k, v in good.items() if k != "topic"})
+
+
+def test_non_strict_read_skips_invalid_entries(tmp_path):
+    """strict=False warns about an invalid entry and keeps reading."""
+    path = write_calendar(tmp_path / "plan.jsonl", ENTRIES + [dict(ENTRIES[0], lens="vibes")])
+    with pytest.raises(CalendarError):
+        list(read_calendar(path))
+    assert len(list(read_calendar(path, strict=False))) == 3
+
+
+def test_calendar_filter():
+    """Criteria combine; undated entries never match a date window."""
+    entries = [validate_entry(entry) for entry in ENTRIES]
+
+    def selected(**criteria):
+        return [entry["post_number"] for entry in CalendarFilter(**criteria).apply(entries)]
+
+    assert selected() == [3, 1, 2]
+    assert selected(start_post=2, end_post=3) == [3, 2]
+    assert selected(weeks=(2, 2)) == [2]
+    assert selected(lenses=["metrics", "processes"]) == [1, 2]
+    assert selected(content_types=["LinkedIn"]) == [3, 1]
+    assert selected(start_date=date(2026, 3, 1)) == [3]
+    assert selected(end_date=date(2026, 3, 1)) == []
+    assert selected(objectives=["reframe_belief"], content_types=["Blog"]) == [2]
+
+
+@pytest.mark.parametrize("name", ["plan.jsonl", "plan.csv"])
+def test_calendar_index(tmp_path, name):
+    """The index loads entries by post number, including multi-line CSV records."""
+    index = CalendarIndex(write_calendar(tmp_path / name))
+
+    assert len(index) == 3 and 2 in index and 4 not in index
+    assert index.get(1)["description"] == "Line one\nline two"
+    assert index.get(4) is None
+    assert [entry["post_number"] for entry in index.entries(2, None)] == [2, 3]
+    assert index.count(2, 3) == 2
+    assert index.count() == 3
+
+
+def test_calendar_index_rejects_yaml_and_duplicates(tmp_path):
+    """YAML can't be indexed; duplicate post numbers are errors."""
+    assert not CalendarIndex.supports("plan.yaml")
+    with pytest.raises(CalendarError):
+        CalendarIndex(write_calendar(tmp_path / "plan.yaml"))
+    with pytest.raises(CalendarError, match="duplicate"):
+        CalendarIndex(write_calendar(tmp_path / "plan.jsonl", ENTRIES + ENTRIES[:1]))
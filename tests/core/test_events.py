@@ -0,0 +1,86 @@
+"""Tests for batch progress events."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from batch_processor import CONTENT_CALENDAR, BatchProcessor
+from core.events import (
+    ENTRY_FINISHED, ENTRY_STARTED, NOTE, SCORE, ConsoleReporter, emit, event_scope, format_eta,
+    listen,
+)
+from core.usage import UsageRecord, UsageTracker, record_usage, submit_with_context, track_usage
+
+
+def test_emit_without_listeners_does_nothing():
+    """Nothing is built when no listener is active."""
+    assert emit(NOTE, "ignored") is None
+
+
+def test_listeners_see_events_only_inside_their_block():
+    """A listener receives events emitted while it is active, once each."""
+    seen = []
+    with listen(seen.append):
+        with listen(seen.append):
+            emit(NOTE, "inside", reason="test")
+    emit(NOTE, "outside")
+
+    assert [(e.kind, e.message, e.data) for e in seen] == [(NOTE, "inside", {"reason": "test"})]
+
+
+def test_scope_attributes_events_to_its_post_and_tracker():
+    """Events take the post number and running totals of their scope."""
+    seen = []
+    tracker = UsageTracker()
+    with listen(seen.append), track_usage(tracker), event_scope(post_number=7, tracker=tracker):
+        record_usage(UsageRecord(stage="generation", model="m", prompt_tokens=10,
+                                 completion_tokens=5, cost=0.01))
+        emit(SCORE, score=8.5)
+        emit(NOTE, post_number=3)
+
+    assert [e.post_number for e in seen] == [7, 3]
+    assert seen[0].tokens == 15
+    assert seen[0].cost == 0.01
+    assert seen[0].data == {"score": 8.5}
+
+
+def test_listener_and_scope_follow_work_to_worker_threads():
+    """Work submitted with submit_with_context reports to the submitter's listener."""
+    seen = []
+    with listen(seen.append), ThreadPoolExecutor(max_workers=2) as executor:
+        futures = []
+        for post_number in (1, 2):
+            with event_scope(post_number=post_number):
+                futures.append(submit_with_context(executor, emit, NOTE))
+        for future in futures:
+            future.result()
+
+    assert sorted(e.post_number for e in seen) == [1, 2]
+
+
+def test_concurrent_batch_attributes_each_entry_event_to_its_post(
+    fake_llm, stub_knowledge_base
+):
+    """Every post gets exactly one start and one finish event, even with workers."""
+    seen = []
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, concurrency=3, verbose=False)
+    processor.process_batch(calendar=CONTENT_CALENDAR[:4], journal=None, on_event=seen.append)
+
+    expected = sorted(e["post_number"] for e in CONTENT_CALENDAR[:4])
+    for kind in (ENTRY_STARTED, ENTRY_FINISHED):
+        assert sorted(e.post_number for e in seen if e.kind == kind) == expected
+
+
+def test_console_reporter_prints_messages_only(capsys):
+    """Events without a message print nothing."""
+    reporter = ConsoleReporter()
+    with listen(reporter):
+        emit(NOTE, "hello")
+        emit(SCORE, score=9.0)
+
+    assert capsys.readouterr().out == "hello\n"
+
+
+def test_format_eta():
+    """ETAs show minutes and seconds, or hours and minutes."""
+    assert format_eta(None) == "?"
+    assert format_eta(65.4) == "1m 05s"
+    assert format_eta(3 * 3600 + 7 * 60 + 30) == "3h 07m"
@@ -0,0 +1,62 @@
+"""Tests for the offline LLM stand-in."""
+
+import openai
+import pytest
+
+from core import fake_llm
+from core.fake_llm import FakeChatModel, FakeLLM, FakeLLMServer
+from core.llm import OpenRouterBackend
+
+REVISION_PROMPT = "Target: 150-250 words\nReviewer Feedback:\n- tighten\nRevise the post."
+
+
+def test_revisions_get_no_bonus_by_default():
+    """Revision outputs aren't tracked unless a revision gain is set."""
+    fake = FakeLLM(seed=1, time_scale=0)
+    fake.complete(REVISION_PROMPT, "m")
+    assert not fake._revised
+
+
+def test_revision_memory_is_bounded(monkeypatch):
+    """Only the most recent revision outputs are remembered."""
+    monkeypatch.setattr(fake_llm, "REVISED_MEMORY", 3)
+    fake = FakeLLM(seed=1, time_scale=0, revision_gain=1.0)
+    for _ in range(10):
+        fake.complete(REVISION_PROMPT, "m")
+    assert len(fake._revised) == 3
+
+
+def test_outputs_repeat_for_the_same_seed_and_call_sequence():
+    """Same seed, model and prompt history give the same completions."""
+    prompt = "Target: 150-250 words\nWrite a LinkedIn post about systems."
+    runs = []
+    for seed in (5, 5, 6):
+        fake = FakeLLM(seed=seed, time_scale=0)
+        runs.append([fake.complete(prompt, "m")[0] for _ in range(2)])
+
+    assert runs[0] == runs[1]
+    assert runs[0][0] != runs[0][1]
+    assert runs[0] != runs[2]
+
+
+def test_injected_failures_surface_as_provider_errors():
+    """A 429 from the stand-in is the openai error, with its Retry-After."""
+    model = FakeChatModel(FakeLLM(seed=1, rate_limit_rate=1.0, retry_after=2.0, time_scale=0), "m")
+    with pytest.raises(openai.RateLimitError) as error:
+        model.invoke("Write a post.")
+    assert error.value.response.headers["retry-after"] == "2.0"
+
+
+def test_http_server_serves_the_same_completions_to_the_openai_client():
+    """The OpenAI-compatible server answers like the in-process backend."""
+    prompt = "Target: 150-250 words\nWrite a LinkedIn post about systems."
+    server = FakeLLMServer(FakeLLM(seed=3, time_scale=0), port=0).start()
+    try:
+        client = OpenRouterBackend(base_url=server.url, api_key="test").chat_model(
+            "m", 0.7, 1000, 10
+        )
+        served = client.invoke(prompt).content
+    finally:
+        server.shutdown()
+
+    assert served == FakeLLM(seed=3, time_scale=0).complete(prompt, "m")[0]
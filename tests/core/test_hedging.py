@@ -0,0 +1,100 @@
+"""Tests for hedged LLM calls and the circuit breaker."""
+
+import threading
+import time
+
+import pytest
+
+from core.hedging import CircuitBreaker, CircuitOpenError, get_latency_tracker
+from core.llm import LLMBackend, LLMClient
+
+
+class SlowFirstBackend(LLMBackend):
+    """Chat models whose first call hangs and later calls answer at once."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def chat_model(self, model, temperature, max_tokens, timeout):
+        backend = self
+
+        class Model:
+            def invoke(self, prompt):
+                with backend._lock:
+                    backend.calls += 1
+                    call = backend.calls
+                if call == 1:
+                    time.sleep(backend.delay)
+                return type("Message", (), {"content": f"call {call}"})()
+
+        return Model()
+
+
+def warm(model, stage, max_tokens, seconds):
+    """Fill a latency tracker with enough samples to report a p95."""
+    tracker = get_latency_tracker(model, stage, max_tokens)
+    for _ in range(tracker.min_samples):
+        tracker.record(seconds)
+
+
+def test_call_past_its_p95_is_hedged(fake_llm):
+    """A straggler gets a duplicate request and the first answer wins."""
+    warm("test/hedge-straggler", "generation", 400, 0.01)
+    backend = SlowFirstBackend(delay=1.0)
+    client = LLMClient(
+        "test/hedge-straggler", max_tokens=400, hedge=True, backend=backend
+    )
+
+    started = time.monotonic()
+    assert client.invoke("prompt").content == "call 2"
+    assert time.monotonic() - started < 0.5
+
+
+def test_long_calls_are_not_timed_against_short_ones(fake_llm):
+    """Latencies of short validations don't make long generations look slow."""
+    warm("test/hedge-sizes", "validation", 300, 0.01)
+    backend = SlowFirstBackend(delay=0.1)
+    client = LLMClient("test/hedge-sizes", max_tokens=3000, hedge=True, backend=backend)
+
+    assert client.invoke("prompt").content == "call 1"
+    assert backend.calls == 1
+    assert get_latency_tracker("test/hedge-sizes", "validation", 300) is not client.latency
+
+
+def test_breaker_opens_at_threshold_and_allows_one_trial():
+    """Consecutive failures open the circuit; after the reset one trial goes through."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_the_circuit():
+    """A half-open trial that fails opens the circuit again."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_open_circuit_without_fallback_refuses_calls(fake_llm):
+    """A client whose model's circuit is open raises instead of calling."""
+    client = LLMClient("test/breaker-open", backend=SlowFirstBackend(delay=0))
+    for _ in range(client.breaker.failure_threshold):
+        client.breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        client.invoke("prompt")
@@ -0,0 +1,38 @@
+"""Tests for the batch journal."""
+
+import json
+
+from core.journal import BatchJournal, settings_key
+
+
+def test_results_of_other_settings_are_not_reused(tmp_path):
+    """A record is reused only by a journal opened with its settings."""
+    path = str(tmp_path / "journal.jsonl")
+    cheap = settings_key({"models": ["cheap"], "min_score": 8.0})
+    quality = settings_key({"models": ["quality"], "min_score": 8.0})
+    journal = BatchJournal(path, cheap)
+    journal.append("a", {"passed": True})
+    journal.close()
+
+    assert BatchJournal(path, cheap).get("a") == {"passed": True}
+    assert BatchJournal(path, quality).get("a") is None
+    assert BatchJournal(path).get("a") == {"passed": True}
+
+
+def test_reads_results_back_from_offsets_and_skips_a_torn_line(tmp_path):
+    """Only offsets are loaded; the latest record for a key wins."""
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        json.dumps({"key": "a", "result": {"score": 1.0}}) + "\n"
+        + json.dumps({"key": "b", "result": {"score": 2.0}}) + "\n"
+        + json.dumps({"key": "a", "result": {"score": 3.0}}) + "\n"
+        + '{"key": "c", "res'
+    )
+    journal = BatchJournal(str(path))
+    journal.append("c", {"score": 4.0})
+    journal.close()
+
+    reopened = BatchJournal(str(path))
+    assert len(reopened) == 3
+    assert [reopened.get(key)["score"] for key in "abc"] == [3.0, 2.0, 4.0]
+    reopened.close()
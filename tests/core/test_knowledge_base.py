@@ -0,0 +1,57 @@
+"""Tests for the knowledge base index fingerprinting."""
+
+import pytest
+from langchain_core.documents import Document
+
+from core import knowledge_base
+from core.knowledge_base import KnowledgeBase
+
+
+class FakeChroma:
+    """Chroma stand-in that remembers what was indexed per collection."""
+
+    collections = {}
+
+    def __init__(self, persist_directory, embedding_function, collection_name):
+        self.name = collection_name
+
+    @classmethod
+    def from_documents(cls, documents, embedding, persist_directory, collection_name):
+        cls.collections[collection_name] = [doc.page_content for doc in documents]
+        return cls(persist_directory, embedding, collection_name)
+
+    def delete_collection(self):
+        self.collections.pop(self.name, None)
+
+
+@pytest.fixture
+def kb(tmp_path, monkeypatch):
+    docs = tmp_path / "kb"
+    docs.mkdir()
+    (docs / "thesis.md").write_text("Systems beat skill.")
+    FakeChroma.collections = {}
+    monkeypatch.setattr(knowledge_base, "Chroma", FakeChroma)
+    monkeypatch.setattr(knowledge_base, "HuggingFaceEmbeddings", lambda model_name: None)
+    monkeypatch.setattr(knowledge_base, "KNOWLEDGE_BASE_DIR", str(docs))
+    monkeypatch.setattr(knowledge_base, "VECTOR_STORE_DIR", str(tmp_path / "store"))
+    return KnowledgeBase(collection_name="test")
+
+
+def test_index_of_explicit_documents_survives_reload(kb):
+    """Loading or refreshing keeps an index built from explicit documents."""
+    kb.build_vector_store([Document(page_content="Only this.", metadata={"source": "x"})])
+    reloaded = KnowledgeBase(collection_name="test")
+    reloaded.load_vector_store()
+
+    assert not reloaded.refresh()
+    assert FakeChroma.collections["test"] == ["Only this."]
+
+
+def test_index_of_the_directory_is_rebuilt_after_an_edit(kb, tmp_path):
+    """An index built from the directory follows edits to its documents."""
+    kb.build_vector_store()
+    assert not kb.refresh()
+    (tmp_path / "kb" / "thesis.md").write_text("Systems still beat skill.")
+
+    assert kb.refresh()
+    assert FakeChroma.collections["test"] == ["Systems still beat skill."]
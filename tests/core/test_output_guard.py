@@ -0,0 +1,66 @@
+"""Tests for output sizing and early stops of streamed generations."""
+
+import pytest
+
+from core.config import OUTPUT_WORD_MARGIN, TOKENS_PER_WORD
+from core.llm import LLMClient
+from core.output_guard import (
+    EMOJI_PATTERN, EarlyStopError, OutputGuard, max_tokens_for, stream_guarded
+)
+
+
+def test_max_tokens_follow_the_top_of_the_range():
+    """The limit leaves OUTPUT_WORD_MARGIN headroom over the longest allowed draft."""
+    assert max_tokens_for("150-250") >= 250 * TOKENS_PER_WORD
+    assert max_tokens_for("150-250") == pytest.approx(
+        250 * OUTPUT_WORD_MARGIN * TOKENS_PER_WORD, abs=1
+    )
+    assert max_tokens_for("1000-2000") > max_tokens_for("800-1500")
+
+
+def test_guard_counts_words_split_across_chunks_once():
+    """A word streamed in pieces is one word."""
+    guard = OutputGuard("1-2", overshoot=1.0)
+    assert guard.feed("Sys") is None
+    assert guard.feed("tems beat") is None
+    assert guard.words == 2
+    assert guard.feed(" skill") == "output exceeded 2 words"
+
+
+def test_guard_stops_on_emoji_but_not_on_text_symbols():
+    """Emoji end the stream; check marks and stars don't."""
+    assert OutputGuard("150-250").feed("Ship it 🚀") == "emoji in output"
+    assert OutputGuard("150-250").feed("Done ✓ ✗ ★") is None
+    assert not EMOJI_PATTERN.search("→ • —")
+
+
+class StoppingLLM:
+    """LLM stand-in whose first streams are stopped early."""
+
+    def __init__(self, stops):
+        self.stops = stops
+        self.streams = 0
+
+    def stream(self, prompt, should_stop=None):
+        self.streams += 1
+        if self.streams <= self.stops:
+            raise EarlyStopError("output exceeded 312 words")
+        return type("Message", (), {"content": "A fine draft."})()
+
+
+def test_stopped_generation_is_regenerated_up_to_the_retry_limit():
+    """Early stops start a fresh generation; running out of retries raises."""
+    llm = StoppingLLM(stops=1)
+    assert stream_guarded(llm, "prompt", "150-250", retries=1) == "A fine draft."
+    assert llm.streams == 2
+
+    with pytest.raises(EarlyStopError):
+        stream_guarded(StoppingLLM(stops=2), "prompt", "150-250", retries=1)
+
+
+def test_client_abandons_a_stream_once_the_guard_trips(fake_llm):
+    """LLMClient.stream stops reading as soon as the draft runs too long."""
+    client = LLMClient("test/stream-guard")
+    with pytest.raises(EarlyStopError) as stopped:
+        client.stream("Target: 150-250 words\nWrite a post.", OutputGuard("10-20").feed)
+    assert len(stopped.value.partial.split()) == 25
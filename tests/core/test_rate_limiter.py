@@ -0,0 +1,105 @@
+"""Tests for the token bucket, AIMD concurrency and retry/backoff."""
+
+import time
+
+import httpx
+import openai
+import pytest
+
+from core.rate_limiter import (
+    AdaptiveConcurrencyLimiter, ModelRateLimiter, TokenBucket, retry_after_seconds
+)
+
+
+def provider_error(cls, status, headers=None):
+    request = httpx.Request("POST", "https://example.invalid/chat")
+    response = httpx.Response(status, request=request, headers=headers or {})
+    return cls("provider error", response=response, body=None)
+
+
+def test_bucket_allows_a_burst_then_the_sustained_rate():
+    """Capacity tokens go at once; later ones arrive at the refill rate."""
+    bucket = TokenBucket(rate=20.0, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.03
+    for _ in range(2):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_paused_bucket_hands_out_nothing_until_the_pause_ends():
+    """A Retry-After pause holds every caller of the bucket."""
+    bucket = TokenBucket(rate=1000.0, capacity=5)
+    bucket.pause(0.1)
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_concurrency_halves_on_rate_limit_once_per_cooldown_and_grows_back():
+    """AIMD: multiplicative decrease on 429s, additive increase on successes."""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, cooldown=60.0)
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+
+def test_concurrency_never_drops_below_the_floor():
+    """Repeated 429s stop halving at min_limit."""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=1, cooldown=0.0)
+    for _ in range(5):
+        limiter.on_rate_limited()
+    assert limiter.limit == 1
+
+
+def test_call_retries_rate_limits_after_retry_after():
+    """A 429 is retried once the provider's Retry-After has passed."""
+    limiter = ModelRateLimiter(
+        "test/model", requests_per_minute=60000, burst=10, backoff_base=0.0
+    )
+    outcomes = [provider_error(openai.RateLimitError, 429, {"retry-after-ms": "100"}), "ok"]
+
+    def call():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    started = time.monotonic()
+    assert limiter.call(call) == "ok"
+    assert time.monotonic() - started >= 0.09
+    assert limiter.concurrency.limit < limiter.concurrency.max_limit
+
+
+def test_call_raises_other_errors_without_retrying():
+    """Errors that won't go away on retry are raised at once."""
+    limiter = ModelRateLimiter("test/model", requests_per_minute=60000, burst=10)
+    calls = []
+
+    def call():
+        calls.append(None)
+        raise provider_error(openai.BadRequestError, 400)
+
+    with pytest.raises(openai.BadRequestError):
+        limiter.call(call)
+    assert len(calls) == 1
+
+
+def test_retry_after_is_read_from_seconds_or_milliseconds():
+    """Both Retry-After forms are understood; no header means no hint."""
+    assert retry_after_seconds(
+        provider_error(openai.RateLimitError, 429, {"retry-after": "2"})
+    ) == 2
+    assert retry_after_seconds(
+        provider_error(openai.RateLimitError, 429, {"retry-after-ms": "250"})
+    ) == 0.25
+    assert retry_after_seconds(provider_error(openai.RateLimitError, 429)) is None
@@ -0,0 +1,47 @@
+"""Tests for budget checks, cost prediction and attempt ordering."""
+
+from core.config import PREDICTED_ATTEMPT_TOKENS
+from core.scheduler import (
+    COST_BUDGET, DEADLINE, TOKEN_BUDGET, BatchBudget, CostModel, schedule_key
+)
+
+
+def test_exceeded_by_reports_first_broken_limit():
+    """Tokens, then cost, then the deadline; unset limits never trip."""
+    budget = BatchBudget(max_tokens=1000, max_cost=1.0, deadline=100.0)
+    assert budget.exceeded_by(1000, 1.0, 10, now=90) is None
+    assert budget.exceeded_by(1001, 2.0, 20, now=90) == TOKEN_BUDGET
+    assert budget.exceeded_by(900, 1.5, 20, now=90) == COST_BUDGET
+    assert budget.exceeded_by(900, 0.5, 11, now=90) == DEADLINE
+    assert BatchBudget().exceeded_by(10**9, 10**6, 10**6) is None
+
+
+def test_cost_model_moves_from_prior_to_observed():
+    """Predictions start at the configured values and converge on observations."""
+    model = CostModel(prior_weight=1)
+    prior = PREDICTED_ATTEMPT_TOKENS["LinkedIn"]
+    tokens, _, _ = model.predict("LinkedIn", "m")
+    assert tokens == prior["prompt"] + prior["completion"]
+
+    for _ in range(99):
+        model.observe("LinkedIn", 1000, 200, 2.0)
+    tokens, cost, seconds = model.predict("LinkedIn", "m")
+    assert abs(tokens - 1200) < 40
+    assert cost == 0.0
+    assert seconds < 2.5
+    # Other content types keep their own prior
+    assert model.predict("Blog", "m")[0] == sum(PREDICTED_ATTEMPT_TOKENS["Blog"].values())
+
+
+def test_schedule_key_orders_attempts_then_week_then_priority():
+    """Fewer attempts first, then earlier weeks, then higher priority."""
+    early = {"week": 1}
+    late_urgent = {"week": 2, "priority": 9}
+    late = {"week": 2}
+    keys = {
+        "retry": schedule_key(early, 1, 0),
+        "late": schedule_key(late, 0, 1),
+        "urgent": schedule_key(late_urgent, 0, 2),
+        "early": schedule_key(early, 0, 3),
+    }
+    assert sorted(keys, key=keys.get) == ["early", "urgent", "late", "retry"]
@@ -0,0 +1,26 @@
+"""Tests for the streaming result sinks."""
+
+import gzip
+import json
+import zlib
+
+from core.sinks import open_sink
+
+
+def test_gzip_sink_is_readable_while_open_and_appendable(tmp_path):
+    """Flushed records decompress mid-run; a reopened sink appends to the file."""
+    path = str(tmp_path / "results.jsonl.gz")
+    sink = open_sink(path)
+    sink.write({"post_number": 1})
+    sink.write({"post_number": 2})
+    with open(path, "rb") as f:
+        partial = zlib.decompressobj(wbits=31).decompress(f.read())
+    assert [json.loads(line) for line in partial.splitlines()] == [
+        {"post_number": 1}, {"post_number": 2}
+    ]
+    sink.close()
+
+    with open_sink(path) as sink:
+        sink.write({"post_number": 3})
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(line)["post_number"] for line in f] == [1, 2, 3]
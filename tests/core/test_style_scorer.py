@@ -0,0 +1,25 @@
+"""Tests for the style pre-scorer's calibration history."""
+
+import json
+
+from core.config import FAILED_CONTENT, PRECHECK_FAILED, STYLE_PRESCORE
+from core.style_scorer import load_history
+
+
+def test_load_history_keeps_only_llm_judged_scores(tmp_path):
+    """Pre-check rejections, pre-scores and missing drafts aren't calibration data."""
+    results = [
+        {"content": "judged post", "score": 8.5, "feedback": "SCORE: 8.5"},
+        {"content": "blog post", "score": 7.0, "feedback": "SCORE: 7", "content_type": "Blog"},
+        {"content": "far off", "score": 0.0, "feedback": f"{PRECHECK_FAILED} (cannot reach 8.0)"},
+        {"content": "predicted", "score": 9.1, "feedback": f"{STYLE_PRESCORE} (clear pass)"},
+        {"content": FAILED_CONTENT, "score": 0, "feedback": ""},
+        {"content": "broken", "score": 0, "feedback": "Error: timeout"},
+    ]
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"results": results}))
+
+    assert load_history([str(path)]) == {
+        "LinkedIn": [("judged post", 8.5)],
+        "Blog": [("blog post", 7.0)],
+    }
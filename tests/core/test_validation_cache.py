@@ -0,0 +1,47 @@
+"""Tests for the content-hash validation cache."""
+
+from core import validation_cache
+from core.validation_cache import ValidationCache, validation_key
+
+RESULT = (8.5, "SCORE: 8.5", 200)
+
+
+def test_key_changes_with_every_input_and_the_prompt_version(monkeypatch):
+    """Any input that can change the verdict changes the key."""
+    base = ("Systems beat skill.", "LinkedIn", "150-250", "model-a")
+    key = validation_key(*base)
+    assert validation_key(*base) == key
+    for i, other in enumerate(["Systems beat talent.", "Blog", "800-1500", "model-b"]):
+        changed = list(base)
+        changed[i] = other
+        assert validation_key(*changed) != key
+
+    monkeypatch.setattr(validation_cache, "VALIDATION_PROMPT_VERSION", "next")
+    assert validation_key(*base) != key
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    """A lookup refreshes an entry; the oldest untouched one goes."""
+    cache = ValidationCache(max_size=2)
+    cache.put("a", RESULT)
+    cache.put("b", RESULT)
+    assert cache.get("a") == RESULT
+    cache.put("c", RESULT)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULT
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_persisted_results_survive_eviction_and_restarts(tmp_path):
+    """With a path, misses fall through to SQLite."""
+    path = str(tmp_path / "validations.db")
+    cache = ValidationCache(max_size=1, path=path)
+    cache.put("a", RESULT)
+    cache.put("b", RESULT)
+    assert cache.get("a") == RESULT
+
+    assert ValidationCache(path=path).get("b") == RESULT
+    cache.clear()
+    assert ValidationCache(path=path).get("a") is None
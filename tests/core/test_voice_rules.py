@@ -0,0 +1,66 @@
+"""Tests for the single-pass voice rule scanner."""
+
+import re
+
+from core.voice_rules import BANNED_TERM, EMOJI, HASHTAG, SIGNATURE_PHRASE, VoiceScanner
+
+BANNED = ["synergy", "game changer", "game", "hustle"]
+PHRASES = ["systems beat skill"]
+
+
+def reference_findings(text):
+    """Rule matches found the slow way, one regex per rule."""
+    found = set()
+    for term in BANNED:
+        for match in re.finditer(rf"\b{re.escape(term)}\b", text, re.I):
+            found.add((BANNED_TERM, match.group().lower()))
+    for phrase in PHRASES:
+        for match in re.finditer(re.escape(phrase), text, re.I):
+            found.add((SIGNATURE_PHRASE, match.group().lower()))
+    for match in re.finditer(r"(?<![\w&])#[A-Za-z]\w*", text):
+        found.add((HASHTAG, match.group().lower()))
+    return found
+
+
+def test_one_pass_finds_what_per_rule_scans_find():
+    """The combined pattern agrees with separate per-rule searches."""
+    scanner = VoiceScanner(banned_terms=BANNED, signature_phrases=PHRASES)
+    texts = [
+        "Systems Beat Skill. Real SYNERGY comes from #Process, not hustle.",
+        "The hustler's game is a trap; team&#39;s C# code ships anyway.",
+        "No rules broken here, just a calm note.",
+    ]
+    for text in texts:
+        report = scanner.scan(text)
+        found = {(f.rule, f.text.lower()) for f in report.findings if f.rule != EMOJI}
+        assert found == reference_findings(text), text
+
+
+def test_findings_keep_original_text_positions_and_order():
+    """Matches are reported in text order with the draft's own casing."""
+    text = "Synergy 🚀🚀 and a Game Changer."
+    report = VoiceScanner(banned_terms=BANNED, signature_phrases=PHRASES).scan(text)
+
+    assert [(f.rule, f.text) for f in report.findings] == [
+        (BANNED_TERM, "Synergy"), (EMOJI, "🚀🚀"), (BANNED_TERM, "Game Changer")
+    ]
+    assert all(text[f.start:f.end] == f.text for f in report.findings)
+    assert report.banned_terms == ["game changer", "synergy"]
+    assert not report.has_signature_phrase
+
+
+def test_text_whose_length_changes_when_lowercased_is_still_scanned():
+    """Positions stay right for text like a dotted capital I."""
+    text = "İstanbul teams: Systems beat skill. #Ops"
+    report = VoiceScanner(banned_terms=BANNED, signature_phrases=PHRASES).scan(text)
+
+    assert report.has_signature_phrase
+    assert report.hashtags == ["#ops"]
+    assert all(text[f.start:f.end] == f.text for f in report.findings)
+
+
+def test_report_counts_words_and_trailing_questions():
+    """Word count and the question check come from the same scan."""
+    report = VoiceScanner().scan("What would change if the system did?  ")
+    assert report.word_count == 7
+    assert report.ends_with_question
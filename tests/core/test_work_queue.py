@@ -0,0 +1,104 @@
+"""Tests for the SQLite work queue's leases and re-enqueueing."""
+
+import time
+
+import pytest
+
+from core.work_queue import DEAD, DONE, PENDING, WorkQueue
+
+
+def entry(number, content_type=None):
+    entry = {"post_number": number, "week": 1, "topic": f"Topic {number}",
+             "lens": "metrics", "objective": "reframe_belief"}
+    if content_type:
+        entry["content_type"] = content_type
+    return entry
+
+
+@pytest.fixture
+def queue(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.db"), visibility_timeout=0.2, max_attempts=2)
+    yield work_queue
+    work_queue.close()
+
+
+def test_claims_follow_position_and_exclude_leased(queue):
+    """Entries are claimed in calendar order, each by one worker at a time."""
+    assert queue.enqueue("b", entry(2), "run", 1)
+    assert queue.enqueue("a", entry(1), "run", 0)
+    assert not queue.enqueue("a", entry(1), "run", 0)
+
+    first = queue.claim("w1")
+    second = queue.claim("w2")
+    assert (first.key, second.key) == ("a", "b")
+    assert first.attempts == 1
+    assert queue.claim("w3") is None
+
+
+def test_skip_types(queue):
+    """Workers can pass over content types they have no room for."""
+    queue.enqueue("blog", entry(1, "Blog"), "run", 0)
+    queue.enqueue("post", entry(2), "run", 1)
+    assert queue.claim("w1", skip_types=["Blog"]).key == "post"
+    assert queue.claim("w1", skip_types=["LinkedIn"]).key == "blog"
+
+
+def test_expired_lease_moves_to_another_worker(queue):
+    """A lease that isn't renewed expires; the old owner's result is dropped."""
+    queue.enqueue("a", entry(1), "run", 0)
+    task = queue.claim("w1")
+    time.sleep(0.3)
+
+    retry = queue.claim("w2")
+    assert retry.id == task.id and retry.attempts == 2
+    assert not queue.complete(task.id, "w1", {"passed": True})
+    assert queue.complete(retry.id, "w2", {"passed": True})
+    [(position, _, result, attempts)] = queue.collect("run")
+    assert (position, result, attempts) == (0, {"passed": True}, 2)
+    assert queue.collect("run") == []
+
+
+def test_renewed_lease_is_kept(queue):
+    """Renewing keeps a slow entry with its worker."""
+    queue.enqueue("a", entry(1), "run", 0)
+    task = queue.claim("w1")
+    for _ in range(3):
+        time.sleep(0.1)
+        assert queue.renew([task.id], "w1") == 1
+    assert queue.claim("w2") is None
+    assert queue.renew([task.id], "w2") == 0
+
+
+def test_entry_dies_after_max_attempts(queue):
+    """An entry whose lease expired max_attempts times is collected as dead."""
+    queue.enqueue("a", entry(1), "run", 0)
+    for _ in range(2):
+        assert queue.claim("w") is not None
+        time.sleep(0.3)
+    assert queue.claim("w") is None
+    assert queue.counts() == {DEAD: 1}
+    [(_, _, result, attempts)] = queue.collect("run")
+    assert result is None and attempts == 2
+    assert queue.unfinished() == 0
+
+
+def test_next_run_redoes_failed_and_dead_entries(queue):
+    """Passing results carry over to the next run; failed ones only with resume."""
+    for key, number in (("pass", 1), ("fail", 2)):
+        queue.enqueue(key, entry(number), "run1", number)
+        task = queue.claim("w")
+        queue.complete(task.id, "w", {"passed": key == "pass"})
+    queue.enqueue("dead", entry(3), "run1", 3)
+    for _ in range(2):
+        queue.claim("w")
+        time.sleep(0.3)
+    queue.claim("w")
+
+    for key, number in (("pass", 1), ("fail", 2), ("dead", 3)):
+        assert queue.enqueue(key, entry(number), "run2", number, resume=True)
+    assert queue.counts() == {DONE: 2, PENDING: 1}
+
+    for key, number in (("pass", 1), ("fail", 2), ("dead", 3)):
+        assert queue.enqueue(key, entry(number), "run3", number)
+    assert queue.counts() == {DONE: 1, PENDING: 2}
+    assert {queue.claim("w").key, queue.claim("w").key} == {"fail", "dead"}
@@ -0,0 +1,331 @@
+"""Tests for the batch processor."""
+
+import json
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from agents.article_agent import ArticleAgent
+from agents.blog_agent import BlogAgent
+from agents.linkedin_agent import LinkedInAgent
+from batch_processor import CONTENT_CALENDAR, BatchProcessor, BatchStats
+from core import llm, validation_cache
+from core.cascade import ModelCascade
+from core.config import MODELS
+from core.events import ATTEMPT, BATCH_FINISHED, BATCH_STARTED, listen
+from core.fake_llm import FakeLLM
+from core.scheduler import DEADLINE, TOKEN_BUDGET, BatchBudget
+from core.usage import track_usage
+
+
+def test_iter_events_keeps_callers_usage_tracking(fake_llm, stub_knowledge_base):
+    """Calls made by an iter_events batch count toward the caller's tracker."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+    with track_usage() as usage:
+        events = list(processor.iter_events(calendar=CONTENT_CALENDAR[:2]))
+
+    assert events[-1].kind == BATCH_FINISHED
+    assert usage.summary()["calls"] > 0
+
+
+def test_calls_per_accepted_counts_llm_calls_only():
+    """Retrieval records don't count as LLM calls."""
+    usage = {
+        "calls": 5,
+        "by_stage": {"generation": {"calls": 2}, "validation": {"calls": 2}, "rag": {"calls": 1}},
+    }
+    results = [{"post_number": 1, "passed": True, "attempts_to_pass": 1, "usage": usage}]
+    assert BatchStats.of(results).attempts()["llm_calls_per_accepted"] == 4
+
+
+def test_post_range_of_a_calendar_file_has_a_known_total(
+    tmp_path, fake_llm, stub_knowledge_base
+):
+    """A post range on a JSONL calendar is read through the index."""
+    path = tmp_path / "plan.jsonl"
+    path.write_text("".join(
+        json.dumps(dict(entry, post_number=number)) + "\n"
+        for number, entry in zip([5, 2, 4, 1], CONTENT_CALENDAR)
+    ))
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+    events = list(processor.iter_events(calendar=str(path), start_post=2, end_post=4))
+
+    started = next(event for event in events if event.kind == BATCH_STARTED)
+    assert started.data["total"] == 2
+    assert [result["post_number"] for result in events[-1].data["results"]] == [2, 4]
+
+
+def test_budget_stops_before_overrunning_and_skips_the_rest(fake_llm, stub_knowledge_base):
+    """First attempts go before retries; unreached entries are skipped."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+    events = list(processor.iter_events(
+        calendar=CONTENT_CALENDAR[:6], budget=BatchBudget(max_tokens=5000)
+    ))
+    finished = events[-1].data
+    results = finished["results"]
+
+    assert finished["stop_reason"] == TOKEN_BUDGET
+    skipped = [result for result in results if result.get("skipped")]
+    attempted = [result for result in results if not result.get("skipped")]
+    assert skipped and attempted
+    assert finished["skipped"] == [result["post_number"] for result in skipped]
+    assert all(result["attempts"] == 0 for result in skipped)
+    # Nobody got a retry while other entries were still waiting
+    assert all(result["attempts"] == 1 for result in attempted)
+    assert all(result["stopped"] == TOKEN_BUDGET for result in attempted if not result["passed"])
+    assert results == sorted(results, key=lambda result: bool(result.get("skipped")))
+
+
+def test_budget_past_deadline_starts_nothing(fake_llm, stub_knowledge_base):
+    """A deadline that has already passed skips every entry without a call."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+    results = processor.process_batch(
+        calendar=CONTENT_CALENDAR[:3], budget=BatchBudget(deadline=time.time())
+    )
+    assert [result["skipped"] for result in results] == [DEADLINE] * 3
+    assert processor.last_usage["calls"] == 0
+
+
+@pytest.mark.parametrize("option", [
+    {"workers": 2}, {"parallel_candidates": 3}, {"pipeline": True}, {"posts_per_call": 3}
+])
+def test_budget_rejects_unsupported_options(stub_knowledge_base, fake_llm, option):
+    """Budgeted runs don't silently drop workers, best-of-N, pipelining or multi-post drafts."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False, **option)
+    with pytest.raises(ValueError, match=next(iter(option))):
+        processor.process_batch(calendar=CONTENT_CALENDAR[:1], budget=BatchBudget(max_cost=1))
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_multi_post_draft_does_not_use_up_a_tier(
+    fake_llm, stub_knowledge_base, monkeypatch, pipeline
+):
+    """A drafted entry still gets attempts_per_tier generations before escalating."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, verbose=False, max_retries=4, pipeline=pipeline,
+        cascade=ModelCascade(attempts_per_tier=2)
+    )
+    # Near misses: never escalated for the score alone
+    monkeypatch.setattr(processor, "_validate", lambda content, content_type: (7.0, "", 200))
+    events = []
+    with listen(events.append):
+        processor._run_attempts(CONTENT_CALENDAR[0], draft="A drafted post.")
+
+    tiers = [event.data["tier"] for event in events if event.kind == ATTEMPT]
+    assert tiers == ["free", "free", "free", "cheap"]
+
+
+def test_journal_is_not_reused_with_other_models(tmp_path, fake_llm, stub_knowledge_base):
+    """Posts journaled with one model are generated again with another."""
+    journal = str(tmp_path / "journal.jsonl")
+    calendar = CONTENT_CALENDAR[:2]
+    BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False).process_batch(
+        calendar=calendar, journal=journal
+    )
+
+    def reused(model):
+        processor = BatchProcessor(model=model, knowledge_base=stub_knowledge_base, verbose=False)
+        results = processor.process_batch(calendar=calendar, journal=journal)
+        return [bool(result.get("resumed")) for result in results]
+
+    passed = [json.loads(line)["result"]["passed"] for line in open(journal)]
+    assert reused(None) == passed
+    assert reused(MODELS["quality"]) == [False, False]
+
+
+def test_multi_post_drafts_leave_out_other_content_types(fake_llm, stub_knowledge_base):
+    """Blog and Article entries are never put into a LinkedIn multi-post call."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, posts_per_call=4, verbose=False
+    )
+    groups = []
+    processor.linkedin_agent.generate_many = lambda entries: groups.append(entries) or {}
+    week = CONTENT_CALENDAR[0]["week"]
+    types = ["LinkedIn", "Blog", "LinkedIn", "Article"]
+    entries = [
+        dict(entry, week=week, content_type=content_type)
+        for entry, content_type in zip(CONTENT_CALENDAR, types)
+    ]
+
+    processor.generate_drafts(entries)
+    assert [[entry["post_number"] for entry in group] for group in groups] == [
+        [entries[0]["post_number"], entries[2]["post_number"]]
+    ]
+
+
+def test_repeated_entries_get_their_own_queue_keys(fake_llm, stub_knowledge_base):
+    """A calendar entry that appears twice isn't dropped by the work queue."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, workers=2, verbose=False)
+    entry = CONTENT_CALENDAR[0]
+    pending = [(0, entry, None), (1, CONTENT_CALENDAR[1], None), (2, dict(entry), None)]
+    warnings = []
+    with listen(lambda event: warnings.append(event) if event.data.get("duplicate") else None):
+        keys = [key for _, _, key in processor._queue_keys(pending)]
+
+    assert len(set(keys)) == 3
+    assert [event.post_number for event in warnings] == [entry["post_number"]]
+
+
+def test_best_of_n_stops_once_a_candidate_passes(fake_llm, stub_knowledge_base):
+    """Slower candidates are cancelled before their validation call."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, parallel_candidates=3, verbose=False
+    )
+    started = []
+    validated = []
+
+    def generate(entry, tier=None, revise_from=None):
+        started.append(None)
+        number = len(started) - 1
+        if number:
+            time.sleep(0.2)
+        return f"draft {number}"
+
+    def validate(content, content_type="LinkedIn"):
+        validated.append(content)
+        return (9.0 if content == "draft 0" else 7.0), "fine", 200
+
+    processor._generate = generate
+    processor._validate = validate
+    result = processor.process_single(CONTENT_CALENDAR[0])
+    time.sleep(0.3)
+
+    assert result["passed"]
+    assert result["content"] == "draft 0"
+    assert result["attempts"] == 1
+    assert validated == ["draft 0"]
+
+
+def test_best_of_n_keeps_the_best_failing_candidate(fake_llm, stub_knowledge_base):
+    """Without a pass, every candidate counts and the highest score is kept."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, parallel_candidates=3, max_retries=3,
+        revise_on_failure=False, verbose=False
+    )
+    scores = iter([6.0, 7.5, 7.0])
+    processor._generate = lambda entry, tier=None, revise_from=None: "draft"
+    processor._validate = lambda content, content_type="LinkedIn": (next(scores), "meh", 200)
+    result = processor.process_single(CONTENT_CALENDAR[0])
+
+    assert not result["passed"]
+    assert result["score"] == 7.5
+    assert result["attempts"] == 3
+
+
+def test_cascade_escalates_a_hopeless_draft_to_the_next_tier(fake_llm, stub_knowledge_base):
+    """Posts start on the cheapest tier and move up only after failing there."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, cascade=ModelCascade(), revise_on_failure=False,
+        verbose=False
+    )
+    tiers = []
+    scores = iter([5.0, 9.0])
+
+    def generate(entry, tier=None, revise_from=None):
+        tiers.append(tier)
+        return f"draft on {tier}"
+
+    processor._generate = generate
+    processor._validate = lambda content, content_type="LinkedIn": (next(scores), "ok", 200)
+    result = processor.process_single(CONTENT_CALENDAR[0])
+
+    assert tiers == ["free", "cheap"]
+    assert result["passed"]
+    assert result["tier"] == "cheap"
+
+
+def test_concurrent_batch_matches_sequential_run(monkeypatch, fake_llm, stub_knowledge_base):
+    """With a seed, results and their order don't depend on concurrency."""
+    def run(concurrency):
+        # Fresh stand-in and cache, so both runs start from the same state
+        monkeypatch.setattr(llm, "_backend", llm.FakeBackend(FakeLLM(seed=5, time_scale=0)))
+        monkeypatch.setattr(validation_cache, "_cache", None)
+        processor = BatchProcessor(
+            knowledge_base=stub_knowledge_base, concurrency=concurrency, seed=1, verbose=False
+        )
+        results = processor.process_batch(calendar=CONTENT_CALENDAR[:6], journal=None)
+        return [(r["post_number"], r["content"], r["score"]) for r in results]
+
+    sequential = run(1)
+    assert [number for number, _, _ in sequential] == [
+        entry["post_number"] for entry in CONTENT_CALENDAR[:6]
+    ]
+    assert run(4) == sequential
+
+
+def test_entries_in_flight_never_exceed_concurrency(fake_llm, stub_knowledge_base):
+    """The worker pool is bounded by the concurrency setting."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, concurrency=2, verbose=False)
+    in_flight = []
+    peak = []
+
+    def process_single(entry, draft=None):
+        in_flight.append(entry["post_number"])
+        peak.append(len(in_flight))
+        time.sleep(0.02)
+        in_flight.remove(entry["post_number"])
+        return processor._build_result(entry, "draft", 9.0, "fine", 1)
+
+    processor.process_single = process_single
+    results = processor.process_batch(calendar=CONTENT_CALENDAR[:6], journal=None)
+
+    assert max(peak) == 2
+    assert [r["post_number"] for r in results] == [e["post_number"] for e in CONTENT_CALENDAR[:6]]
+
+
+def test_type_limit_is_clamped_to_the_batch_concurrency(fake_llm, stub_knowledge_base):
+    """Per-type limits never exceed the batch's concurrency or drop below one."""
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, concurrency=3, verbose=False,
+        type_concurrency={"Blog": 10, "Article": 0},
+    )
+
+    assert processor._type_limit("Blog") == 3
+    assert processor._type_limit("Article") == 1
+    assert processor._type_limit("LinkedIn") == 3
+
+
+def test_each_content_type_gets_its_own_generator(fake_llm, stub_knowledge_base):
+    """Entries are routed to the agent registered for their content type."""
+    processor = BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+
+    for content_type, agent in [
+        ("LinkedIn", LinkedInAgent), ("Blog", BlogAgent), ("Article", ArticleAgent)
+    ]:
+        generator, _ = processor._agents_for(None, content_type)
+        assert isinstance(generator, agent)
+        assert processor._agents_for(None, content_type)[0] is generator
+
+
+def test_long_form_entries_respect_their_type_limit(fake_llm, stub_knowledge_base):
+    """A type at its limit is held back while other types use the free slots."""
+    calendar = [
+        dict(entry, content_type="Blog" if i < 4 else "LinkedIn")
+        for i, entry in enumerate(CONTENT_CALENDAR[:8])
+    ]
+    processor = BatchProcessor(
+        knowledge_base=stub_knowledge_base, concurrency=4, verbose=False,
+        type_concurrency={"Blog": 1},
+    )
+    lock = threading.Lock()
+    running = Counter()
+    peak = Counter()
+
+    def process_single(entry, draft=None):
+        content_type = entry["content_type"]
+        with lock:
+            running[content_type] += 1
+            peak[content_type] = max(peak[content_type], running[content_type])
+        time.sleep(0.02)
+        with lock:
+            running[content_type] -= 1
+        return processor._build_result(entry, "draft", 9.0, "fine", 1)
+
+    processor.process_single = process_single
+    results = processor.process_batch(calendar=calendar, journal=None)
+
+    assert peak["Blog"] == 1
+    assert peak["LinkedIn"] > 1
+    assert [r["post_number"] for r in results] == [e["post_number"] for e in calendar]
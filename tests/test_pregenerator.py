@@ -0,0 +1,70 @@
+"""Tests for the pre-generation daemon."""
+
+from datetime import date
+
+import pytest
+
+from batch_processor import CONTENT_CALENDAR, BatchProcessor
+from core.draft_store import DraftStore
+from core.knowledge_base import knowledge_base_fingerprint
+from pregenerator import PreGenerator
+
+
+@pytest.fixture
+def store(tmp_path):
+    draft_store = DraftStore(str(tmp_path / "drafts.db"))
+    yield draft_store
+    draft_store.close()
+
+
+@pytest.fixture
+def processor(fake_llm, stub_knowledge_base):
+    return BatchProcessor(knowledge_base=stub_knowledge_base, verbose=False)
+
+
+def test_default_run_drafts_builtin_calendar(processor, store):
+    """The built-in calendar has no dates; a default run still drafts it."""
+    stats = PreGenerator(processor, store).run_once()
+
+    assert stats["upcoming"] == len(CONTENT_CALENDAR)
+    assert stats["generated"] == len(CONTENT_CALENDAR)
+    assert stats["passed"] > 0
+    assert processor.knowledge_base.refreshes == 1
+
+    # What the UI looks up (app.get_pregenerated_draft)
+    fingerprint = knowledge_base_fingerprint()
+    served = [store.get(entry, fingerprint=fingerprint) for entry in CONTENT_CALENDAR]
+    assert sum(result is not None for result in served) == stats["passed"]
+    for entry, result in zip(CONTENT_CALENDAR, served):
+        if result is not None:
+            assert result["post_number"] == entry["post_number"]
+            assert result["passed"]
+
+
+def test_second_run_reuses_current_drafts(processor, store):
+    """Entries with a current draft are not generated again."""
+    pregenerator = PreGenerator(processor, store, retry_failed_after=3600)
+    pregenerator.run_once()
+    assert pregenerator.run_once()["generated"] == 0
+
+
+def test_dated_calendar_horizon_and_pruning(processor, store):
+    """Calendar files draft dated entries within the horizon only."""
+    entries = [
+        dict(CONTENT_CALENDAR[0], post_number=1, date="2026-03-02"),
+        dict(CONTENT_CALENDAR[1], post_number=2, date="2026-03-20"),
+        dict(CONTENT_CALENDAR[2], post_number=3),
+    ]
+    pregenerator = PreGenerator(processor, store, calendar=entries, horizon_days=7)
+    assert pregenerator.include_undated is False
+    assert [e["post_number"] for e in pregenerator.upcoming(date(2026, 3, 1))] == [1]
+
+    store.put(entries[0], {"post_number": 1, "passed": True}, "old")
+    assert store.get(entries[0]) is not None
+    assert store.get(entries[0], fingerprint="new") is None
+    assert store.needs_draft(entries[0], "new", retry_failed_after=3600)
+
+    stats = pregenerator.run_once(date(2026, 3, 3))
+    assert stats["upcoming"] == 0
+    assert stats["pruned"] == 1
+    assert store.get(entries[0]) is None